@@ -0,0 +1,51 @@
+"""
+Encode and decode throughput of each installed JSON codec on a single event and on
+a listing page, starting from and ending at bytes as the client does.
+
+Run from the repository root:
+    python -m benchmarks.bench_codec [--rows 1000] [--repeat 7]
+"""
+import argparse
+import time
+from datetime import datetime
+from typing import Any, Callable
+
+from mustapi.codec import CODECS
+from benchmarks.stub_server import EVENT
+
+
+def _best_us(call: Callable[[], Any], repeat: int, number: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            call()
+        best = min(best, time.perf_counter() - started)
+    return best / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args()
+
+    payload = {'title': 'Benchmark Event', 'location': 'Nairobi', 'start_time': datetime(2024, 1, 15, 10)}
+    page = {'events': [dict(EVENT, id=str(index)) for index in range(args.rows)], 'count': args.rows}
+    print(f'{"codec":<8} {"encode event":>14} {"decode event":>14} {"decode page":>14}   (us; page = {args.rows} rows)')
+    for name, codec_class in CODECS.items():
+        try:
+            codec = codec_class()
+        except ImportError:
+            print(f'{name:<8} not installed')
+            continue
+        event_body = codec.dumps(EVENT)
+        page_body = codec.dumps(page)
+        encode = _best_us(lambda: codec.dumps(payload), args.repeat, 2000)
+        decode = _best_us(lambda: codec.loads(event_body), args.repeat, 2000)
+        decode_page = _best_us(lambda: codec.loads(page_body), args.repeat, 20)
+        print(f'{name:<8} {encode:14.2f} {decode:14.2f} {decode_page:14.1f}')
+
+
+if __name__ == '__main__':
+    main()
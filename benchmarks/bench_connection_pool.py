@@ -0,0 +1,46 @@
+"""
+Compare requests/sec with a fresh connection per call against the pooled session.
+
+Run from the repository root:
+    python -m benchmarks.bench_connection_pool [--requests 2000] [--threads 8]
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from mustapi.client import MustAPIClient
+from benchmarks.stub_server import API_KEY, StubServer
+
+
+def _run(call, total: int, threads: int) -> float:
+    """Issue ``total`` calls across ``threads`` workers and return requests/sec."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(call, range(total)))
+    return total / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--threads', type=int, default=8)
+    args = parser.parse_args()
+
+    with StubServer() as server:
+        def unpooled(index: int):
+            requests.request('GET', f'{server.url}/events/{index}', timeout=30).json()
+
+        # Distinct ids so concurrent GETs are not coalesced into one request
+        with MustAPIClient(API_KEY, base_url=server.url, pool_maxsize=args.threads) as client:
+            before = _run(unpooled, args.requests, args.threads)
+            after = _run(lambda index: client.events.get_event(str(index)), args.requests, args.threads)
+
+    print(f'unpooled (requests.request): {before:10.1f} req/s')
+    print(f'pooled   (MustAPIClient):    {after:10.1f} req/s')
+    print(f'speedup:                     {after / before:10.2f}x')
+
+
+if __name__ == '__main__':
+    main()
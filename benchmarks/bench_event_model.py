@@ -0,0 +1,111 @@
+"""
+Memory and decode cost of ``Event`` in eager and lazy timestamp mode, and of the
+columnar ``EventBatch``.
+
+Bytes per event are what ``tracemalloc`` still sees allocated after decoding a JSON
+page of ``--rows`` events and dropping the parsed dicts, so the raw timestamp strings
+a lazy event keeps alive are counted. A plain, unslotted dataclass with eager parsing
+is included as the reference point.
+
+Run from the repository root:
+    python -m benchmarks.bench_event_model [--rows 100000] [--repeat 5]
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from mustapi.models.batch import EventBatch
+from mustapi.models.event import Event
+from benchmarks.stub_server import EVENT
+
+
+@dataclass
+class _DictEvent:
+    """The unslotted Event layout, for comparison."""
+    id: str
+    title: str
+    description: Optional[str] = None
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    location: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+def _dict_event(data: Dict[str, Any]) -> _DictEvent:
+    return _DictEvent(
+        id=data.get('id', ''),
+        title=data.get('title', ''),
+        description=data.get('description'),
+        start_time=datetime.fromisoformat(data['start_time']) if data.get('start_time') else None,
+        end_time=datetime.fromisoformat(data['end_time']) if data.get('end_time') else None,
+        location=data.get('location'),
+        created_at=datetime.fromisoformat(data['created_at']) if data.get('created_at') else None
+    )
+
+
+def _payload(count: int) -> bytes:
+    return json.dumps([dict(EVENT, id=str(index)) for index in range(count)]).encode()
+
+
+def _bytes_per_event(decode_page: Callable[[List[Dict[str, Any]]], Any], count: int) -> float:
+    payload = _payload(count)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        rows = json.loads(payload)
+        events = decode_page(rows)
+        # Only what the events keep alive should count
+        del rows
+        gc.collect()
+        current = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del events
+    return current / count
+
+
+def _events_per_sec(decode_page: Callable[[List[Dict[str, Any]]], Any], count: int, repeat: int) -> float:
+    rows = json.loads(_payload(count))
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decode_page(rows)
+        best = min(best, time.perf_counter() - started)
+    return count / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    def lazy_then_read(data: Dict[str, Any]) -> Event:
+        event = Event.from_dict(data, lazy=True)
+        event.start_time, event.end_time, event.created_at
+        return event
+
+    def per_row(decode: Callable[[Dict[str, Any]], Any]) -> Callable[[List[Dict[str, Any]]], Any]:
+        return lambda rows: [decode(row) for row in rows]
+
+    modes = [
+        ('unslotted dataclass', per_row(_dict_event)),
+        ('slotted, eager', per_row(Event.from_dict)),
+        ('slotted, lazy', per_row(lambda data: Event.from_dict(data, lazy=True))),
+        ('slotted, lazy + read', per_row(lazy_then_read)),
+        ('EventBatch', EventBatch.from_dicts)
+    ]
+    print(f'{"mode":<22} {"bytes/event":>12} {"events/sec":>12}')
+    for name, decode_page in modes:
+        size = _bytes_per_event(decode_page, args.rows)
+        rate = _events_per_sec(decode_page, args.rows, args.repeat)
+        print(f'{name:<22} {size:12.0f} {rate:12,.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Decode one page of events with ``Event.from_dicts`` versus the per-row
+``[Event.from_dict(row) for row in rows]`` comprehension ``list_events`` used before.
+
+Pages are built with unique timestamps and with timestamps shared between rows (a few
+start times, one ``created_at`` batch). The "from bytes" rows include ``json.loads``.
+
+Run from the repository root:
+    python -m benchmarks.bench_from_dicts [--rows 10000] [--repeat 7]
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from mustapi.models.event import Event
+
+_START = datetime(2024, 1, 1)
+
+
+def _page(rows: int, shared: bool) -> List[Dict[str, Any]]:
+    def stamp(seconds: int) -> str:
+        return (_START + timedelta(seconds=seconds)).isoformat() + 'Z'
+
+    return [
+        {
+            'id': str(index),
+            'title': f'Event {index}',
+            'description': 'Served by the benchmark',
+            'start_time': stamp(index % 48 * 3600 if shared else index * 60),
+            'end_time': stamp(index % 48 * 3600 + 7200 if shared else index * 60 + 7200),
+            'location': ('Nairobi', 'Mombasa', 'Kisumu')[index % 3],
+            'created_at': stamp(0 if shared else index)
+        }
+        for index in range(rows)
+    ]
+
+
+def _best_ms(decode: Callable[[Any], Any], data: Any, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decode(data)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args()
+
+    cases = [
+        ('from_dict comprehension', False, lambda rows: [Event.from_dict(row) for row in rows]),
+        ('from_dicts', False, Event.from_dicts),
+        ('from_dicts, lazy', False, lambda rows: Event.from_dicts(rows, lazy=True)),
+        ('from_dicts, as_batch', False, lambda rows: Event.from_dicts(rows, as_batch=True)),
+        ('from bytes, comprehension', True, lambda body: [Event.from_dict(row) for row in json.loads(body)]),
+        ('from bytes, from_dicts', True, Event.from_dicts)
+    ]
+    for shared in (False, True):
+        rows = _page(args.rows, shared)
+        body = json.dumps(rows).encode()
+        print(f'{args.rows} rows, {"shared" if shared else "unique"} timestamps')
+        reference = None
+        for name, from_bytes, decode in cases:
+            elapsed = _best_ms(decode, body if from_bytes else rows, args.repeat)
+            if reference is None or name.startswith('from bytes, comp'):
+                reference = elapsed
+            print(f'  {name:<28} {elapsed:8.2f} ms  {reference / elapsed:5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Measure the per-call cost of the middleware pipeline.
+
+Requests are answered by an in-process transport adapter, so the numbers are the
+client's own overhead without any network noise. ``_perform`` (the request path
+without the middleware dispatch) is the baseline an empty chain is compared against.
+
+Run from the repository root:
+    python -m benchmarks.bench_middleware [--calls 5000] [--repeat 5]
+"""
+import argparse
+import json
+import time
+
+import requests
+from requests.adapters import BaseAdapter
+
+from mustapi.client import MustAPIClient
+from mustapi.middleware import Middleware
+from benchmarks.stub_server import API_KEY, EVENT
+
+VALIDATION = {'is_active': True, 'developer_id': 'bench-dev', 'application_name': 'bench-app'}
+
+
+class _CannedAdapter(BaseAdapter):
+    """Transport adapter answering every request with a canned JSON body."""
+    def send(self, request, **kwargs):
+        body = VALIDATION if '/devs/' in request.url else EVENT
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.headers['Content-Type'] = 'application/json'
+        response._content = json.dumps(body).encode()
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def _per_call(call, calls: int, repeat: int) -> float:
+    """Best-of-``repeat`` microseconds per call."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            call()
+        best = min(best, time.perf_counter() - start)
+    return best / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--calls', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    session = requests.Session()
+    # Skip proxy / netrc lookups from the environment, which dominate an offline call
+    session.trust_env = False
+    session.mount('http://', _CannedAdapter())
+    client = MustAPIClient(API_KEY, base_url='http://bench.invalid', session=session)
+
+    baseline = _per_call(lambda: client._perform('GET', 'events/1', None, None), args.calls, args.repeat)
+    empty = _per_call(lambda: client.get('events/1'), args.calls, args.repeat)
+    client.middleware.add(Middleware())
+    one = _per_call(lambda: client.get('events/1'), args.calls, args.repeat)
+    for _ in range(4):
+        client.middleware.add(Middleware())
+    five = _per_call(lambda: client.get('events/1'), args.calls, args.repeat)
+
+    print(f'no middleware dispatch (_perform): {baseline:8.2f} us/call')
+    print(f'empty chain:                       {empty:8.2f} us/call ({empty - baseline:+.2f} us)')
+    print(f'1 no-op middleware:                {one:8.2f} us/call ({one - baseline:+.2f} us)')
+    print(f'5 no-op middleware:                {five:8.2f} us/call ({five - baseline:+.2f} us)')
+
+
+if __name__ == '__main__':
+    main()
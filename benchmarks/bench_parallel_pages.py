@@ -0,0 +1,56 @@
+"""
+Compare a sequential page walk with concurrent page fetching for a full export.
+
+The stub server adds a fixed latency to every request, so the sequential walk is
+latency-bound and the speedup comes from overlapping page requests.
+
+Run from the repository root:
+    python -m benchmarks.bench_parallel_pages [--events 5000] [--page-size 100] [--latency 0.02]
+"""
+import argparse
+import time
+
+from mustapi.client import MustAPIClient
+from benchmarks.stub_server import API_KEY, StubServer
+
+
+def _export(iterator) -> float:
+    """Drain ``iterator`` and return the elapsed seconds."""
+    start = time.perf_counter()
+    for _ in iterator:
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--events', type=int, default=5000)
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    with StubServer(latency=args.latency, total_events=args.events) as server:
+        with MustAPIClient(API_KEY, base_url=server.url, pool_maxsize=args.workers) as client:
+            events = client.events
+            sequential = _export(events.iter_events(page_size=args.page_size, prefetch=False))
+            prefetched = _export(events.iter_events(page_size=args.page_size))
+            parallel = _export(events.iter_events_parallel(
+                page_size=args.page_size, max_workers=args.workers
+            ))
+            unordered = _export(events.iter_events_parallel(
+                page_size=args.page_size, max_workers=args.workers, ordered=False
+            ))
+
+    print(f'{args.events} events, page size {args.page_size}, {args.latency * 1000:.0f} ms latency')
+    for name, elapsed in (
+        ('sequential', sequential),
+        ('prefetch', prefetched),
+        ('parallel (ordered)', parallel),
+        ('parallel (unordered)', unordered),
+    ):
+        print(f'{name:22} {elapsed:8.3f}s  {sequential / elapsed:6.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Compare ``parse_timestamp`` and a memoizing ``TimestampCache`` with plain
+``datetime.fromisoformat`` (the decoder ``Event.from_dict`` used before) on the
+timestamp shapes the API sends.
+
+Each case decodes ``--values`` strings; "repeated" cases draw them from a small set of
+distinct values, as when many events share start times or a ``created_at`` batch.
+``fromisoformat`` cannot decode ``Z`` before Python 3.11, shown as n/a.
+
+Run from the repository root:
+    python -m benchmarks.bench_timestamps [--values 100000] [--repeat 5]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from mustapi.models.timestamps import TimestampCache, parse_timestamp
+
+_START = datetime(2024, 1, 1)
+
+
+def _values(count: int, distinct: int, suffix: str) -> List[str]:
+    return [
+        (_START + timedelta(seconds=index % distinct * 37)).isoformat() + suffix
+        for index in range(count)
+    ]
+
+
+def _rate(make: Callable[[], Callable[[str], datetime]], values: List[str], repeat: int) -> Optional[float]:
+    """Best-of-``repeat`` values per second, None if the decoder rejects the values."""
+    best = float('inf')
+    for _ in range(repeat):
+        # A fresh decoder per run, so memoization only helps within a run
+        decode = make()
+        started = time.perf_counter()
+        try:
+            for value in values:
+                decode(value)
+        except ValueError:
+            return None
+        best = min(best, time.perf_counter() - started)
+    return len(values) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--values', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    cases = [
+        ('unique, naive', _values(args.values, args.values, '')),
+        ('unique, Z', _values(args.values, args.values, 'Z')),
+        ('unique, +02:00', _values(args.values, args.values, '+02:00')),
+        ('repeated (64), naive', _values(args.values, 64, '')),
+        ('repeated (64), Z', _values(args.values, 64, 'Z'))
+    ]
+    decoders = [
+        ('fromisoformat', lambda: datetime.fromisoformat),
+        ('parse_timestamp', lambda: parse_timestamp),
+        ('TimestampCache', lambda: TimestampCache().parse)
+    ]
+    print(f'{"case (values/sec)":<22}' + ''.join(f'{name:>18}' for name, _ in decoders))
+    for case, values in cases:
+        rates = [_rate(make, values, args.repeat) for _, make in decoders]
+        print(f'{case:<22}' + ''.join(
+            f'{"n/a":>18}' if rate is None else f'{rate:18,.0f}' for rate in rates
+        ))
+
+
+if __name__ == '__main__':
+    main()
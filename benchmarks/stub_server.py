@@ -0,0 +1,217 @@
+"""
+Minimal in-process stand-in for the MustAPI backend used by the benchmarks.
+
+It answers the API key validation endpoint (``devs/{prefix}/``) and the
+``events`` endpoints with canned JSON over HTTP/1.1, so keep-alive behaviour
+matches a real deployment. Latency, event payload size and an error rate for the
+``events`` endpoints are configurable.
+"""
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+API_KEY = 'benchkey-0000000000000000'
+
+EVENT = {
+    'id': '1',
+    'title': 'Benchmark Event',
+    'description': 'Served by the benchmark stub server',
+    'start_time': '2024-01-15T10:00:00',
+    'end_time': '2024-01-15T12:00:00',
+    'location': 'Nairobi',
+    'created_at': '2024-01-01T09:00:00'
+}
+
+_EVENT_PATH = re.compile(r'^/events/(?P<event_id>[^/?]+)/?$')
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _event(self, event_id: str, **fields: Any) -> Dict[str, Any]:
+        event = dict(self.server.event, id=event_id)
+        event.update(fields)
+        return event
+
+    def _fail(self) -> bool:
+        """Answer with a 503 instead, at the configured error rate."""
+        if not self.server.error_rate or self.server.random() >= self.server.error_rate:
+            return False
+        self.send_response(503)
+        self.send_header('Retry-After', '0')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+        return True
+
+    def _send_json(self, status: int, payload: Optional[Dict[str, Any]]) -> None:
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length)) if length else {}
+
+    def _list_events(self, query: Dict[str, list]) -> None:
+        total = self.server.total_events
+        limit = int(query.get('limit', ['100'])[0])
+        offset = int(query.get('offset', ['0'])[0])
+        if self.server.id_filter and 'id__in' in query:
+            ids = [event_id for event_id in query['id__in'][0].split(',') if event_id.isdigit()]
+            events = [
+                self._event(event_id) for event_id in ids
+                if int(event_id) < total and event_id not in self.server.deleted
+            ]
+        else:
+            deleted = self.server.deleted
+            alive = (str(index) for index in range(total) if str(index) not in deleted)
+            events = [self._event(event_id) for event_id in islice(alive, offset, offset + limit)]
+        total -= len(self.server.deleted)
+        body = json.dumps({'count': total, 'events': events}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('X-Total-Count', str(total))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def parse_request(self):
+        parsed = super().parse_request()
+        if parsed and self.server.latency:
+            time.sleep(self.server.latency)
+        return parsed
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path
+        if path.startswith('/devs/'):
+            self._send_json(200, {
+                'is_active': True,
+                'developer_id': 'bench-dev',
+                'application_name': 'bench-app'
+            })
+        elif self._fail():
+            return
+        elif path.rstrip('/') == '/events':
+            self._list_events(parse_qs(url.query))
+        elif _EVENT_PATH.match(path):
+            event_id = _EVENT_PATH.match(path).group('event_id')
+            if event_id.startswith('missing'):
+                self._send_json(404, {'detail': 'Not found'})
+            else:
+                self._send_json(200, self._event(event_id))
+        else:
+            self._send_json(404, {'detail': 'Not found'})
+
+    def do_POST(self):
+        path = urlsplit(self.path).path.rstrip('/')
+        payload = self._read_json()
+        if self._fail():
+            return
+        if path == '/events/batch':
+            if not self.server.batch_create:
+                self._send_json(404, {'detail': 'Not found'})
+                return
+            created = [
+                self._event(event_data.get('id', '1'), **event_data)
+                for event_data in payload.get('events', [])
+            ]
+            self._send_json(201, {'events': created})
+            return
+        self._send_json(201, self._event(payload.get('id', '1'), **payload))
+
+    def do_PUT(self):
+        match = _EVENT_PATH.match(self.path)
+        payload = self._read_json()
+        if self._fail():
+            return
+        if not match:
+            self._send_json(404, {'detail': 'Not found'})
+            return
+        self._send_json(200, self._event(match.group('event_id'), **payload))
+
+    def do_DELETE(self):
+        if self._fail():
+            return
+        match = _EVENT_PATH.match(self.path)
+        if match:
+            self.server.deleted.add(match.group('event_id'))
+        self._send_json(200, {'deleted': True})
+
+
+class StubServer:
+    """
+    Threaded HTTP server running in a background thread.
+
+    Args:
+        latency (float): Seconds added before answering each request
+        total_events (int): Size of the ``events`` listing
+        batch_create (bool): Serve ``POST events/batch``
+        id_filter (bool): Honour ``id__in`` on the listing
+        payload_size (int): Pad every event's description to at least this many characters
+        error_rate (float): Fraction of ``events`` requests answered with a 503
+            (``Retry-After: 0``)
+        seed (int): Seed for the error injection
+
+    Usage:
+        with StubServer() as server:
+            client = MustAPIClient(API_KEY, base_url=server.url)
+    """
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        latency: float = 0.0,
+        total_events: int = 10,
+        batch_create: bool = True,
+        id_filter: bool = True,
+        payload_size: int = 0,
+        error_rate: float = 0.0,
+        seed: int = 0
+    ):
+        self._server = ThreadingHTTPServer((host, port), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.latency = latency
+        self._server.total_events = total_events
+        self._server.batch_create = batch_create
+        self._server.id_filter = id_filter
+        self._server.deleted = set()
+        self._server.event = dict(
+            EVENT, description=EVENT['description'].ljust(payload_size, '.')
+        )
+        self._server.error_rate = error_rate
+        # random.Random.random is thread-safe
+        self._server.random = random.Random(seed).random
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'StubServer':
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
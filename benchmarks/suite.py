@@ -0,0 +1,225 @@
+"""
+Benchmark suite: throughput and tail latency of the main client operations against the
+in-process stub backend, plus client construction time and ``Event.from_dict`` decode
+rate. Results are written as JSON and compared against a stored baseline.
+
+Run from the repository root:
+    python -m benchmarks.suite [--output results.json] [--baseline benchmarks/baseline.json]
+    python -m benchmarks.suite --save-baseline      # record a new baseline
+
+Metrics ending in ``_per_sec`` are better when higher, those ending in ``_ms`` / ``_us``
+when lower (``max_ms`` is reported but not compared). A metric worse than the baseline
+by more than ``--tolerance`` is reported as a regression and makes the run exit with
+status 1.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from mustapi.client import MustAPIClient
+from mustapi.codec import get_codec
+from mustapi.exceptions import MustAPIError
+from mustapi.models.event import Event
+from benchmarks.stub_server import API_KEY, EVENT, StubServer
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def _percentile(samples: List[float], percentile: float) -> float:
+    """Nearest-rank percentile of sorted ``samples``."""
+    if not samples:
+        return 0.0
+    rank = max(int(round(percentile / 100 * len(samples))) - 1, 0)
+    return samples[min(rank, len(samples) - 1)]
+
+
+def _latency_summary(latencies: List[float], elapsed: float, errors: int) -> Dict[str, float]:
+    latencies.sort()
+    return {
+        'ops_per_sec': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': _percentile(latencies, 50) * 1000,
+        'p90_ms': _percentile(latencies, 90) * 1000,
+        'p99_ms': _percentile(latencies, 99) * 1000,
+        'max_ms': latencies[-1] * 1000 if latencies else 0.0,
+        'errors': errors
+    }
+
+
+def measure_calls(call: Callable[[int], Any], total: int, threads: int) -> Dict[str, float]:
+    """Run ``call(index)`` ``total`` times on ``threads`` workers, timing each call."""
+    latencies: List[float] = []
+    errors: List[int] = []
+
+    def timed(index: int) -> None:
+        started = time.perf_counter()
+        try:
+            call(index)
+        except MustAPIError:
+            errors.append(index)
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(timed, range(total)))
+    return _latency_summary(latencies, time.perf_counter() - started, len(errors))
+
+
+def bench_construction(url: str, repeat: int) -> Dict[str, float]:
+    """Create (and close) clients, including the API key validation round trip."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        client = MustAPIClient(API_KEY, base_url=url)
+        samples.append(time.perf_counter() - started)
+        client.close()
+    samples.sort()
+    return {
+        'p50_ms': _percentile(samples, 50) * 1000,
+        'p99_ms': _percentile(samples, 99) * 1000
+    }
+
+
+def bench_decode(rows: int, repeat: int) -> Dict[str, float]:
+    """``Event.from_dict`` rate over ``rows`` distinct dicts, best of ``repeat``."""
+    data = [dict(EVENT, id=str(index)) for index in range(rows)]
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for entry in data:
+            Event.from_dict(entry)
+        best = min(best, time.perf_counter() - started)
+    return {
+        'events_per_sec': rows / best,
+        'per_event_us': best / rows * 1e6
+    }
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    with StubServer(
+        latency=args.latency,
+        total_events=args.total_events,
+        payload_size=args.payload_size,
+        error_rate=args.error_rate
+    ) as server:
+        results['client_construction'] = bench_construction(server.url, args.construct)
+        with MustAPIClient(
+            API_KEY, base_url=server.url, pool_maxsize=args.threads, coalesce_gets=False
+        ) as client:
+            results['get_event'] = measure_calls(
+                lambda index: client.events.get_event(str(index % args.total_events)),
+                args.requests, args.threads
+            )
+            results['list_events'] = measure_calls(
+                lambda index: client.events.list_events(
+                    limit=args.page_size,
+                    offset=(index * args.page_size) % max(args.total_events - args.page_size, 1)
+                ),
+                max(args.requests // 10, 1), args.threads
+            )
+            results['create_event'] = measure_calls(
+                lambda index: client.events.create_event({
+                    'title': f'Event {index}',
+                    'start_time': EVENT['start_time']
+                }),
+                args.requests, args.threads
+            )
+    results['from_dict'] = bench_decode(args.decode_rows, 5)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'json_codec': get_codec().name,
+            'config': {
+                name: getattr(args, name) for name in (
+                    'requests', 'threads', 'latency', 'payload_size', 'error_rate',
+                    'page_size', 'total_events', 'construct', 'decode_rows'
+                )
+            }
+        },
+        'results': results
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Describe every metric that is worse than ``baseline`` by more than ``tolerance``."""
+    regressions = []
+    for name, metrics in results['results'].items():
+        for metric, value in metrics.items():
+            reference = baseline.get('results', {}).get(name, {}).get(metric)
+            # Single worst samples are too noisy to compare
+            if not reference or metric.startswith('max'):
+                continue
+            if metric.endswith('_per_sec'):
+                change = (reference - value) / reference
+            elif metric.endswith(('_ms', '_us')):
+                change = (value - reference) / reference
+            else:
+                continue
+            if change > tolerance:
+                regressions.append(
+                    f'{name}.{metric}: {value:.3f} vs baseline {reference:.3f} ({change:+.0%} worse)'
+                )
+    return regressions
+
+
+def _load(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path) as handle:
+        return json.load(handle)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--latency', type=float, default=0.0, help='server latency in seconds')
+    parser.add_argument('--payload-size', type=int, default=0, help='event description length')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of 503 answers')
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--total-events', type=int, default=1000)
+    parser.add_argument('--construct', type=int, default=50, help='clients to construct')
+    parser.add_argument('--decode-rows', type=int, default=10000)
+    parser.add_argument('--output', help='write results JSON here (default: stdout)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative slowdown')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the baseline')
+    args = parser.parse_args()
+
+    results = run(args)
+    rendered = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as handle:
+            handle.write(rendered + '\n')
+    else:
+        print(rendered)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as handle:
+            handle.write(rendered + '\n')
+        print(f'baseline saved to {args.baseline}', file=sys.stderr)
+        return
+
+    baseline = _load(args.baseline)
+    if baseline is None:
+        print(f'no baseline at {args.baseline}; run with --save-baseline to create one', file=sys.stderr)
+        return
+    if baseline['meta'].get('config') != results['meta']['config']:
+        print('warning: baseline was recorded with a different configuration', file=sys.stderr)
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f'REGRESSION {regression}', file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+    print('no regressions against baseline', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
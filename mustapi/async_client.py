@@ -0,0 +1,403 @@
+import asyncio
+import itertools
+import time
+from typing import Dict, Any, Iterable, Optional, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .client import BaseMustAPIClient
+from .exceptions import MustAPIError
+from .retry import RetryPolicy
+from .rate_limit import RateLimiter
+from .concurrency import AdaptiveConcurrencyLimiter
+from .circuit_breaker import CircuitBreakerRegistry
+from .coalescing import request_key
+from .cache import CachedResponse, HTTPCache
+from .codec import JSONCodec
+from .metrics import ClientMetrics
+from .endpoints import endpoint_template
+from .timing import trace_config
+from .tracing import Tracer
+from .middleware import Middleware, RequestContext
+from .services.async_events import AsyncEventService
+from .services.authentication_services import APIKeyManager
+from .services.event_cache import EventCache
+
+class AsyncMustAPIClient(BaseMustAPIClient):
+    """
+    asyncio client for interacting with the MustAPI backend.
+    
+    Requires the optional ``aiohttp`` dependency (``pip install mustapi[async]``).
+    
+    Args:
+        api_key (str): Your API authentication key
+        base_url (str, optional): Base URL for the API. Defaults to 'https://api.mustapi.com/v1'
+        timeout (int, optional): Request timeout. Defaults to 30 seconds
+        max_concurrency (int, optional): Maximum number of requests in flight at once.
+            Defaults to 100
+        pool_maxsize (int, optional): Maximum number of keep-alive connections kept
+            per host. Defaults to 10
+        pool_total (int, optional): Maximum number of connections across all hosts.
+            Defaults to 100
+        keepalive_timeout (float, optional): Seconds an idle connection is kept open.
+            Defaults to 15
+        session (aiohttp.ClientSession, optional): Existing session to send requests through.
+            A session passed in is not closed by :meth:`close`.
+        retry_policy (RetryPolicy, optional): Retry behaviour for failed requests.
+            Defaults to ``RetryPolicy()``, which retries idempotent requests up to 3 times
+        rate_limiter (RateLimiter, optional): Token bucket every request waits on before
+            being sent; may be shared with sync clients. Defaults to ``RateLimiter()``
+        concurrency_limiter (AdaptiveConcurrencyLimiter, optional): AIMD cap on requests in
+            flight, applied inside ``max_concurrency``. Defaults to None (no cap)
+        circuit_breakers (CircuitBreakerRegistry, optional): Per-endpoint circuit breakers;
+            may be shared with sync clients. Defaults to None (disabled)
+        coalesce_gets (bool, optional): Share one in-flight GET between concurrent
+            identical tasks. Defaults to True
+        http_cache (HTTPCache, optional): Cache for GET responses with ETag /
+            Last-Modified revalidation. Defaults to None (disabled)
+        event_cache (EventCache, optional): Cache of decoded events used by
+            ``client.events``. Defaults to None (disabled)
+        middleware (Iterable[Middleware], optional): Hooks run around every request,
+            outermost first; hooks may be coroutines. Defaults to None
+        metrics (ClientMetrics, optional): Where per-endpoint metrics are recorded.
+            Defaults to a new ClientMetrics
+        collect_metrics (bool, optional): Record request metrics. Defaults to True
+        trace_timing (bool, optional): Record where each request's time went, as
+            ``response.timing`` and in the metrics. Defaults to False
+        tracer (Tracer, optional): Records sampled span trees of requests.
+            Defaults to None (disabled)
+        slow_request_threshold (float, optional): Log HTTP attempts taking at least this
+            many seconds on the ``mustapi`` logger. Defaults to None (disabled)
+        json_codec (Union[str, JSONCodec], optional): ``orjson``, ``ujson``, ``json`` or a
+            :class:`JSONCodec` instance. Defaults to the fastest one installed
+
+    All services share a single :class:`aiohttp.ClientSession`, created on first use
+    inside the running loop. The API key is validated once through that session, on
+    entering ``async with`` or before the first request; ``await client.validate()``
+    checks it up front. Use ``async with`` or ``await client.close()`` to release the session.
+    """
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = 'https://api.mustapi.com/v1',
+        timeout: int = 30,
+        max_concurrency: int = 100,
+        pool_maxsize: int = 10,
+        pool_total: int = 100,
+        keepalive_timeout: float = 15,
+        session: Optional['aiohttp.ClientSession'] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        coalesce_gets: bool = True,
+        http_cache: Optional[HTTPCache] = None,
+        event_cache: Optional[EventCache] = None,
+        middleware: Optional[Iterable[Middleware]] = None,
+        metrics: Optional[ClientMetrics] = None,
+        collect_metrics: bool = True,
+        trace_timing: bool = False,
+        tracer: Optional[Tracer] = None,
+        slow_request_threshold: Optional[float] = None,
+        json_codec: Optional[Union[str, JSONCodec]] = None
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncMustAPIClient requires aiohttp. Install it with 'pip install mustapi[async]'"
+            )
+        super().__init__(
+            api_key, base_url, timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            circuit_breakers=circuit_breakers,
+            coalesce_gets=coalesce_gets,
+            http_cache=http_cache,
+            middleware=middleware,
+            metrics=metrics,
+            collect_metrics=collect_metrics,
+            trace_timing=trace_timing,
+            tracer=tracer,
+            slow_request_threshold=slow_request_threshold,
+            json_codec=json_codec,
+            validate=False
+        )
+
+        self.max_concurrency = max_concurrency
+        self._pool_maxsize = pool_maxsize
+        self._pool_total = pool_total
+        self._keepalive_timeout = keepalive_timeout
+        self._owns_session = session is None
+        self._session = session
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._validation_lock: Optional[asyncio.Lock] = None
+        
+        # Initialize service modules
+        self.events = AsyncEventService(self, cache=event_cache)
+    
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """Return the shared session, creating it in the running loop on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_total,
+                limit_per_host=self._pool_maxsize,
+                keepalive_timeout=self._keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=[trace_config()] if self.trace_timing else None
+            )
+            self._owns_session = True
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+    
+    async def close(self) -> None:
+        """Finish batched lookups in flight and release pooled connections held by the client."""
+        if self.events.loader is not None:
+            await self.events.loader.close()
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
+    
+    async def validate(self) -> None:
+        """
+        Validate the API key without blocking the event loop. Runs once; later calls
+        return immediately.
+        
+        Raises:
+            AuthenticationError: When the API key is not valid
+        """
+        if self._validated:
+            return
+        if self._validation_lock is None:
+            self._validation_lock = asyncio.Lock()
+        async with self._validation_lock:
+            if not self._validated:
+                self._apply_validation(await APIKeyManager.validate_api_key_async(
+                    self.api_key[:8], self.base_url, self._get_session()
+                ))
+    
+    async def __aenter__(self) -> 'AsyncMustAPIClient':
+        try:
+            await self.validate()
+        except BaseException:
+            await self.close()
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+    
+    @staticmethod
+    def _prepare_params(params: Optional[Dict]) -> Optional[Dict[str, Any]]:
+        """Drop ``None`` values and stringify booleans, matching how requests encodes params."""
+        if not params:
+            return None
+        return {
+            key: str(value) if isinstance(value, bool) else value
+            for key, value in params.items()
+            if value is not None
+        }
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Internal coroutine to make HTTP requests, retried according to ``retry_policy``.
+        
+        Args:
+            method (str): HTTP method (GET, POST, PUT, DELETE)
+            endpoint (str): API endpoint
+            data (dict, optional): Request payload
+            params (dict, optional): Query parameters
+        
+        Returns:
+            dict: Parsed JSON response, as an :class:`APIResponse` for JSON objects
+        
+        Raises:
+            MustAPIError: For general API errors
+            AuthenticationError: For authentication-related issues
+            ResourceNotFoundError: When requested resource is not found
+            RateLimitError: When the API rate limit is exceeded
+            CircuitOpenError: When the endpoint's circuit breaker is open
+        """
+        if not self._validated:
+            await self.validate()
+        if self.tracer is not None:
+            with self.tracer.span(f'{method} {endpoint_template(endpoint)}'):
+                return await self._dispatch(method, endpoint, data, params)
+        return await self._dispatch(method, endpoint, data, params)
+    
+    async def _dispatch(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict],
+        params: Optional[Dict]
+    ) -> Dict[str, Any]:
+        """Run the request through the middleware chain, if any is registered."""
+        if self.middleware:
+            return await self.middleware.run_async(
+                RequestContext(method, endpoint, params, data),
+                lambda request: self._perform(
+                    request.method, request.endpoint, request.data, request.params, request.headers
+                )
+            )
+        return await self._perform(method, endpoint, data, params)
+    
+    async def _perform(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict],
+        params: Optional[Dict],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Serve a request from the HTTP cache or send it, with retries and coalescing."""
+        url = self._build_url(endpoint)
+        cache_key = cached = None
+        if method == 'GET' and self.http_cache is not None:
+            cache_key = self.http_cache.key(url, params)
+            span = self.tracer.child('cache.lookup') if self.tracer is not None else None
+            cached, fresh = self.http_cache.lookup(cache_key)
+            if span is not None:
+                span.set_attributes({'cache.hit': cached is not None, 'cache.fresh': fresh})
+                span.end()
+            if fresh:
+                return self._decode(cached.body)
+        
+        def call():
+            attempts = itertools.count()
+            return self.retry_policy.call_async(
+                method,
+                lambda: self._send(
+                    method, url, endpoint, data, params, cache_key, cached, headers,
+                    retry=next(attempts) > 0
+                )
+            )
+        
+        # Calls with per-request headers may not be interchangeable, so never share them
+        if method == 'GET' and self.single_flight is not None and not headers:
+            return await self.single_flight.do_async(request_key(endpoint, params), call)
+        return await call()
+    
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        data: Optional[Dict],
+        params: Optional[Dict],
+        cache_key: Optional[str] = None,
+        cached: Optional[CachedResponse] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retry: bool = False
+    ) -> Dict[str, Any]:
+        """Perform a single HTTP attempt and decode its JSON body."""
+        session = self._get_session()
+        timing = self._new_timing(method, endpoint) if self.trace_timing else None
+        payload = self._encode_timed(method, endpoint, data, timing)
+        sent = len(payload) if payload else 0
+        
+        breaker = self._breaker_for(endpoint)
+        limiter = self.concurrency_limiter
+        try:
+            await self.rate_limiter.acquire_async()
+            await self._semaphore.acquire()
+            if limiter is not None:
+                try:
+                    await limiter.acquire_async()
+                except BaseException:
+                    self._semaphore.release()
+                    raise
+        except BaseException:
+            # Nothing was sent; free a half-open probe slot for the next caller
+            if breaker is not None:
+                breaker.release()
+            raise
+        try:
+            span = self.tracer.child('http.attempt', {'mustapi.retry': retry}) if self.tracer is not None else None
+            started = time.perf_counter()
+            status_code = None
+            body = b''
+            error = None
+            try:
+                async with session.request(
+                    method,
+                    url,
+                    headers=self._request_headers(cached, headers),
+                    data=payload,
+                    params=self._prepare_params(params),
+                    trace_request_ctx=timing
+                ) as response:
+                    if timing is not None:
+                        headers_at = time.perf_counter()
+                        timing.ttfb = max(headers_at - started - timing._setup(), 0.0)
+                    body = await response.read()
+                    if timing is not None:
+                        timing.download = time.perf_counter() - headers_at
+                        timing.total = time.perf_counter() - started
+                status_code = response.status
+                self.rate_limiter.update_from_headers(response.headers)
+                
+                # Raise exceptions for specific HTTP status codes, inside the attempt span
+                self._raise_for_status(status_code, endpoint, response.reason or '', response.headers)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = MustAPIError(f"Request failed: {str(e) or type(e).__name__}")
+                raise error from e
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                elapsed = time.perf_counter() - started
+                if limiter is not None:
+                    limiter.release(elapsed, status_code, failed=status_code is None)
+                if breaker is not None:
+                    breaker.record(status_code)
+                if self.metrics is not None:
+                    self.metrics.record(
+                        method, endpoint, status_code, elapsed,
+                        len(body), sent, retry, timing
+                    )
+                if span is not None:
+                    self._end_attempt_span(span, status_code, sent, len(body), timing, error)
+                if self.slow_request_threshold is not None and elapsed >= self.slow_request_threshold:
+                    self._log_slow(
+                        method, endpoint, params, elapsed, status_code, sent, len(body), timing, retry
+                    )
+        finally:
+            self._semaphore.release()
+        
+        if status_code == 304 and cached is not None:
+            cached = self.http_cache.revalidated(cache_key, cached, response.headers)
+            return self._decode_timed(
+                method, endpoint, cached.body, status_code, response.headers, timing
+            )
+        
+        self._cache_response(method, endpoint, cache_key, response.headers, body)
+        return self._decode_timed(method, endpoint, body, status_code, response.headers, timing)
+    
+    async def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Convenience coroutine for GET requests."""
+        return await self._request('GET', endpoint, params=params)
+    
+    async def post(self, endpoint: str, data: Dict) -> Dict[str, Any]:
+        """Convenience coroutine for POST requests."""
+        return await self._request('POST', endpoint, data=data)
+    
+    async def put(self, endpoint: str, data: Dict) -> Dict[str, Any]:
+        """Convenience coroutine for PUT requests."""
+        return await self._request('PUT', endpoint, data=data)
+    
+    async def delete(self, endpoint: str) -> Dict[str, Any]:
+        """Convenience coroutine for DELETE requests."""
+        return await self._request('DELETE', endpoint)
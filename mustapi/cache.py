@@ -0,0 +1,308 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+
+@dataclass
+class CachedResponse:
+    """
+    A stored GET response body and the validators needed to revalidate it.
+    
+    Attributes:
+        body (bytes): Raw response body
+        etag (Optional[str]): ``ETag`` header, sent back as ``If-None-Match``
+        last_modified (Optional[str]): ``Last-Modified`` header, sent back as ``If-Modified-Since``
+        expires_at (float): Unix time after which the entry must be revalidated
+    """
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    expires_at: float = 0.0
+    
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+    
+    @property
+    def size(self) -> int:
+        return len(self.body) + len(self.etag or '') + len(self.last_modified or '')
+
+
+class MemoryCacheBackend:
+    """
+    Thread-safe in-memory LRU store bounded by total body size.
+    
+    Args:
+        max_bytes (int, optional): Evict least recently used entries beyond this many
+            bytes. Defaults to 10 MiB
+    """
+    def __init__(self, max_bytes: int = 10 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def size(self) -> int:
+        """Bytes currently stored."""
+        return self._size
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+    
+    def set(self, key: str, entry: CachedResponse) -> None:
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+    
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._entries)
+    
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= entry.size
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class DiskCacheBackend:
+    """
+    On-disk store, one file per entry, safe to share between processes.
+    
+    Each file holds a JSON header line with the key and validators followed by the raw
+    body. Writes go through a temporary file and an atomic rename.
+    
+    Args:
+        directory (str): Directory to keep entries in; created if missing
+    
+    Keys include the base URL but not the API key, so use a separate directory per
+    key if responses differ between keys.
+    """
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode('utf-8')).hexdigest())
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        try:
+            with open(self._path(key), 'rb') as handle:
+                header = json.loads(handle.readline())
+                body = handle.read()
+        except (OSError, ValueError):
+            return None
+        return CachedResponse(
+            body=body,
+            etag=header.get('etag'),
+            last_modified=header.get('last_modified'),
+            expires_at=header.get('expires_at', 0.0)
+        )
+    
+    def set(self, key: str, entry: CachedResponse) -> None:
+        header = json.dumps({
+            'key': key,
+            'etag': entry.etag,
+            'last_modified': entry.last_modified,
+            'expires_at': entry.expires_at
+        }).encode('utf-8')
+        fd, temp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as handle:
+                handle.write(header + b'\n' + entry.body)
+            os.replace(temp_path, self._path(key))
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+    
+    def keys(self) -> List[str]:
+        keys = []
+        for name in os.listdir(self.directory):
+            try:
+                with open(os.path.join(self.directory, name), 'rb') as handle:
+                    key = json.loads(handle.readline()).get('key')
+            except (OSError, ValueError, AttributeError):
+                continue
+            if key is not None:
+                keys.append(key)
+        return keys
+    
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
+    
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+
+def _parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or '').split(','):
+        name, _, argument = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+class HTTPCache:
+    """
+    Private HTTP cache for GET responses, following RFC 9111 freshness rules.
+    
+    Responses are fresh for ``Cache-Control: max-age`` seconds (less any ``Age``).
+    Stale entries with an ``ETag`` or ``Last-Modified`` are revalidated with
+    ``If-None-Match`` / ``If-Modified-Since``, so an unchanged resource costs a 304
+    instead of a full body. ``no-store`` responses are never stored; ``no-cache`` ones
+    are always revalidated. A successful POST, PUT or DELETE invalidates every entry
+    of its collection, listings included: a PUT to ``events/1`` or a POST to
+    ``events/batch`` drops ``events/1`` and ``events?limit=...`` alike. Writes made by
+    other clients are only seen once entries go stale.
+    
+    Args:
+        backend (optional): :class:`MemoryCacheBackend` (the default) or
+            :class:`DiskCacheBackend`
+        default_ttl (float, optional): Freshness for responses without ``max-age``.
+            Defaults to 0 (always revalidate)
+    """
+    def __init__(self, backend=None, default_ttl: float = 0.0):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'revalidated': 0, 'stores': 0, 'invalidations': 0}
+    
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+    
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Cache key for a GET of ``url`` with ``params``, independent of param order."""
+        query = sorted((name, str(value)) for name, value in (params or {}).items() if value is not None)
+        return f"{url}?{urlencode(query)}" if query else url
+    
+    def lookup(self, key: str) -> Tuple[Optional[CachedResponse], bool]:
+        """
+        Find a stored response.
+        
+        Returns:
+            tuple: ``(entry, fresh)``; a stale entry is returned for revalidation
+        """
+        entry = self.backend.get(key)
+        if entry is not None and entry.fresh:
+            self._count('hits')
+            return entry, True
+        self._count('misses')
+        return entry, False
+    
+    @staticmethod
+    def conditional_headers(entry: Optional[CachedResponse]) -> Dict[str, str]:
+        """Validator headers to send when revalidating ``entry``."""
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return headers
+    
+    def _expires_at(self, headers: Mapping[str, str], directives: Dict[str, Optional[str]]) -> float:
+        if 'no-cache' in directives:
+            return 0.0
+        ttl = self.default_ttl
+        max_age = directives.get('max-age')
+        if max_age is not None:
+            try:
+                ttl = float(max_age)
+            except ValueError:
+                ttl = 0.0
+        try:
+            ttl -= float(headers.get('Age') or 0)
+        except ValueError:
+            pass
+        return time.time() + ttl if ttl > 0 else 0.0
+    
+    def store(self, key: str, headers: Mapping[str, str], body: bytes) -> None:
+        """Store a 200 response if its headers allow and it can ever be reused."""
+        directives = _parse_cache_control(headers.get('Cache-Control'))
+        if 'no-store' in directives:
+            return
+        entry = CachedResponse(
+            body=body,
+            etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified'),
+            expires_at=self._expires_at(headers, directives)
+        )
+        if not entry.fresh and entry.etag is None and entry.last_modified is None:
+            return
+        self.backend.set(key, entry)
+        self._count('stores')
+    
+    def revalidated(self, key: str, entry: CachedResponse, headers: Mapping[str, str]) -> CachedResponse:
+        """Refresh ``entry`` after a 304 response and return it."""
+        directives = _parse_cache_control(headers.get('Cache-Control'))
+        entry = CachedResponse(
+            body=entry.body,
+            etag=headers.get('ETag') or entry.etag,
+            last_modified=headers.get('Last-Modified') or entry.last_modified,
+            expires_at=self._expires_at(headers, directives)
+        )
+        self.backend.set(key, entry)
+        self._count('revalidated')
+        return entry
+    
+    def invalidate(self, url: str) -> None:
+        """
+        Drop every stored response for ``url`` or below it, with any query parameters:
+        ``invalidate('.../events')`` drops ``.../events?offset=0`` and ``.../events/1``.
+        """
+        url = url.rstrip('/')
+        for key in self.backend.keys():
+            if key == url or key.startswith((url + '/', url + '?')):
+                self.backend.delete(key)
+        self._count('invalidations')
+    
+    def clear(self) -> None:
+        self.backend.clear()
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache counters.
+        
+        Returns:
+            dict: ``hits`` served without a request, ``misses`` that went to the API,
+            ``revalidated`` 304 responses, ``stores`` and ``invalidations``
+        """
+        with self._lock:
+            return dict(self._counters)
@@ -0,0 +1,217 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+
+from .endpoints import endpoint_template
+from .exceptions import CircuitOpenError
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+StateChangeCallback = Callable[[str, str, str], None]
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker for a single endpoint.
+    
+    While closed, outcomes of the last ``window_size`` calls are tracked; once at least
+    ``minimum_calls`` are known and the failure rate reaches ``failure_rate_threshold``
+    the breaker opens. While open, calls fail immediately with
+    :class:`~mustapi.exceptions.CircuitOpenError`. After ``open_timeout`` seconds up to
+    ``half_open_max_calls`` probes are let through: ``success_threshold`` successes close
+    the breaker again, a single failure re-opens it.
+    
+    Args:
+        name (str): Endpoint the breaker guards, used in errors and callbacks
+        failure_rate_threshold (float, optional): Failure ratio that opens the breaker.
+            Defaults to 0.5
+        minimum_calls (int, optional): Calls needed before the rate is judged. Defaults to 10
+        window_size (int, optional): Number of recent calls the rate covers. Defaults to 20
+        open_timeout (float, optional): Seconds to stay open before probing. Defaults to 30
+        half_open_max_calls (int, optional): Concurrent probes allowed. Defaults to 1
+        success_threshold (int, optional): Probe successes needed to close. Defaults to 1
+        on_state_change (list, optional): Callbacks called as ``callback(name, old, new)``
+    
+    Transport failures and 5xx responses count as failures; any other response,
+    including 4xx errors, shows the endpoint is up and counts as a success.
+    """
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window_size: int = 20,
+        open_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        on_state_change: Optional[List[StateChangeCallback]] = None
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_timeout = open_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.on_state_change: List[StateChangeCallback] = list(on_state_change or [])
+        
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+    
+    @property
+    def state(self) -> str:
+        """Current state: ``'closed'``, ``'open'`` or ``'half_open'``."""
+        return self._state
+    
+    @property
+    def failure_rate(self) -> float:
+        """Failure ratio over the current window (0 when empty)."""
+        with self._lock:
+            return self._outcomes.count(False) / len(self._outcomes) if self._outcomes else 0.0
+    
+    def _transition_locked(self, new_state: str) -> Optional[str]:
+        """Switch state and return the old one, or None if nothing changed."""
+        old_state = self._state
+        if old_state == new_state:
+            return None
+        self._state = new_state
+        self._outcomes.clear()
+        self._probes = 0
+        self._probe_successes = 0
+        if new_state == OPEN:
+            self._opened_at = time.monotonic()
+        return old_state
+    
+    def _notify(self, old_state: Optional[str]) -> None:
+        if old_state is None:
+            return
+        new_state = self._state
+        for callback in self.on_state_change:
+            callback(self.name, old_state, new_state)
+    
+    def before_call(self) -> None:
+        """
+        Admit a call or fail fast.
+        
+        Raises:
+            CircuitOpenError: While open, or half-open with all probe slots taken
+        """
+        with self._lock:
+            changed = None
+            if self._state == OPEN:
+                retry_in = self._opened_at + self.open_timeout - time.monotonic()
+                if retry_in > 0:
+                    raise CircuitOpenError(
+                        f"Circuit open for endpoint {self.name}; retry in {retry_in:.1f}s",
+                        self.name, retry_in
+                    )
+                changed = self._transition_locked(HALF_OPEN)
+            if self._state == HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    raise CircuitOpenError(
+                        f"Circuit half-open for endpoint {self.name}; probe in progress",
+                        self.name, 0.0
+                    )
+                self._probes += 1
+        self._notify(changed)
+    
+    def record(self, status_code: Optional[int]) -> None:
+        """
+        Record the outcome of an admitted call.
+        
+        Args:
+            status_code (int, optional): HTTP status received, or None if the request
+                failed before a response arrived
+        """
+        success = status_code is not None and status_code < 500
+        with self._lock:
+            changed = None
+            if self._state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+                if not success:
+                    changed = self._transition_locked(OPEN)
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.success_threshold:
+                        changed = self._transition_locked(CLOSED)
+            elif self._state == CLOSED:
+                self._outcomes.append(success)
+                if len(self._outcomes) >= self.minimum_calls:
+                    failure_rate = self._outcomes.count(False) / len(self._outcomes)
+                    if failure_rate >= self.failure_rate_threshold:
+                        changed = self._transition_locked(OPEN)
+        self._notify(changed)
+    
+    def release(self) -> None:
+        """
+        Give back an admission that never produced an outcome, e.g. a call cancelled
+        while waiting for a rate limit or concurrency slot. A half-open probe slot is
+        freed for the next caller; nothing is recorded.
+        """
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+    
+    def reset(self) -> None:
+        """Force the breaker closed."""
+        with self._lock:
+            changed = self._transition_locked(CLOSED)
+        self._notify(changed)
+
+
+class CircuitBreakerRegistry:
+    """
+    Lazily created circuit breakers, one per endpoint template.
+    
+    ``events/1`` and ``events/2`` share the ``events/{id}`` breaker, while ``events``
+    has its own.
+    
+    Args:
+        on_state_change (callable, optional): Called as ``callback(endpoint, old, new)``
+            whenever any breaker changes state
+        key_func (callable, optional): Maps an endpoint to its breaker name.
+            Defaults to :func:`~mustapi.endpoints.endpoint_template`
+        **breaker_options: Passed to every :class:`CircuitBreaker`
+    """
+    def __init__(
+        self,
+        on_state_change: Optional[StateChangeCallback] = None,
+        key_func: Callable[[str], str] = endpoint_template,
+        **breaker_options
+    ):
+        self.key_func = key_func
+        self._callbacks: List[StateChangeCallback] = [on_state_change] if on_state_change else []
+        self._breaker_options = breaker_options
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+    
+    def add_listener(self, callback: StateChangeCallback) -> None:
+        """Register a state change callback for existing and future breakers."""
+        with self._lock:
+            self._callbacks.append(callback)
+            for breaker in self._breakers.values():
+                breaker.on_state_change.append(callback)
+    
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """Return the breaker guarding ``endpoint``, creating it on first use."""
+        name = self.key_func(endpoint)
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(name)
+                if breaker is None:
+                    breaker = CircuitBreaker(
+                        name, on_state_change=self._callbacks, **self._breaker_options
+                    )
+                    self._breakers[name] = breaker
+        return breaker
+    
+    @property
+    def states(self) -> Dict[str, str]:
+        """Current state of every breaker, keyed by endpoint template."""
+        return {name: breaker.state for name, breaker in list(self._breakers.items())}
@@ -1,53 +1,511 @@
+import functools
+import itertools
+import logging
+import time
 import requests
-from typing import Dict, Any, Optional
-from .exceptions import MustAPIError, AuthenticationError, ResourceNotFoundError
+from typing import Dict, Any, Iterable, Mapping, Optional, Union
+from .exceptions import MustAPIError, AuthenticationError, ResourceNotFoundError, RateLimitError
+from .retry import RetryPolicy
+from .rate_limit import RateLimiter
+from .concurrency import AdaptiveConcurrencyLimiter
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from .coalescing import SingleFlight, request_key
+from .endpoints import endpoint_collection, endpoint_template
+from .cache import CachedResponse, HTTPCache
+from .codec import JSONCodec, get_codec
+from .metrics import ClientMetrics
+from .middleware import Middleware, MiddlewareChain, RequestContext
+from .response import APIResponse
+from .timing import PHASES, RequestTiming, TimingHTTPAdapter, activate
+from .tracing import Span, Tracer
 from .services.events import EventService
+from .services.event_cache import EventCache
 from .services.authentication_services import APIKeyManager
 
-class MustAPIClient:
+logger = logging.getLogger('mustapi')
+
+class BaseMustAPIClient:
     """
-    Main client for interacting with the MustAPI backend.
+    Configuration, authentication and error mapping shared by the sync and async clients.
     
     Args:
         api_key (str): Your API authentication key
-        base_url (str, optional): Base URL for the API. Defaults to 'https://api.mustapi.com/v1'
-        timeout (int, optional): Request timeout. Defaults to 30 seconds
+        base_url (str): Base URL for the API
+        timeout (int): Request timeout in seconds
+        retry_policy (RetryPolicy, optional): Retry behaviour for failed requests.
+            Defaults to ``RetryPolicy()``
+        rate_limiter (RateLimiter, optional): Token bucket every request waits on.
+            Defaults to ``RateLimiter()``, which only paces once the server reports a limit
+        concurrency_limiter (AdaptiveConcurrencyLimiter, optional): AIMD cap on requests
+            in flight, fed with every response. Defaults to None (no cap)
+        circuit_breakers (CircuitBreakerRegistry, optional): Per-endpoint circuit breakers
+            that fail fast while an endpoint is down. Defaults to None (disabled)
+        coalesce_gets (bool, optional): Share one in-flight GET between concurrent
+            identical callers. Defaults to True
+        http_cache (HTTPCache, optional): Cache for GET responses with ETag /
+            Last-Modified revalidation. Defaults to None (disabled)
+        middleware (Iterable[Middleware], optional): Hooks run around every request,
+            outermost first. Defaults to None
+        metrics (ClientMetrics, optional): Where request metrics are recorded; pass one
+            instance to several clients to aggregate them. Defaults to a new ClientMetrics
+        collect_metrics (bool, optional): Record request metrics. Defaults to True
+        trace_timing (bool, optional): Break every request down into phases (see
+            :class:`RequestTiming`). Defaults to False
+        tracer (Tracer, optional): Records sampled span trees of requests.
+            Defaults to None (disabled)
+        slow_request_threshold (float, optional): Log HTTP attempts taking at least this
+            many seconds to the ``mustapi`` logger. Defaults to None (disabled)
+        json_codec (Union[str, JSONCodec], optional): JSON library for request and
+            response bodies: ``orjson``, ``ujson``, ``json`` or a :class:`JSONCodec`.
+            Defaults to the fastest one installed
+        validation_session (requests.Session, optional): Session used to validate the API key
+        validate (bool, optional): Validate the API key here, blocking. Clients that
+            validate later pass False and call :meth:`_apply_validation`. Defaults to True
     """
     def __init__(
-        self, 
-        api_key: str, 
-        base_url: str = 'https://api.mustapi.com/v1', 
-        timeout: int = 30
+        self,
+        api_key: str,
+        base_url: str,
+        timeout: int,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        coalesce_gets: bool = True,
+        http_cache: Optional[HTTPCache] = None,
+        middleware: Optional[Iterable[Middleware]] = None,
+        metrics: Optional[ClientMetrics] = None,
+        collect_metrics: bool = True,
+        trace_timing: bool = False,
+        tracer: Optional[Tracer] = None,
+        slow_request_threshold: Optional[float] = None,
+        json_codec: Optional[Union[str, JSONCodec]] = None,
+        validation_session: Optional[requests.Session] = None,
+        validate: bool = True
     ):
-        validation_result = APIKeyManager.validate_api_key(api_key)
-
-        if not validation_result['valid']:
-            raise AuthenticationError(
-                f"API key Validation failed: {validation_result.get('reason','unknown error')}"
-
-            )
-        
-        self.developer_id = validation_result.get('developer_id')
-        self.application_name = validation_result.get('application_name')
-
-
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
         self.timeout = timeout
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.concurrency_limiter = concurrency_limiter
+        self.circuit_breakers = circuit_breakers
+        self.single_flight = SingleFlight() if coalesce_gets else None
+        self.http_cache = http_cache
+        self.middleware = MiddlewareChain(middleware)
+        self.metrics: Optional[ClientMetrics] = None
+        if collect_metrics:
+            self.metrics = metrics if metrics is not None else ClientMetrics()
+        self.trace_timing = trace_timing
+        self.tracer = tracer
+        self.slow_request_threshold = slow_request_threshold
+        self.codec = get_codec(json_codec)
 
+        self.developer_id: Optional[str] = None
+        self.application_name: Optional[str] = None
+        self._validated = False
+        self._set_headers()
+        if validate:
+            self._apply_validation(APIKeyManager.validate_api_key(
+                api_key[:8], self.base_url, session=validation_session
+            ))
+    
+    def _apply_validation(self, validation_result: Dict[str, Any]) -> None:
+        """
+        Take the developer details from an API key validation result.
         
+        Raises:
+            AuthenticationError: When the key is not valid
+        """
+        if not validation_result['valid']:
+            raise AuthenticationError(
+                f"API key Validation failed: {validation_result.get('reason','unknown error')}"
+            )
         
-        self._headers = {
+        details = validation_result.get('details', {})
+        self.developer_id = details.get('developer_id')
+        self.application_name = details.get('application_name')
+        self._set_headers()
+        self._validated = True
+    
+    def _set_headers(self) -> None:
+        headers = {
             'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json',
             'Accept': 'application/json',
             'X-Developer-ID': self.developer_id,
             'X-Application-Name': self.application_name
         }
+        self._headers = {name: value for name, value in headers.items() if value is not None}
+    
+    def _breaker_for(self, endpoint: str) -> Optional[CircuitBreaker]:
+        """Admit a call through the endpoint's circuit breaker, if breakers are enabled."""
+        if self.circuit_breakers is None:
+            return None
+        breaker = self.circuit_breakers.get(endpoint)
+        breaker.before_call()
+        return breaker
+    
+    def _build_url(self, endpoint: str) -> str:
+        """Join an endpoint onto the base URL."""
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+    
+    def _encode(self, data: Optional[Dict]) -> Optional[bytes]:
+        """Encode a request payload as JSON, or None when there is no payload."""
+        if data is None:
+            return None
+        return self.codec.dumps(data)
+    
+    def _decode(
+        self,
+        body: bytes,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Decode a JSON response body; objects are returned as :class:`APIResponse`.
+        
+        Raises:
+            MustAPIError: When the body is not valid JSON
+        """
+        if not body:
+            return APIResponse({}, status_code, headers)
+        try:
+            decoded = self.codec.loads(body)
+        except ValueError as e:
+            raise MustAPIError(f"Invalid JSON in response: {str(e)}", status_code) from e
+        if isinstance(decoded, dict):
+            return APIResponse(decoded, status_code, headers)
+        return decoded
+    
+    def _record_codec(
+        self,
+        method: str,
+        endpoint: str,
+        phase: str,
+        seconds: float,
+        timing: Optional[RequestTiming]
+    ) -> None:
+        """Report ``encode`` / ``decode`` time, through ``timing`` when phases are traced."""
+        if timing is not None:
+            timing.record_phase(phase, seconds)
+        elif self.metrics is not None:
+            self.metrics.record_phase(method, endpoint, phase, seconds)
+    
+    def _encode_timed(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict],
+        timing: Optional[RequestTiming]
+    ) -> Optional[bytes]:
+        """:meth:`_encode`, reporting the time spent as the ``encode`` phase."""
+        if data is None:
+            return None
+        started = time.perf_counter()
+        body = self._encode(data)
+        self._record_codec(method, endpoint, 'encode', time.perf_counter() - started, timing)
+        return body
+    
+    def _new_timing(self, method: str, endpoint: str) -> RequestTiming:
+        """Timing for one attempt, forwarding decode and model time to the metrics."""
+        sink = None
+        if self.metrics is not None:
+            sink = functools.partial(self.metrics.record_phase, method, endpoint)
+        return RequestTiming(sink)
+    
+    def _decode_timed(
+        self,
+        method: str,
+        endpoint: str,
+        body: bytes,
+        status_code: Optional[int],
+        headers: Optional[Mapping[str, str]],
+        timing: Optional[RequestTiming]
+    ) -> Dict[str, Any]:
+        """
+        :meth:`_decode`, reporting the time spent as the ``decode`` phase and attaching
+        ``timing`` to the response.
+        """
+        if timing is None and self.metrics is None:
+            return self._decode(body, status_code, headers)
+        started = time.perf_counter()
+        decoded = self._decode(body, status_code, headers)
+        self._record_codec(method, endpoint, 'decode', time.perf_counter() - started, timing)
+        if timing is not None and isinstance(decoded, APIResponse):
+            decoded.timing = timing
+        return decoded
+    
+    @staticmethod
+    def _end_attempt_span(
+        span: Span,
+        status_code: Optional[int],
+        sent: int,
+        received: int,
+        timing: Optional[RequestTiming],
+        error: Optional[BaseException] = None
+    ) -> None:
+        """Annotate and finish the span of one HTTP attempt, recording ``error`` if it failed."""
+        span.set_attributes({
+            'http.response.status_code': status_code,
+            'http.request.body.size': sent,
+            'http.response.body.size': received
+        })
+        if timing is not None:
+            for phase in PHASES:
+                span.set_attribute(f'mustapi.timing.{phase}', getattr(timing, phase))
+        if error is not None:
+            span.record_exception(error)
+        if status_code is None or status_code >= 400:
+            span.set_status('ERROR', str(error) if error is not None else None)
+        span.end()
+    
+    def _log_slow(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict],
+        elapsed: float,
+        status_code: Optional[int],
+        sent: int,
+        received: int,
+        timing: Optional[RequestTiming],
+        retry: bool
+    ) -> None:
+        """Log an HTTP attempt that exceeded ``slow_request_threshold``."""
+        param_names = sorted(name for name, value in (params or {}).items() if value is not None)
+        phases = timing.as_dict() if timing is not None else {}
+        logger.warning(
+            'Slow request: %s %s took %.1fms (status %s, params [%s], sent %d B, '
+            'received %d B%s%s)',
+            method, endpoint, elapsed * 1000, status_code, ', '.join(param_names), sent, received,
+            ', retry' if retry else '',
+            ''.join(
+                f', {phase} {phases[phase] * 1000:.1f}ms'
+                for phase in PHASES if phases.get(phase) is not None
+            ),
+            extra={'mustapi': {
+                'method': method,
+                'endpoint': endpoint_template(endpoint),
+                'elapsed': elapsed,
+                'status_code': status_code,
+                'params': param_names,
+                'bytes_out': sent,
+                'bytes_in': received,
+                'retry': retry,
+                'timing': phases or None
+            }}
+        )
+    
+    def _request_headers(
+        self,
+        cached: Optional[CachedResponse],
+        extra: Optional[Mapping[str, str]] = None
+    ) -> Dict[str, str]:
+        """
+        Default headers, plus headers added by middleware and validators when
+        revalidating a cached response.
+        """
+        if cached is None and not extra:
+            return self._headers
+        headers = {**self._headers, **(extra or {})}
+        if cached is not None:
+            headers.update(HTTPCache.conditional_headers(cached))
+        return headers
+    
+    def _cache_response(
+        self,
+        method: str,
+        endpoint: str,
+        cache_key: Optional[str],
+        headers: Mapping[str, str],
+        body: bytes
+    ) -> None:
+        """Store a successful GET, or invalidate the endpoint's collection after a successful write."""
+        if self.http_cache is None:
+            return
+        if cache_key is not None:
+            self.http_cache.store(cache_key, headers, body)
+        elif method != 'GET':
+            self.http_cache.invalidate(self._build_url(endpoint_collection(endpoint)))
+    
+    def _raise_for_status(
+        self,
+        status_code: int,
+        endpoint: str,
+        reason: str = '',
+        headers: Optional[Mapping[str, str]] = None
+    ) -> None:
+        """
+        Map an HTTP error status onto the library's exception hierarchy.
         
+        Raises:
+            AuthenticationError: For 401 responses
+            ResourceNotFoundError: For 404 responses
+            RateLimitError: For 429 responses, with ``retry_after`` from the response headers
+            MustAPIError: For any other 4xx/5xx response
+        """
+        if status_code < 400:
+            return
+        retry_after = RetryPolicy.parse_retry_after((headers or {}).get('Retry-After'))
+        if status_code == 401:
+            raise AuthenticationError("Invalid API key or authentication failed", status_code)
+        elif status_code == 404:
+            raise ResourceNotFoundError(f"Endpoint {endpoint} not found", status_code)
+        elif status_code == 429:
+            raise RateLimitError(
+                f"Rate limit exceeded for endpoint {endpoint}", status_code, retry_after=retry_after
+            )
+        status = f"{status_code} {reason}".strip()
+        error = MustAPIError(f"Request failed: {status} for endpoint {endpoint}", status_code)
+        # 503 responses may also carry Retry-After; let the retry policy honour it
+        error.retry_after = retry_after
+        raise error
+
+
+class MustAPIClient(BaseMustAPIClient):
+    """
+    Main client for interacting with the MustAPI backend.
+    
+    Args:
+        api_key (str): Your API authentication key
+        base_url (str, optional): Base URL for the API. Defaults to 'https://api.mustapi.com/v1'
+        timeout (int, optional): Request timeout. Defaults to 30 seconds
+        pool_connections (int, optional): Number of per-host connection pools to cache.
+            Defaults to 10
+        pool_maxsize (int, optional): Maximum number of keep-alive connections kept
+            per host. Defaults to 10
+        pool_block (bool, optional): Block when a host's pool is exhausted instead of
+            opening a throwaway connection. Defaults to False
+        session (requests.Session, optional): Existing session to send requests through.
+            A session passed in is not closed by :meth:`close`.
+        retry_policy (RetryPolicy, optional): Retry behaviour for failed requests.
+            Defaults to ``RetryPolicy()``, which retries idempotent requests up to 3 times
+        rate_limiter (RateLimiter, optional): Token bucket every request waits on before
+            being sent. Defaults to ``RateLimiter()``, which adapts to the server's
+            ``X-RateLimit-*`` headers
+        concurrency_limiter (AdaptiveConcurrencyLimiter, optional): AIMD cap on requests in
+            flight across all threads using the client. Defaults to None (no cap)
+        circuit_breakers (CircuitBreakerRegistry, optional): Per-endpoint circuit breakers;
+            an open breaker raises CircuitOpenError without waiting on the network.
+            Defaults to None (disabled)
+        coalesce_gets (bool, optional): While a GET is in flight, identical GETs from
+            other threads wait for it and share its decoded (read-only) result instead of
+            hitting the API. ``client.single_flight.stats`` counts coalesced calls.
+            Defaults to True
+        http_cache (HTTPCache, optional): Cache for GET responses honouring
+            ``Cache-Control: max-age`` and revalidating with ``ETag`` / ``Last-Modified``.
+            Defaults to None (disabled)
+        event_cache (EventCache, optional): TTL + LRU cache of decoded events used by
+            ``client.events``; ``get_event`` serves from it and writes keep it current.
+            Defaults to None (disabled)
+        middleware (Iterable[Middleware], optional): Hooks run around every request,
+            outermost first; more can be added with ``client.middleware.add``.
+            Defaults to None
+        trace_timing (bool, optional): Record where each request's time went (pool wait,
+            DNS, connect, TLS, time to first byte, download, decode, model construction);
+            available as ``response.timing`` and in the metrics. Defaults to False
+        tracer (Tracer, optional): Records span trees (request, cache lookup, each retry
+            attempt, pagination) for one request in ``tracer.sample_every``.
+            Defaults to None (disabled)
+        slow_request_threshold (float, optional): Log HTTP attempts taking at least this
+            many seconds, with endpoint, parameter names, sizes and phase timings, as
+            warnings on the ``mustapi`` logger. Defaults to None (disabled)
+        metrics (ClientMetrics, optional): Where per-endpoint metrics are recorded;
+            ``client.metrics.snapshot()`` and ``client.metrics.render_prometheus()``
+            read them. Defaults to a new ClientMetrics
+        collect_metrics (bool, optional): Record request metrics. Defaults to True
+        json_codec (Union[str, JSONCodec], optional): ``orjson``, ``ujson``, ``json`` or a
+            :class:`JSONCodec` instance. Defaults to orjson or ujson when installed,
+            else the standard library
+
+    The client owns a single :class:`requests.Session`, so every service attached to
+    it reuses the same keep-alive connections. Use it as a context manager, or call
+    :meth:`close`, to release them.
+    """
+    def __init__(
+        self, 
+        api_key: str, 
+        base_url: str = 'https://api.mustapi.com/v1', 
+        timeout: int = 30,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        session: Optional[requests.Session] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        coalesce_gets: bool = True,
+        http_cache: Optional[HTTPCache] = None,
+        event_cache: Optional[EventCache] = None,
+        middleware: Optional[Iterable[Middleware]] = None,
+        metrics: Optional[ClientMetrics] = None,
+        collect_metrics: bool = True,
+        trace_timing: bool = False,
+        tracer: Optional[Tracer] = None,
+        slow_request_threshold: Optional[float] = None,
+        json_codec: Optional[Union[str, JSONCodec]] = None
+    ):
+        self._owns_session = session is None
+        self._session = session if session is not None else self._build_session(
+            pool_connections, pool_maxsize, pool_block
+        )
+
+        try:
+            super().__init__(
+                api_key, base_url, timeout,
+                retry_policy=retry_policy,
+                rate_limiter=rate_limiter,
+                concurrency_limiter=concurrency_limiter,
+                circuit_breakers=circuit_breakers,
+                coalesce_gets=coalesce_gets,
+                http_cache=http_cache,
+                middleware=middleware,
+                metrics=metrics,
+                collect_metrics=collect_metrics,
+                trace_timing=trace_timing,
+                tracer=tracer,
+                slow_request_threshold=slow_request_threshold,
+                json_codec=json_codec,
+                validation_session=self._session
+            )
+        except AuthenticationError:
+            self.close()
+            raise
         
         # Initialize service modules
-        self.events = EventService(self)
+        self.events = EventService(self, cache=event_cache)
+    
+    @staticmethod
+    def _build_session(
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool
+    ) -> requests.Session:
+        """Create a keep-alive session with a bounded per-host connection pool."""
+        session = requests.Session()
+        # Behaves like HTTPAdapter unless phase timing is active for the request
+        adapter = TimingHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers['Connection'] = 'keep-alive'
+        return session
+    
+    def close(self) -> None:
+        """Release pooled connections held by the client."""
+        if self._owns_session:
+            self._session.close()
+    
+    def __enter__(self) -> 'MustAPIClient':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def _request(
         self, 
@@ -57,7 +515,7 @@ class MustAPIClient:
         params: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """
-        Internal method to make HTTP requests.
+        Internal method to make HTTP requests, retried according to ``retry_policy``.
         
         Args:
             method (str): HTTP method (GET, POST, PUT, DELETE)
@@ -66,36 +524,169 @@ class MustAPIClient:
             params (dict, optional): Query parameters
         
         Returns:
-            dict: Parsed JSON response
+            dict: Parsed JSON response, as an :class:`APIResponse` for JSON objects
         
         Raises:
             MustAPIError: For general API errors
             AuthenticationError: For authentication-related issues
             ResourceNotFoundError: When requested resource is not found
+            RateLimitError: When the API rate limit is exceeded
+            CircuitOpenError: When the endpoint's circuit breaker is open
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        if self.tracer is not None:
+            with self.tracer.span(f'{method} {endpoint_template(endpoint)}'):
+                return self._dispatch(method, endpoint, data, params)
+        return self._dispatch(method, endpoint, data, params)
+    
+    def _dispatch(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict],
+        params: Optional[Dict]
+    ) -> Dict[str, Any]:
+        """Run the request through the middleware chain, if any is registered."""
+        if self.middleware:
+            return self.middleware.run(
+                RequestContext(method, endpoint, params, data),
+                lambda request: self._perform(
+                    request.method, request.endpoint, request.data, request.params, request.headers
+                )
+            )
+        return self._perform(method, endpoint, data, params)
+    
+    def _perform(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict],
+        params: Optional[Dict],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Serve a request from the HTTP cache or send it, with retries and coalescing."""
+        url = self._build_url(endpoint)
+        cache_key = cached = None
+        if method == 'GET' and self.http_cache is not None:
+            cache_key = self.http_cache.key(url, params)
+            span = self.tracer.child('cache.lookup') if self.tracer is not None else None
+            cached, fresh = self.http_cache.lookup(cache_key)
+            if span is not None:
+                span.set_attributes({'cache.hit': cached is not None, 'cache.fresh': fresh})
+                span.end()
+            if fresh:
+                return self._decode(cached.body)
+        
+        def call() -> Dict[str, Any]:
+            attempts = itertools.count()
+            return self.retry_policy.call(
+                method,
+                lambda: self._send(
+                    method, url, endpoint, data, params, cache_key, cached, headers,
+                    retry=next(attempts) > 0
+                )
+            )
         
+        # Calls with per-request headers may not be interchangeable, so never share them
+        if method == 'GET' and self.single_flight is not None and not headers:
+            return self.single_flight.do(request_key(endpoint, params), call)
+        return call()
+    
+    def _send(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        data: Optional[Dict],
+        params: Optional[Dict],
+        cache_key: Optional[str] = None,
+        cached: Optional[CachedResponse] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retry: bool = False
+    ) -> Dict[str, Any]:
+        """Perform a single HTTP attempt and decode its JSON body."""
+        timing = self._new_timing(method, endpoint) if self.trace_timing else None
+        body = self._encode_timed(method, endpoint, data, timing)
+        sent = len(body) if body else 0
+        breaker = self._breaker_for(endpoint)
+        limiter = self.concurrency_limiter
         try:
-            response = requests.request(
+            self.rate_limiter.acquire()
+            if limiter is not None:
+                limiter.acquire()
+        except BaseException:
+            # Nothing was sent; free a half-open probe slot for the next caller
+            if breaker is not None:
+                breaker.release()
+            raise
+        span = self.tracer.child('http.attempt', {'mustapi.retry': retry}) if self.tracer is not None else None
+        started = time.perf_counter()
+        status_code = None
+        received = 0
+        error = None
+        try:
+            if timing is not None:
+                activate(timing)
+            response = self._session.request(
                 method=method,
                 url=url,
-                headers=self._headers,
-                json=data,
+                headers=self._request_headers(cached, headers),
+                data=body,
                 params=params,
-                timeout=self.timeout
+                timeout=self.timeout,
+                # Return after the headers so download time can be told apart
+                stream=timing is not None
             )
+            status_code = response.status_code
+            if timing is not None:
+                headers_at = time.perf_counter()
+                timing.ttfb = max(headers_at - started - timing._setup(), 0.0)
+                received = len(response.content)
+                timing.download = time.perf_counter() - headers_at
+                timing.total = time.perf_counter() - started
+            else:
+                received = len(response.content)
+            self.rate_limiter.update_from_headers(response.headers)
             
-            # Raise exceptions for specific HTTP status codes
-            if response.status_code == 401:
-                raise AuthenticationError("Invalid API key or authentication failed")
-            elif response.status_code == 404:
-                raise ResourceNotFoundError(f"Endpoint {endpoint} not found")
+            if status_code == 304 and cached is not None:
+                cached = self.http_cache.revalidated(cache_key, cached, response.headers)
+                return self._decode_timed(
+                    method, endpoint, cached.body, status_code, response.headers, timing
+                )
             
-            response.raise_for_status()
-            return response.json() if response.content else {}
+            # Raise exceptions for specific HTTP status codes
+            self._raise_for_status(
+                response.status_code, endpoint, response.reason, response.headers
+            )
+            self._cache_response(method, endpoint, cache_key, response.headers, response.content)
+            return self._decode_timed(
+                method, endpoint, response.content, status_code, response.headers, timing
+            )
         
         except requests.exceptions.RequestException as e:
-            raise MustAPIError(f"Request failed: {str(e)}")
+            error = MustAPIError(f"Request failed: {str(e)}")
+            raise error from e
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            if timing is not None:
+                activate(None)
+            if limiter is not None:
+                limiter.release(elapsed, status_code, failed=status_code is None)
+            if breaker is not None:
+                breaker.record(status_code)
+            if self.metrics is not None:
+                self.metrics.record(
+                    method, endpoint, status_code, elapsed,
+                    received, sent, retry, timing
+                )
+            if span is not None:
+                self._end_attempt_span(span, status_code, sent, received, timing, error)
+            if self.slow_request_threshold is not None and elapsed >= self.slow_request_threshold:
+                self._log_slow(
+                    method, endpoint, params, elapsed, status_code, sent, received, timing, retry
+                )
     
     def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Convenience method for GET requests."""
@@ -111,4 +702,4 @@ class MustAPIClient:
     
     def delete(self, endpoint: str) -> Dict[str, Any]:
         """Convenience method for DELETE requests."""
-        return self._request('DELETE', endpoint)
\ No newline at end of file
+        return self._request('DELETE', endpoint)
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+def request_key(endpoint: str, params: Optional[Mapping[str, Any]] = None) -> Tuple:
+    """
+    Build the coalescing key for a GET request.
+    
+    The endpoint is stripped of surrounding slashes and params are sorted with ``None``
+    values dropped, so ``{'limit': 10, 'offset': 0}`` and ``{'offset': 0, 'limit': 10}``
+    share a key.
+    """
+    normalized = tuple(sorted(
+        (str(name), str(value)) for name, value in (params or {}).items() if value is not None
+    ))
+    return (endpoint.strip('/'), normalized)
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class _AsyncCall:
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task: 'asyncio.Future[Any]'):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent identical calls.
+    
+    The first caller for a key runs the call; callers arriving while it is in flight
+    wait for it and receive the same result object (or the same exception), so results
+    must be treated as read-only. Threads and asyncio tasks are tracked separately.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: Dict[Tuple[int, Hashable], _AsyncCall] = {}
+        self._executed = 0
+        self._coalesced = 0
+    
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` unless an identical call is already in flight, then share its outcome."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+            else:
+                self._coalesced += 1
+        
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+    
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Coroutine counterpart of :meth:`do`, coalescing tasks on the same event loop.
+        
+        The call runs in a task of its own. A cancelled caller only stops waiting for
+        it; the call itself is cancelled once no caller is left waiting.
+        """
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        call = self._async_calls.get(loop_key)
+        if call is None:
+            call = self._async_calls[loop_key] = _AsyncCall(asyncio.ensure_future(fn()))
+            call.task.add_done_callback(lambda _: self._forget_async(loop_key, call))
+            with self._lock:
+                self._executed += 1
+        else:
+            with self._lock:
+                self._coalesced += 1
+        
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if not call.waiters and not call.task.done():
+                call.task.cancel()
+    
+    def _forget_async(self, loop_key: Tuple[int, Hashable], call: _AsyncCall) -> None:
+        if self._async_calls.get(loop_key) is call:
+            del self._async_calls[loop_key]
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Coalescing counters.
+        
+        Returns:
+            dict: Calls ``executed`` for real, calls ``coalesced`` onto an in-flight one,
+            and calls currently ``in_flight``
+        """
+        with self._lock:
+            return {
+                'executed': self._executed,
+                'coalesced': self._coalesced,
+                'in_flight': len(self._calls) + len(self._async_calls)
+            }
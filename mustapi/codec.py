@@ -0,0 +1,100 @@
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Type, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - optional dependency
+    ujson = None
+
+
+def _default(value: Any) -> Any:
+    """Serialize the non-JSON types request payloads may contain."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+class JSONCodec:
+    """
+    Encodes request bodies and decodes response bodies. This base class uses the
+    standard library ``json`` module; subclasses plug in faster libraries.
+
+    ``dumps`` returns UTF-8 bytes and renders ``datetime`` / ``date`` values as
+    ISO-8601 strings. ``loads`` takes the raw response bytes and raises
+    ``ValueError`` on invalid JSON.
+    """
+    name = 'json'
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(data, default=_default, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, body: Union[bytes, str]) -> Any:
+        return json.loads(body)
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} {self.name}>'
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by ``orjson``, which reads bytes directly and encodes datetimes natively."""
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson. Install it with 'pip install orjson'")
+
+    def dumps(self, data: Any) -> bytes:
+        return orjson.dumps(data, default=_default)
+
+    def loads(self, body: Union[bytes, str]) -> Any:
+        return orjson.loads(body)
+
+
+class UjsonCodec(JSONCodec):
+    """Codec backed by ``ujson``."""
+    name = 'ujson'
+
+    def __init__(self):
+        if ujson is None:
+            raise ImportError("UjsonCodec requires ujson. Install it with 'pip install ujson'")
+
+    def dumps(self, data: Any) -> bytes:
+        return ujson.dumps(data, default=_default, ensure_ascii=False).encode('utf-8')
+
+    def loads(self, body: Union[bytes, str]) -> Any:
+        return ujson.loads(body)
+
+
+CODECS: Dict[str, Type[JSONCodec]] = {
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+    'json': JSONCodec
+}
+
+
+def get_codec(codec: Optional[Union[str, JSONCodec]] = None) -> JSONCodec:
+    """
+    Resolve a codec instance, name (``orjson``, ``ujson`` or ``json``) or None. None
+    picks the fastest installed library: orjson, then ujson, then the standard library.
+
+    Raises:
+        ValueError: For an unknown codec name
+        ImportError: When the named library is not installed
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None:
+        if orjson is not None:
+            return OrjsonCodec()
+        if ujson is not None:
+            return UjsonCodec()
+        return JSONCodec()
+    if codec not in CODECS:
+        raise ValueError(f"Unknown JSON codec {codec!r}; expected one of {', '.join(CODECS)}")
+    return CODECS[codec]()
@@ -0,0 +1,193 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on the number of requests in flight at once.
+    
+    The limit grows by roughly ``increase`` per round of healthy responses and is
+    multiplied by ``decrease_factor`` on overload: a 429, a 5xx, a transport failure
+    or a latency spike. Sync and async callers may share one instance.
+    
+    Args:
+        initial_limit (int, optional): Starting concurrency. Defaults to 4
+        min_limit (int, optional): Lowest limit a decrease may reach. Defaults to 1
+        max_limit (int, optional): Highest limit an increase may reach. Defaults to 64
+        increase (float, optional): Additive growth per ``limit`` healthy responses.
+            Defaults to 1
+        decrease_factor (float, optional): Multiplier applied on overload. Defaults to 0.5
+        latency_tolerance (float, optional): A response slower than this multiple of the
+            smoothed healthy latency counts as a spike. Defaults to 2.0
+        latency_threshold (float, optional): Absolute latency, in seconds, that always
+            counts as a spike. Defaults to None
+        cooldown (float, optional): Minimum seconds between two decreases, so one burst
+            of failures only backs off once. Defaults to 1.0
+        history_size (int, optional): Number of limit changes kept in :attr:`history`.
+            Defaults to 100
+    """
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        latency_threshold: Optional[float] = None,
+        cooldown: float = 1.0,
+        history_size: int = 100
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.latency_threshold = latency_threshold
+        self.cooldown = cooldown
+        
+        self._lock = threading.Lock()
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: Deque[Union[threading.Event, Tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = deque()
+        self._baseline_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        
+        self._successes = 0
+        self._overloads = 0
+        self.history: Deque[Tuple[float, int, str]] = deque(maxlen=history_size)
+        self.history.append((time.time(), initial_limit, 'initial'))
+    
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently held."""
+        return self._in_flight
+    
+    def _wake_locked(self) -> None:
+        """Hand free slots to queued waiters. Caller holds the lock."""
+        while self._waiters and self._in_flight < int(self._limit):
+            waiter = self._waiters.popleft()
+            if isinstance(waiter, threading.Event):
+                self._in_flight += 1
+                waiter.set()
+                continue
+            loop, future = waiter
+            if future.done():
+                continue
+            self._in_flight += 1
+            loop.call_soon_threadsafe(self._resolve, future)
+    
+    def _resolve(self, future: asyncio.Future) -> None:
+        if future.done():
+            # Cancelled after the slot was handed over; give it back
+            self.release()
+        else:
+            future.set_result(None)
+    
+    def acquire(self) -> None:
+        """Block until a slot is free and take it."""
+        with self._lock:
+            if self._in_flight < int(self._limit) and not self._waiters:
+                self._in_flight += 1
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+        event.wait()
+    
+    async def acquire_async(self) -> None:
+        """Coroutine counterpart of :meth:`acquire`."""
+        with self._lock:
+            if self._in_flight < int(self._limit) and not self._waiters:
+                self._in_flight += 1
+                return
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._waiters.append((loop, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+    
+    def release(
+        self,
+        latency: Optional[float] = None,
+        status_code: Optional[int] = None,
+        failed: bool = False
+    ) -> None:
+        """
+        Return a slot, optionally reporting how the request went.
+        
+        Args:
+            latency (float, optional): Seconds the request took. Without it the slot is
+                returned without adjusting the limit
+            status_code (int, optional): HTTP status of the response
+            failed (bool, optional): The request failed before a response arrived
+        """
+        with self._lock:
+            self._in_flight -= 1
+            if latency is not None:
+                self._record_locked(latency, status_code, failed)
+            self._wake_locked()
+    
+    def _record_locked(self, latency: float, status_code: Optional[int], failed: bool) -> None:
+        overloaded = failed or (status_code is not None and (status_code == 429 or status_code >= 500))
+        reason = 'error' if overloaded else None
+        if not overloaded:
+            baseline = self._baseline_latency
+            if self.latency_threshold is not None and latency > self.latency_threshold:
+                reason = 'latency'
+            elif baseline is not None and latency > baseline * self.latency_tolerance:
+                reason = 'latency'
+            else:
+                self._baseline_latency = latency if baseline is None else 0.9 * baseline + 0.1 * latency
+        
+        if reason is None:
+            self._successes += 1
+            previous = int(self._limit)
+            self._limit = min(float(self.max_limit), self._limit + self.increase / self._limit)
+            if int(self._limit) != previous:
+                self.history.append((time.time(), int(self._limit), 'increase'))
+            return
+        
+        self._overloads += 1
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self.history.append((time.time(), int(self._limit), reason))
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of the limiter's state.
+        
+        Returns:
+            dict: Current ``limit`` and ``in_flight`` count, ``waiting`` callers,
+            ``successes`` and ``overloads`` seen, smoothed ``baseline_latency`` and the
+            recent ``history`` of ``(timestamp, limit, reason)`` changes
+        """
+        with self._lock:
+            history: List[Tuple[float, int, str]] = list(self.history)
+            return {
+                'limit': int(self._limit),
+                'in_flight': self._in_flight,
+                'waiting': len(self._waiters),
+                'successes': self._successes,
+                'overloads': self._overloads,
+                'baseline_latency': self._baseline_latency,
+                'history': history
+            }
@@ -0,0 +1,31 @@
+from functools import lru_cache
+
+# Fixed sub-resources that sit where an id would, e.g. ``events/batch``; never collapsed
+LITERAL_SEGMENTS = frozenset({'batch'})
+
+def endpoint_collection(endpoint: str) -> str:
+    """Top-level path segment of an endpoint, e.g. ``events`` for ``events/1``."""
+    return endpoint.strip('/').split('/', 1)[0]
+
+@lru_cache(maxsize=1024)
+def endpoint_template(endpoint: str) -> str:
+    """
+    Collapse resource ids in an endpoint path into placeholders.
+    
+    Paths alternate between collection names and ids, so every second segment is
+    replaced: ``events/42`` becomes ``events/{id}`` and ``devs/abc/keys`` becomes
+    ``devs/{id}/keys``. Segments in :data:`LITERAL_SEGMENTS` are kept, so
+    ``events/batch`` stays apart from ``events/{id}``. Used to group per-endpoint
+    state without one entry per id.
+    
+    Args:
+        endpoint (str): API endpoint, with or without leading/trailing slashes
+    
+    Returns:
+        str: Endpoint template
+    """
+    segments = endpoint.strip('/').split('/')
+    return '/'.join(
+        '{id}' if index % 2 and segment not in LITERAL_SEGMENTS else segment
+        for index, segment in enumerate(segments)
+    )
@@ -1,3 +1,5 @@
+from typing import Optional
+
 class MustAPIError(Exception):
     """Base exception for MustAPI errors."""
     def __init__(self, message: str, status_code: int = None):
@@ -18,5 +20,25 @@ class ValidationError(MustAPIError):
     pass
 
 class RateLimitError(MustAPIError):
-    """Raised when API rate limit is exceeded."""
-    pass
\ No newline at end of file
+    """
+    Raised when API rate limit is exceeded.
+    
+    Attributes:
+        retry_after (Optional[float]): Seconds the server asked clients to wait, if given
+    """
+    def __init__(self, message: str, status_code: int = 429, retry_after: Optional[float] = None):
+        super().__init__(message, status_code)
+        self.retry_after = retry_after
+
+class CircuitOpenError(MustAPIError):
+    """
+    Raised without contacting the API while an endpoint's circuit breaker is open.
+    
+    Attributes:
+        endpoint (str): Endpoint template the breaker guards
+        retry_in (float): Seconds until the breaker lets a probe request through
+    """
+    def __init__(self, message: str, endpoint: str, retry_in: float):
+        super().__init__(message)
+        self.endpoint = endpoint
+        self.retry_in = retry_in
@@ -0,0 +1,350 @@
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .endpoints import endpoint_template
+from .timing import NETWORK_PHASES, RequestTiming
+
+# Latency buckets are log-linear over microseconds, HDR-histogram style: 8 linear
+# sub-buckets per power of two, so any recorded value is within 12.5% of its bucket's
+# bounds. Values above ~17 minutes share the last bucket.
+SUB_BUCKET_BITS = 3
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+BUCKET_COUNT = 224
+
+# Upper bounds (seconds) of the cumulative buckets in the Prometheus export
+PROMETHEUS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def _bucket_index(seconds: float) -> int:
+    """Histogram bucket holding ``seconds``."""
+    micros = int(seconds * 1e6)
+    if micros < 2 * SUB_BUCKETS:
+        return max(micros, 0)
+    shift = micros.bit_length() - SUB_BUCKET_BITS - 1
+    return min(SUB_BUCKETS * shift + (micros >> shift), BUCKET_COUNT - 1)
+
+
+def _bucket_upper(index: int) -> float:
+    """Exclusive upper bound of bucket ``index`` in seconds."""
+    if index < 2 * SUB_BUCKETS:
+        return (index + 1) / 1e6
+    shift = (index - SUB_BUCKETS) // SUB_BUCKETS
+    mantissa = index - SUB_BUCKETS * shift
+    return ((mantissa + 1) << shift) / 1e6
+
+
+def status_class(status_code: Optional[int]) -> str:
+    """``2xx``-style class of an HTTP status, or ``error`` when no response arrived."""
+    if status_code is None:
+        return 'error'
+    return f'{status_code // 100}xx'
+
+
+class _Series:
+    """Counters for one (method, endpoint template) pair, owned by a single thread."""
+    __slots__ = (
+        'statuses', 'buckets', 'latency_sum', 'max_latency', 'bytes_in', 'bytes_out', 'retries',
+        'phases', 'phase_sums', 'connections'
+    )
+
+    def __init__(self):
+        self.statuses: Dict[str, int] = {}
+        self.buckets: List[int] = [0] * BUCKET_COUNT
+        self.latency_sum = 0.0
+        self.max_latency = 0.0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.retries = 0
+        # Only filled for clients created with trace_timing=True
+        self.phases: Dict[str, List[int]] = {}
+        self.phase_sums: Dict[str, float] = {}
+        self.connections: Dict[str, int] = {}
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        buckets = self.phases.get(phase)
+        if buckets is None:
+            buckets = self.phases[phase] = [0] * BUCKET_COUNT
+            self.phase_sums[phase] = 0.0
+        buckets[_bucket_index(seconds)] += 1
+        self.phase_sums[phase] += seconds
+
+
+def _merge_shard(
+    target: Dict[Tuple[str, str], _Series],
+    shard: Dict[Tuple[str, str], _Series]
+) -> None:
+    """Add the counters of every series in ``shard`` to ``target``."""
+    # Copy first: the owning thread may add series while we read
+    for key, series in list(shard.items()):
+        total = target.get(key)
+        if total is None:
+            total = target[key] = _Series()
+        for status, count in list(series.statuses.items()):
+            total.statuses[status] = total.statuses.get(status, 0) + count
+        total.buckets = [a + b for a, b in zip(total.buckets, series.buckets)]
+        total.latency_sum += series.latency_sum
+        total.max_latency = max(total.max_latency, series.max_latency)
+        total.bytes_in += series.bytes_in
+        total.bytes_out += series.bytes_out
+        total.retries += series.retries
+        for phase, buckets in list(series.phases.items()):
+            merged_buckets = total.phases.get(phase, [0] * BUCKET_COUNT)
+            total.phases[phase] = [a + b for a, b in zip(merged_buckets, buckets)]
+            total.phase_sums[phase] = total.phase_sums.get(phase, 0.0) + series.phase_sums[phase]
+        for reuse, count in list(series.connections.items()):
+            total.connections[reuse] = total.connections.get(reuse, 0) + count
+
+
+class ClientMetrics:
+    """
+    Per-endpoint request metrics: counts by status class, latency histograms, bytes
+    sent and received, and retries, keyed by method and endpoint template
+    (``events/{id}``, not the raw id).
+
+    Each thread records into its own shard, so recording takes no lock; shards are only
+    merged when :meth:`snapshot` or :meth:`render_prometheus` is called, and the shards
+    of exited threads are folded into one retired total. One instance may be shared by
+    several clients.
+
+    Args:
+        namespace (str, optional): Prefix of the exported metric names. Defaults to 'mustapi'
+    """
+    def __init__(self, namespace: str = 'mustapi'):
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, Dict[Tuple[str, str], _Series]]] = []
+        # Totals of the shards of threads that have exited
+        self._retired: Dict[Tuple[str, str], _Series] = {}
+
+    def _series(self, method: str, endpoint: str) -> _Series:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._retire_dead_locked()
+                self._shards.append((threading.current_thread(), shard))
+        key = (method, endpoint_template(endpoint))
+        series = shard.get(key)
+        if series is None:
+            series = shard[key] = _Series()
+        return series
+
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        status_code: Optional[int],
+        latency: float,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        retry: bool = False,
+        timing: Optional[RequestTiming] = None
+    ) -> None:
+        """
+        Record one HTTP attempt.
+
+        Args:
+            method (str): HTTP method
+            endpoint (str): Raw endpoint; ids are collapsed with ``endpoint_template``
+            status_code (int, optional): Response status, None when the attempt failed
+                without a response
+            latency (float): Seconds the attempt took
+            bytes_in (int, optional): Response body size. Defaults to 0
+            bytes_out (int, optional): Request body size. Defaults to 0
+            retry (bool, optional): Whether the attempt was a retry. Defaults to False
+            timing (RequestTiming, optional): Phase breakdown of the attempt; its network
+                phases are recorded here, encode, decode and model time via :meth:`record_phase`
+        """
+        series = self._series(method, endpoint)
+        status = status_class(status_code)
+        series.statuses[status] = series.statuses.get(status, 0) + 1
+        series.buckets[_bucket_index(latency)] += 1
+        series.latency_sum += latency
+        if latency > series.max_latency:
+            series.max_latency = latency
+        series.bytes_in += bytes_in
+        series.bytes_out += bytes_out
+        if retry:
+            series.retries += 1
+        if timing is not None:
+            for phase in NETWORK_PHASES:
+                seconds = getattr(timing, phase)
+                if seconds is not None:
+                    series.add_phase(phase, seconds)
+            if timing.connection_reused is not None:
+                reuse = 'reused' if timing.connection_reused else 'new'
+                series.connections[reuse] = series.connections.get(reuse, 0) + 1
+
+    def record_phase(self, method: str, endpoint: str, phase: str, seconds: float) -> None:
+        """Record time spent in one request phase (see :data:`~mustapi.timing.PHASES`)."""
+        self._series(method, endpoint).add_phase(phase, seconds)
+
+    def _retire_dead_locked(self) -> None:
+        """
+        Fold the shards of exited threads into the retired totals, so short-lived
+        worker threads don't leave a shard behind each. Caller holds the lock.
+        """
+        live = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                live.append((thread, shard))
+            else:
+                _merge_shard(self._retired, shard)
+        self._shards = live
+
+    def _merged(self) -> Dict[Tuple[str, str], _Series]:
+        merged: Dict[Tuple[str, str], _Series] = {}
+        with self._lock:
+            self._retire_dead_locked()
+            shards = [shard for _, shard in self._shards]
+            _merge_shard(merged, self._retired)
+        for shard in shards:
+            _merge_shard(merged, shard)
+        return merged
+
+    @staticmethod
+    def _percentile(buckets: List[int], count: int, percentile: float) -> float:
+        """Upper bound of the bucket holding the given percentile."""
+        rank = count * percentile / 100
+        seen = 0
+        for index, bucket_count in enumerate(buckets):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return _bucket_upper(index)
+        return 0.0
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Current totals.
+
+        Returns:
+            dict: Keyed by ``'<METHOD> <endpoint template>'``; each value holds
+            ``requests`` (count per status class), ``latency`` (``count``, ``sum``,
+            ``max`` and ``p50``/``p90``/``p99``/``p99.9`` in seconds), ``bytes_in``,
+            ``bytes_out``, ``retries`` and ``phases`` (``count``, ``sum``, ``p50`` and
+            ``p99`` per phase: JSON ``encode`` / ``decode`` always, the others with
+            phase timing enabled); with phase timing also ``connections`` (``new`` /
+            ``reused`` counts)
+        """
+        result = {}
+        for (method, template), series in sorted(self._merged().items()):
+            count = sum(series.buckets)
+            latency = {'count': count, 'sum': series.latency_sum, 'max': series.max_latency}
+            for percentile in PERCENTILES:
+                latency[f'p{percentile:g}'] = min(
+                    self._percentile(series.buckets, count, percentile), series.max_latency
+                )
+            entry = result[f'{method} {template}'] = {
+                'requests': dict(series.statuses),
+                'latency': latency,
+                'bytes_in': series.bytes_in,
+                'bytes_out': series.bytes_out,
+                'retries': series.retries
+            }
+            if series.phases:
+                entry['phases'] = {
+                    phase: {
+                        'count': sum(buckets),
+                        'sum': series.phase_sums[phase],
+                        'p50': self._percentile(buckets, sum(buckets), 50),
+                        'p99': self._percentile(buckets, sum(buckets), 99)
+                    }
+                    for phase, buckets in series.phases.items()
+                }
+            if series.connections:
+                entry['connections'] = dict(series.connections)
+        return result
+
+    def render_prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: ``<namespace>_requests_total``, ``<namespace>_request_duration_seconds``
+            (histogram), ``<namespace>_request_bytes_total``,
+            ``<namespace>_response_bytes_total``, ``<namespace>_retries_total``,
+            ``<namespace>_request_phase_seconds`` and, with phase timing,
+            ``<namespace>_connections_total``
+        """
+        name = self.namespace
+        merged = sorted(self._merged().items())
+        lines = [
+            f'# HELP {name}_requests_total HTTP attempts by method, endpoint and status class.',
+            f'# TYPE {name}_requests_total counter'
+        ]
+        for (method, template), series in merged:
+            for status, count in sorted(series.statuses.items()):
+                labels = _labels(method=method, endpoint=template, status=status)
+                lines.append(f'{name}_requests_total{labels} {count}')
+
+        lines += [
+            f'# HELP {name}_request_duration_seconds HTTP attempt latency.',
+            f'# TYPE {name}_request_duration_seconds histogram'
+        ]
+        for (method, template), series in merged:
+            cumulative = 0
+            index = 0
+            for bound in PROMETHEUS_BUCKETS:
+                while index < BUCKET_COUNT and _bucket_upper(index) <= bound:
+                    cumulative += series.buckets[index]
+                    index += 1
+                labels = _labels(method=method, endpoint=template, le=f'{bound:g}')
+                lines.append(f'{name}_request_duration_seconds_bucket{labels} {cumulative}')
+            count = sum(series.buckets)
+            labels = _labels(method=method, endpoint=template, le='+Inf')
+            lines.append(f'{name}_request_duration_seconds_bucket{labels} {count}')
+            labels = _labels(method=method, endpoint=template)
+            lines.append(f'{name}_request_duration_seconds_sum{labels} {series.latency_sum:.6f}')
+            lines.append(f'{name}_request_duration_seconds_count{labels} {count}')
+
+        for metric, attribute, help_text in (
+            ('request_bytes_total', 'bytes_out', 'Request body bytes sent.'),
+            ('response_bytes_total', 'bytes_in', 'Response body bytes received.'),
+            ('retries_total', 'retries', 'Retried HTTP attempts.')
+        ):
+            lines += [f'# HELP {name}_{metric} {help_text}', f'# TYPE {name}_{metric} counter']
+            for (method, template), series in merged:
+                labels = _labels(method=method, endpoint=template)
+                lines.append(f'{name}_{metric}{labels} {getattr(series, attribute)}')
+
+        if any(series.phases for _, series in merged):
+            lines += [
+                f'# HELP {name}_request_phase_seconds Time spent per request phase.',
+                f'# TYPE {name}_request_phase_seconds summary'
+            ]
+            for (method, template), series in merged:
+                for phase, buckets in series.phases.items():
+                    labels = _labels(method=method, endpoint=template, phase=phase)
+                    lines.append(f'{name}_request_phase_seconds_sum{labels} {series.phase_sums[phase]:.6f}')
+                    lines.append(f'{name}_request_phase_seconds_count{labels} {sum(buckets)}')
+            lines += [
+                f'# HELP {name}_connections_total Attempts by new or reused connection.',
+                f'# TYPE {name}_connections_total counter'
+            ]
+            for (method, template), series in merged:
+                for reuse, count in sorted(series.connections.items()):
+                    labels = _labels(method=method, endpoint=template, connection=reuse)
+                    lines.append(f'{name}_connections_total{labels} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        """Drop everything recorded so far."""
+        with self._lock:
+            for _, shard in self._shards:
+                shard.clear()
+            self._retired.clear()
+
+
+def _labels(**labels: str) -> str:
+    """Format Prometheus labels, escaping values."""
+    return '{' + ','.join(
+        f'{key}="{_escape(value)}"' for key, value in labels.items()
+    ) + '}'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
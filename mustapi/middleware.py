@@ -0,0 +1,342 @@
+import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+from .coalescing import request_key
+from .endpoints import endpoint_collection
+
+class RequestContext:
+    """
+    A logical API call as seen by middleware: one per ``_request``, shared by all of its
+    retries.
+
+    Attributes:
+        method (str): HTTP method
+        endpoint (str): Endpoint relative to the client's base URL
+        params (Optional[dict]): Query parameters
+        data (Optional[dict]): JSON payload
+        headers (dict): Extra headers sent with the request, on top of the client's own
+        extras (dict): Scratch space for middleware to keep per-call state in
+    """
+    __slots__ = ('method', 'endpoint', 'params', 'data', 'headers', 'extras')
+
+    def __init__(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None
+    ):
+        self.method = method
+        self.endpoint = endpoint
+        self.params = params
+        self.data = data
+        self.headers: Dict[str, str] = {}
+        self.extras: Dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        return f'<RequestContext {self.method} {self.endpoint}>'
+
+
+class Middleware:
+    """
+    Base class for request middleware. Override any of the hooks; the defaults pass the
+    call through unchanged.
+
+    Middleware wraps the whole call (retries, coalescing and the HTTP cache included) in
+    registration order: the first registered middleware sees the request first and the
+    response last. The async client also accepts coroutine hooks.
+    """
+    def before_send(self, request: RequestContext) -> Optional[Any]:
+        """
+        Called before the request is sent; may mutate ``request`` (e.g. add headers).
+
+        Returns:
+            Optional[Any]: None to continue, or a response to return without sending
+            (later middleware, the network and this middleware's ``after_receive`` are
+            skipped; earlier middleware still see the response)
+        """
+        return None
+
+    def after_receive(self, request: RequestContext, response: Any) -> Any:
+        """
+        Called with the decoded response.
+
+        Returns:
+            Any: The response to hand to the caller (or to earlier middleware)
+        """
+        return response
+
+    def on_error(self, request: RequestContext, error: Exception) -> Optional[Any]:
+        """
+        Called when the call (or later middleware) raised.
+
+        Returns:
+            Optional[Any]: None to re-raise ``error``, or a response to recover with
+        """
+        return None
+
+
+async def _resolve(value: Any) -> Any:
+    """Await ``value`` if a hook returned an awaitable."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class MiddlewareChain:
+    """
+    Ordered, thread-safe collection of :class:`Middleware` run around every request.
+
+    An empty chain is falsy, which is all the clients check on the hot path; a call
+    only pays for middleware once some is registered.
+
+    Args:
+        middleware (Iterable[Middleware], optional): Initial middleware, outermost first
+    """
+    def __init__(self, middleware: Optional[Iterable[Middleware]] = None):
+        self._lock = threading.Lock()
+        # Replaced, never mutated, so a call in progress keeps the chain it started with
+        self._middleware: Tuple[Middleware, ...] = tuple(middleware or ())
+
+    def add(self, middleware: Middleware) -> Middleware:
+        """Append ``middleware`` as the innermost entry and return it."""
+        with self._lock:
+            self._middleware = self._middleware + (middleware,)
+        return middleware
+
+    def remove(self, middleware: Middleware) -> None:
+        """
+        Unregister ``middleware``.
+
+        Raises:
+            ValueError: When it is not registered
+        """
+        with self._lock:
+            entries = list(self._middleware)
+            entries.remove(middleware)
+            self._middleware = tuple(entries)
+
+    def __len__(self) -> int:
+        return len(self._middleware)
+
+    def __iter__(self) -> Iterator[Middleware]:
+        return iter(self._middleware)
+
+    def run(self, request: RequestContext, send: Callable[[RequestContext], Any]) -> Any:
+        """Run ``send(request)`` through the chain."""
+        return self._call(self._middleware, 0, request, send)
+
+    def _call(self, chain, index, request, send):
+        if index == len(chain):
+            return send(request)
+        middleware = chain[index]
+        try:
+            response = middleware.before_send(request)
+            if response is not None:
+                # Answered by this middleware, e.g. from a cache: nothing to post-process
+                return response
+            response = self._call(chain, index + 1, request, send)
+        except Exception as error:
+            recovered = middleware.on_error(request, error)
+            if recovered is None:
+                raise
+            return recovered
+        return middleware.after_receive(request, response)
+
+    async def run_async(self, request: RequestContext, send: Callable[[RequestContext], Any]) -> Any:
+        """Await ``send(request)`` through the chain."""
+        return await self._call_async(self._middleware, 0, request, send)
+
+    async def _call_async(self, chain, index, request, send):
+        if index == len(chain):
+            return await send(request)
+        middleware = chain[index]
+        try:
+            response = await _resolve(middleware.before_send(request))
+            if response is not None:
+                # Answered by this middleware, e.g. from a cache: nothing to post-process
+                return response
+            response = await self._call_async(chain, index + 1, request, send)
+        except Exception as error:
+            recovered = await _resolve(middleware.on_error(request, error))
+            if recovered is None:
+                raise
+            return recovered
+        return await _resolve(middleware.after_receive(request, response))
+
+
+class TimingMiddleware(Middleware):
+    """
+    Measures the wall time of every call, retries included.
+
+    The duration is stored as ``request.extras['elapsed']`` and passed to ``callback``.
+
+    Args:
+        callback (Callable[[RequestContext, float, Optional[Exception]], None], optional):
+            Called with the request, seconds taken and the error, if the call failed
+    """
+    def __init__(self, callback: Optional[Callable[[RequestContext, float, Optional[Exception]], None]] = None):
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def before_send(self, request: RequestContext) -> None:
+        request.extras['timing.started'] = time.perf_counter()
+
+    def after_receive(self, request: RequestContext, response: Any) -> Any:
+        self._record(request, None)
+        return response
+
+    def on_error(self, request: RequestContext, error: Exception) -> None:
+        self._record(request, error)
+
+    def _record(self, request: RequestContext, error: Optional[Exception]) -> None:
+        started = request.extras.get('timing.started')
+        if started is None:
+            return
+        elapsed = request.extras['elapsed'] = time.perf_counter() - started
+        with self._lock:
+            self._count += 1
+            self._total += elapsed
+            self._max = max(self._max, elapsed)
+        if self.callback is not None:
+            self.callback(request, elapsed, error)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Number of timed calls with their mean and maximum duration in seconds."""
+        with self._lock:
+            return {
+                'count': self._count,
+                'mean': self._total / self._count if self._count else 0.0,
+                'max': self._max
+            }
+
+
+class LoggingMiddleware(Middleware):
+    """
+    Logs each call's outcome and duration.
+
+    Args:
+        logger (logging.Logger, optional): Defaults to the ``mustapi`` logger
+        level (int, optional): Level for successful calls. Defaults to ``logging.DEBUG``
+        error_level (int, optional): Level for failed calls. Defaults to ``logging.WARNING``
+    """
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        level: int = logging.DEBUG,
+        error_level: int = logging.WARNING
+    ):
+        self.logger = logger if logger is not None else logging.getLogger('mustapi')
+        self.level = level
+        self.error_level = error_level
+
+    def before_send(self, request: RequestContext) -> None:
+        request.extras['logging.started'] = time.perf_counter()
+
+    def after_receive(self, request: RequestContext, response: Any) -> Any:
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(
+                self.level, '%s %s -> %s in %.1fms',
+                request.method, request.endpoint,
+                getattr(response, 'status_code', None), self._elapsed_ms(request)
+            )
+        return response
+
+    def on_error(self, request: RequestContext, error: Exception) -> None:
+        if self.logger.isEnabledFor(self.error_level):
+            self.logger.log(
+                self.error_level, '%s %s failed in %.1fms: %s',
+                request.method, request.endpoint, self._elapsed_ms(request), error
+            )
+
+    @staticmethod
+    def _elapsed_ms(request: RequestContext) -> float:
+        started = request.extras.get('logging.started')
+        return (time.perf_counter() - started) * 1000 if started is not None else 0.0
+
+
+class HeaderMiddleware(Middleware):
+    """
+    Adds headers to every request.
+
+    Args:
+        headers (Union[Mapping[str, str], Callable[[RequestContext], Mapping[str, str]]]):
+            Static headers, or a function computing them per request (e.g. a trace id)
+    """
+    def __init__(self, headers: Union[Mapping[str, str], Callable[[RequestContext], Mapping[str, str]]]):
+        self.headers = headers
+
+    def before_send(self, request: RequestContext) -> None:
+        headers = self.headers(request) if callable(self.headers) else self.headers
+        request.headers.update(headers)
+
+
+class CachingMiddleware(Middleware):
+    """
+    Keeps decoded GET responses in memory for ``ttl`` seconds, regardless of the
+    server's caching headers. A successful write evicts every cached GET under the same
+    top-level resource (a PUT to ``events/1`` drops ``events`` listings too).
+
+    Use :class:`~mustapi.cache.HTTPCache` instead to honour ``Cache-Control`` and
+    revalidate with ETags.
+
+    Args:
+        ttl (float, optional): Seconds a response stays valid. Defaults to 30
+        max_size (int, optional): Maximum number of cached responses (LRU). Defaults to 1024
+    """
+    def __init__(self, ttl: float = 30, max_size: int = 1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def before_send(self, request: RequestContext) -> Optional[Any]:
+        if request.method != 'GET':
+            return None
+        key = request_key(request.endpoint, request.params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+        return None
+
+    def after_receive(self, request: RequestContext, response: Any) -> Any:
+        with self._lock:
+            if request.method == 'GET':
+                key = request_key(request.endpoint, request.params)
+                self._entries[key] = (time.monotonic() + self.ttl, response)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+            else:
+                self._evict(request.endpoint)
+        return response
+
+    def _evict(self, endpoint: str) -> None:
+        resource = endpoint_collection(endpoint)
+        for key in [key for key in self._entries if endpoint_collection(key[0]) == resource]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Cache ``hits``, ``misses`` and current ``size``."""
+        with self._lock:
+            return {'hits': self._hits, 'misses': self._misses, 'size': len(self._entries)}
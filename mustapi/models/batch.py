@@ -0,0 +1,297 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .event import Event, TIMESTAMP_FIELDS
+from .timestamps import parse_timestamp
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+# Column order, matching the Event fields
+FIELDS = ('id', 'title', 'description', 'start_time', 'end_time', 'location', 'created_at')
+# Dictionary-encoded columns
+STRING_FIELDS = ('id', 'title', 'description', 'location')
+# Stored in null timestamp slots; it is NaT when viewed as datetime64
+NULL_TIME = -2 ** 63
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _buffer(kind: str, values: List[int]) -> Any:
+    """
+    Integer column buffer: a NumPy array when NumPy is installed, otherwise a
+    memoryview over a stdlib ``array``. Both slice without copying.
+    """
+    if numpy is not None:
+        return numpy.array(values, dtype=numpy.int32 if kind == 'codes' else numpy.int64)
+    return memoryview(array('i' if kind == 'codes' else 'q', values))
+
+
+def _validity(values: List[Any]) -> Optional[bytes]:
+    """Bitmap with bit ``i`` (least significant first) set when ``values[i]`` is not None."""
+    if not any(value is None for value in values):
+        return None
+    bits = bytearray((len(values) + 7) // 8)
+    for index, value in enumerate(values):
+        if value is not None:
+            bits[index >> 3] |= 1 << (index & 7)
+    return bytes(bits)
+
+
+def _encode_strings(values: List[Optional[str]]) -> Tuple[Any, List[str]]:
+    """Dictionary-encode ``values`` into (codes, dictionary); nulls get code 0."""
+    index: Dict[str, int] = {}
+    codes = [0 if value is None else index.setdefault(value, len(index)) for value in values]
+    return _buffer('codes', codes), list(index)
+
+
+def _encode_times(values: List[Any]) -> Tuple[Any, bool]:
+    """
+    Encode datetimes or ISO-8601 strings as microseconds since the epoch, returning
+    (buffer, aware). Repeated values are converted once.
+
+    If any value is timezone-aware the column is aware: naive values are then taken
+    to be UTC and all values decode as UTC datetimes.
+    """
+    converted: Dict[Any, Tuple[int, bool]] = {}
+    micros = []
+    aware = False
+    for value in values:
+        if value is None:
+            micros.append(NULL_TIME)
+            continue
+        entry = converted.get(value)
+        if entry is None:
+            moment = parse_timestamp(value) if value.__class__ is str else value
+            if moment.tzinfo is not None:
+                entry = ((moment - _EPOCH_UTC) // _MICROSECOND, True)
+            else:
+                entry = ((moment - _EPOCH) // _MICROSECOND, False)
+            converted[value] = entry
+        micros.append(entry[0])
+        aware = aware or entry[1]
+    return _buffer('times', micros), aware
+
+
+class EventBatch:
+    """
+    Events stored column by column, for analytics over large listings.
+
+    ``id``, ``title``, ``description`` and ``location`` are dictionary-encoded (an int32
+    code per row into a list of distinct strings); timestamps are int64 microseconds
+    since the Unix epoch. Nulls are tracked in a validity bitmap per column. Buffers
+    are NumPy arrays when NumPy is installed, otherwise memoryviews over stdlib arrays.
+
+    Slicing with ``batch[start:stop]`` returns a batch sharing the same buffers, and
+    ``batch[i]`` returns an :class:`EventRow` reading its values on access. Build
+    batches with :meth:`from_events`, :meth:`from_dicts` or :meth:`concat`.
+
+    Args:
+        codes (dict): Code buffer per string column
+        dictionaries (dict): Distinct values per string column
+        times (dict): Microsecond buffer per timestamp column
+        aware (dict): Whether each timestamp column decodes to UTC-aware datetimes
+        validity (dict): Validity bitmap per column, None when it has no nulls
+        offset (int, optional): First row of the buffers in this batch. Defaults to 0
+        length (int, optional): Rows in this batch. Defaults to the buffer length
+    """
+    __slots__ = ('_codes', '_dictionaries', '_times', '_aware', '_validity', '_offset', '_length')
+
+    def __init__(
+        self,
+        codes: Mapping[str, Any],
+        dictionaries: Mapping[str, List[str]],
+        times: Mapping[str, Any],
+        aware: Mapping[str, bool],
+        validity: Mapping[str, Optional[bytes]],
+        offset: int = 0,
+        length: Optional[int] = None
+    ):
+        self._codes = dict(codes)
+        self._dictionaries = dict(dictionaries)
+        self._times = dict(times)
+        self._aware = dict(aware)
+        self._validity = dict(validity)
+        self._offset = offset
+        self._length = len(self._codes['id']) - offset if length is None else length
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, List[Any]]) -> 'EventBatch':
+        """
+        Build a batch from one list of Python values per field (strings or None for the
+        string fields; datetimes, ISO-8601 strings or None for the timestamps).
+        """
+        codes, dictionaries, times, aware, validity = {}, {}, {}, {}, {}
+        for name in STRING_FIELDS:
+            codes[name], dictionaries[name] = _encode_strings(columns[name])
+            validity[name] = _validity(columns[name])
+        for name in TIMESTAMP_FIELDS:
+            times[name], aware[name] = _encode_times(columns[name])
+            validity[name] = _validity(columns[name])
+        return cls(codes, dictionaries, times, aware, validity)
+
+    @classmethod
+    def from_events(cls, events: Iterable[Event]) -> 'EventBatch':
+        """Build a batch from ``Event`` objects (or :class:`EventRow` views)."""
+        events = list(events)
+        return cls.from_columns({
+            name: [getattr(event, name) for event in events] for name in FIELDS
+        })
+
+    @classmethod
+    def from_dicts(cls, rows: Sequence[Dict[str, Any]]) -> 'EventBatch':
+        """Build a batch from API event dicts, as accepted by ``Event.from_dict``."""
+        columns: Dict[str, List[Any]] = {
+            'id': [row.get('id', '') for row in rows],
+            'title': [row.get('title', '') for row in rows],
+            'description': [row.get('description') for row in rows],
+            'location': [row.get('location') for row in rows]
+        }
+        for name in TIMESTAMP_FIELDS:
+            columns[name] = [row.get(name) or None for row in rows]
+        return cls.from_columns(columns)
+
+    @classmethod
+    def concat(cls, batches: Iterable['EventBatch']) -> 'EventBatch':
+        """Join batches into one with freshly encoded (copied) columns."""
+        batches = list(batches)
+        return cls.from_columns({
+            name: [value for batch in batches for value in batch.column(name)]
+            for name in FIELDS
+        })
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key: Union[int, slice]) -> Union['EventRow', 'EventBatch']:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step != 1:
+                raise ValueError('EventBatch slices must be contiguous')
+            return EventBatch(
+                self._codes, self._dictionaries, self._times, self._aware, self._validity,
+                self._offset + start, max(stop - start, 0)
+            )
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError('EventBatch index out of range')
+        return EventRow(self, self._offset + key)
+
+    def __iter__(self) -> Iterator['EventRow']:
+        for position in range(self._offset, self._offset + self._length):
+            yield EventRow(self, position)
+
+    def __repr__(self) -> str:
+        backend = 'numpy' if numpy is not None else 'array'
+        return f'<EventBatch rows={self._length} backend={backend}>'
+
+    def _is_null(self, name: str, position: int) -> bool:
+        bits = self._validity[name]
+        return bits is not None and not bits[position >> 3] & (1 << (position & 7))
+
+    def _value(self, name: str, position: int) -> Any:
+        """Decoded value of column ``name`` at buffer position ``position``."""
+        if self._is_null(name, position):
+            return None
+        if name in self._codes:
+            return self._dictionaries[name][self._codes[name][position]]
+        micros = int(self._times[name][position])
+        if self._aware[name]:
+            return _EPOCH_UTC + timedelta(microseconds=micros)
+        return _EPOCH + timedelta(microseconds=micros)
+
+    def column(self, name: str) -> List[Any]:
+        """Decoded values of column ``name`` as a list, with None for nulls."""
+        start, stop = self._offset, self._offset + self._length
+        if name in self._codes:
+            # A column of nulls has an empty dictionary; code 0 is masked below
+            dictionary = self._dictionaries[name] or [None]
+            values = [dictionary[code] for code in self._codes[name][start:stop].tolist()]
+        else:
+            epoch = _EPOCH_UTC if self._aware[name] else _EPOCH
+            values = [
+                None if micros == NULL_TIME else epoch + timedelta(microseconds=micros)
+                for micros in self._times[name][start:stop].tolist()
+            ]
+        if self._validity[name] is not None:
+            for index, position in enumerate(range(start, stop)):
+                if self._is_null(name, position):
+                    values[index] = None
+        return values
+
+    def to_events(self) -> List[Event]:
+        """Materialize every row as an ``Event``."""
+        return [Event(*values) for values in zip(*(self.column(name) for name in FIELDS))]
+
+    def codes(self, name: str) -> Tuple[Any, List[str]]:
+        """
+        ``(codes, dictionary)`` of string column ``name``; the codes are a view of this
+        batch's rows, and rows that are null have code 0.
+        """
+        return self._codes[name][self._offset:self._offset + self._length], self._dictionaries[name]
+
+    def epoch_us(self, name: str) -> Any:
+        """
+        Microseconds since the epoch for timestamp column ``name``, as a view. Null rows
+        hold ``NULL_TIME``; naive timestamps are counted as if they were UTC.
+        """
+        return self._times[name][self._offset:self._offset + self._length]
+
+    def datetime64(self, name: str) -> Any:
+        """Timestamp column ``name`` as a NumPy ``datetime64[us]`` view, NaT for nulls."""
+        if numpy is None:
+            raise ImportError('EventBatch.datetime64 requires numpy')
+        return self.epoch_us(name).view('datetime64[us]')
+
+    def valid(self, name: str) -> Any:
+        """Per-row validity of column ``name``: a NumPy bool array, or a list of bools."""
+        positions = range(self._offset, self._offset + self._length)
+        flags = [not self._is_null(name, position) for position in positions]
+        return numpy.array(flags, dtype=bool) if numpy is not None else flags
+
+
+class EventRow:
+    """
+    Read-only view of one row of an :class:`EventBatch`, with the attributes of an
+    ``Event``. Values are decoded from the columns on each access; use
+    :meth:`to_event` to get a standalone ``Event``.
+    """
+    __slots__ = ('_batch', '_position')
+
+    def __init__(self, batch: EventBatch, position: int):
+        self._batch = batch
+        self._position = position
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(self._batch._value(name, self._position) for name in FIELDS)
+
+    def to_event(self) -> Event:
+        return Event(*self._values())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, EventRow):
+            return self._values() == other._values()
+        if isinstance(other, Event):
+            return self._values() == tuple(getattr(other, name) for name in FIELDS)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        values = ', '.join(f'{name}={value!r}' for name, value in zip(FIELDS, self._values()))
+        return f'EventRow({values})'
+
+
+def _column_property(name: str) -> property:
+    return property(lambda row: row._batch._value(name, row._position), doc=f'The row\'s ``{name}``')
+
+
+for _name in FIELDS:
+    setattr(EventRow, _name, _column_property(_name))
+del _name
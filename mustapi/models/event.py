@@ -1,12 +1,73 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, Iterable, List, Union
 
-@dataclass
+from ..codec import get_codec
+from .timestamps import TimestampCache, parse_timestamp
+
+if TYPE_CHECKING:
+    from .batch import EventBatch
+
+# Fields holding timestamps; in lazy mode they keep the raw ISO string until first read
+TIMESTAMP_FIELDS = ('start_time', 'end_time', 'created_at')
+# Rows Event.from_dicts looks at to decide whether a timestamp field repeats
+REPEAT_SAMPLE = 256
+
+
+class _Timestamp:
+    """
+    Descriptor for a timestamp field stored in the private slot ``_<name>``.
+
+    A ``str`` found in the slot is an unparsed ISO-8601 value: it is parsed on first
+    access and the datetime is written back, so later reads cost one slot lookup.
+    """
+    __slots__ = ('_slot',)
+
+    def __init__(self, slot: Any):
+        self._slot = slot
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        value = self._slot.__get__(instance, owner)
+        if value.__class__ is str:
+            value = parse_timestamp(value)
+            self._slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self._slot.__set__(instance, value)
+
+
+def _slotted(cls: type) -> type:
+    """
+    Rebuild dataclass ``cls`` with ``__slots__`` (``dataclass(slots=True)`` needs
+    Python 3.10). Timestamp fields get a private slot ``_<name>`` behind a
+    :class:`_Timestamp`, which ``__init__`` assigns directly.
+    """
+    names = tuple(field.name for field in fields(cls))
+    namespace = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in names and key not in ('__dict__', '__weakref__')
+    }
+    namespace['__slots__'] = tuple(
+        f'_{name}' if name in TIMESTAMP_FIELDS else name for name in names
+    )
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    for name in TIMESTAMP_FIELDS:
+        setattr(slotted, name, _Timestamp(slotted.__dict__[f'_{name}']))
+    return slotted
+
+
+@_slotted
+@dataclass(init=False)
 class Event:
     """
     Represents an event in the MustAPI system.
-    
+
+    Instances have no ``__dict__``. Timestamps may also be given as ISO-8601 strings,
+    which are parsed the first time the attribute is read.
+
     Attributes:
         id (str): Unique identifier for the event
         title (str): Event title
@@ -23,24 +84,134 @@ class Event:
     end_time: Optional[datetime] = None
     location: Optional[str] = None
     created_at: Optional[datetime] = None
-    
+
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        description: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        location: Optional[str] = None,
+        created_at: Optional[datetime] = None
+    ):
+        # Timestamps are stored straight into their slots; the descriptors only
+        # come into play when reading
+        self.id = id
+        self.title = title
+        self.description = description
+        self._start_time = start_time
+        self._end_time = end_time
+        self.location = location
+        self._created_at = created_at
+
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Event':
+    def from_dict(cls, data: Dict[str, Any], lazy: bool = False) -> 'Event':
         """
         Create an Event instance from a dictionary.
-        
+
         Args:
             data (dict): Dictionary containing event data
-        
+            lazy (bool, optional): Keep the timestamps as raw strings and parse each one
+                on first access. Invalid timestamps then raise ValueError on access
+                instead of here. Defaults to False.
+
         Returns:
             Event: Instantiated Event object
         """
+        if lazy:
+            return cls(
+                id=data.get('id', ''),
+                title=data.get('title', ''),
+                description=data.get('description'),
+                start_time=data.get('start_time') or None,
+                end_time=data.get('end_time') or None,
+                location=data.get('location'),
+                created_at=data.get('created_at') or None
+            )
         return cls(
             id=data.get('id', ''),
             title=data.get('title', ''),
             description=data.get('description'),
-            start_time=datetime.fromisoformat(data['start_time']) if data.get('start_time') else None,
-            end_time=datetime.fromisoformat(data['end_time']) if data.get('end_time') else None,
+            start_time=parse_timestamp(data['start_time']) if data.get('start_time') else None,
+            end_time=parse_timestamp(data['end_time']) if data.get('end_time') else None,
             location=data.get('location'),
-            created_at=datetime.fromisoformat(data['created_at']) if data.get('created_at') else None
-        )
\ No newline at end of file
+            created_at=parse_timestamp(data['created_at']) if data.get('created_at') else None
+        )
+
+    @classmethod
+    def from_dicts(
+        cls,
+        data: Union[Iterable[Dict[str, Any]], Dict[str, Any], bytes, str],
+        lazy: bool = False,
+        as_batch: bool = False
+    ) -> Union[List['Event'], 'EventBatch']:
+        """
+        Create Events from a whole page in one pass.
+
+        Gives the same result as calling :meth:`from_dict` on every row, without the
+        per-row method call, keyword arguments and repeated key lookups. Timestamp
+        fields whose values repeat within the page (judged on its first rows) are
+        parsed once per distinct string, and those rows share the datetime.
+
+        Args:
+            data: Event dicts, a listing response (``{'events': [...]}``), or the raw
+                JSON body of either as bytes or str (decoded with the fastest
+                installed JSON codec)
+            lazy (bool, optional): Keep the timestamps as raw strings, as in
+                :meth:`from_dict`. Defaults to False.
+            as_batch (bool, optional): Return a columnar ``EventBatch`` instead of a
+                list. Defaults to False.
+
+        Returns:
+            List[Event]: One event per row, or an ``EventBatch``
+        """
+        if isinstance(data, (bytes, bytearray, str)):
+            data = get_codec().loads(data)
+        if isinstance(data, dict):
+            data = data.get('events', [])
+        rows = data if isinstance(data, list) else list(data)
+        if as_batch:
+            from .batch import EventBatch
+            return EventBatch.from_dicts(rows)
+
+        if lazy:
+            start_time = end_time = created_at = _keep_raw
+        else:
+            start_time, end_time, created_at = (
+                _timestamp_decoder(rows, name) for name in TIMESTAMP_FIELDS
+            )
+        # Slots are filled directly, as __init__ would
+        new = object.__new__
+        events: List[Event] = []
+        append = events.append
+        for row in rows:
+            get = row.get
+            event = new(cls)
+            event.id = get('id', '')
+            event.title = get('title', '')
+            event.description = get('description')
+            value = get('start_time')
+            event._start_time = start_time(value) if value else None
+            value = get('end_time')
+            event._end_time = end_time(value) if value else None
+            event.location = get('location')
+            value = get('created_at')
+            event._created_at = created_at(value) if value else None
+            append(event)
+        return events
+
+
+def _keep_raw(value: str) -> str:
+    return value
+
+
+def _timestamp_decoder(rows: List[Dict[str, Any]], name: str) -> Callable[[str], datetime]:
+    """
+    Decoder for field ``name`` of a page: memoizing when the first rows repeat values,
+    since a lookup costs about as much as parsing a value seen only once.
+    """
+    sample = [value for value in (row.get(name) for row in rows[:REPEAT_SAMPLE]) if value]
+    if len(set(sample)) * 2 <= len(sample):
+        return TimestampCache(max_size=len(rows)).parse
+    return parse_timestamp
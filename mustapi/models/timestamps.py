@@ -0,0 +1,104 @@
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+
+# datetime.fromisoformat accepts 'Z', other fraction widths and basic format from 3.11
+_Z_SUFFIX_UNSUPPORTED = sys.version_info < (3, 11)
+_fromisoformat = datetime.fromisoformat
+
+_ISO_8601 = re.compile(
+    r'(\d{4})-?(\d{2})-?(\d{2})'
+    r'(?:[T ](\d{2}):?(\d{2})(?::?(\d{2})(?:[.,](\d+))?)?)?'
+    r'\s*(Z|[+-]\d{2}(?::?\d{2})?)?$',
+    re.IGNORECASE
+)
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Decode an ISO-8601 timestamp as sent by the API.
+
+    Accepts a ``Z`` suffix or a ``±HH:MM`` offset on every supported Python version
+    (``datetime.fromisoformat`` only takes ``Z`` from 3.11). The fixed-width
+    ``YYYY-MM-DDTHH:MM:SS[Z]`` forms the API sends go straight to ``fromisoformat``;
+    anything it rejects falls back to a regular expression.
+
+    Args:
+        value (str): Timestamp, e.g. ``2024-01-15T10:00:00Z``
+
+    Returns:
+        datetime: Timezone-aware when the value carries ``Z`` or an offset, else naive
+
+    Raises:
+        ValueError: If ``value`` is not an ISO-8601 timestamp
+    """
+    if _Z_SUFFIX_UNSUPPORTED and value[-1:] in ('Z', 'z') and len(value) == 20:
+        value = value[:19] + '+00:00'
+    try:
+        return _fromisoformat(value)
+    except ValueError:
+        return _parse_slow(value)
+
+
+def _parse_slow(value: str) -> datetime:
+    """Decode the forms ``fromisoformat`` rejects on this Python version."""
+    match = _ISO_8601.match(value.strip())
+    if match is None:
+        raise ValueError(f'Invalid ISO-8601 timestamp: {value!r}')
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    tzinfo = None
+    if offset is not None:
+        if offset in ('Z', 'z'):
+            tzinfo = timezone.utc
+        else:
+            digits = offset[1:].replace(':', '')
+            delta = timedelta(hours=int(digits[:2]), minutes=int(digits[2:] or 0))
+            tzinfo = timezone.utc if not delta else timezone(-delta if offset[0] == '-' else delta)
+    return datetime(
+        int(year), int(month), int(day),
+        int(hour or 0), int(minute or 0), int(second or 0),
+        int((fraction or '0')[:6].ljust(6, '0')),
+        tzinfo
+    )
+
+
+class TimestampCache:
+    """
+    Memoizing :func:`parse_timestamp`, for decoding many rows that repeat timestamps
+    (events created in one batch, shared start times). A repeated string is parsed
+    once and every row gets the same ``datetime`` object, which also saves memory.
+
+    Each lookup hashes the string, which costs about as much as parsing it on Python
+    3.11+, so use a cache where values are expected to repeat, e.g. one per page. In
+    tight loops, call the bound :meth:`parse` rather than the instance.
+
+    Args:
+        max_size (int, optional): Values kept; the cache is emptied when it is full.
+            Defaults to 4096
+    """
+    __slots__ = ('max_size', '_values')
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._values: Dict[str, datetime] = {}
+
+    def parse(self, value: str) -> datetime:
+        """:func:`parse_timestamp` ``value``, or return the datetime decoded for it before."""
+        parsed = self._values.get(value)
+        if parsed is not None:
+            return parsed
+        parsed = parse_timestamp(value)
+        if len(self._values) >= self.max_size:
+            self._values.clear()
+        self._values[value] = parsed
+        return parsed
+
+    __call__ = parse
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def clear(self) -> None:
+        """Forget all memoized values."""
+        self._values.clear()
@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+# Header names, checked in order, for the remaining quota and the reset time
+REMAINING_HEADERS = ('X-RateLimit-Remaining', 'RateLimit-Remaining')
+RESET_HEADERS = ('X-RateLimit-Reset', 'RateLimit-Reset')
+
+# Reset values above this are treated as Unix timestamps rather than delta-seconds
+_EPOCH_THRESHOLD = 10 ** 9
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that paces requests before they are sent.
+    
+    Args:
+        rate (float, optional): Requests per second to allow. ``None`` disables pacing
+            until the server advertises a limit through response headers. Defaults to None
+        burst (int, optional): Bucket capacity. Defaults to ``max(1, rate)``; without a
+            ``rate`` it follows the rate the headers advertise
+        adapt_to_headers (bool, optional): Adjust the rate from ``X-RateLimit-Remaining`` /
+            ``X-RateLimit-Reset`` style headers on every response. Defaults to True
+        min_rate (float, optional): Lowest rate header adaptation may set. Defaults to 0.1
+    
+    A single instance may be shared by several clients, sync or async, to pace them
+    against one quota.
+    """
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        adapt_to_headers: bool = True,
+        min_rate: float = 0.1
+    ):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate or 1))
+        self._max_burst = self.burst
+        # With neither given, the burst is one second of the header-derived rate
+        self._burst_from_headers = rate is None and burst is None
+        self.adapt_to_headers = adapt_to_headers
+        self.min_rate = min_rate
+        
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        
+        self._acquired = 0
+        self._waited = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+    
+    def _refill(self, now: float) -> None:
+        if self.rate is not None:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def reserve(self) -> float:
+        """
+        Take one token and return how many seconds the caller must wait before sending.
+        
+        Never blocks; use :meth:`acquire` or :meth:`acquire_async` to wait as well.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(0.0, self._blocked_until - now)
+            if self.rate is not None:
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self.rate)
+            
+            self._acquired += 1
+            if wait > 0:
+                self._waited += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            return wait
+    
+    def acquire(self) -> float:
+        """Block until a request may be sent. Returns the seconds waited."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    async def acquire_async(self) -> float:
+        """Coroutine counterpart of :meth:`acquire`."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+    
+    @staticmethod
+    def _header(headers: Mapping[str, str], names) -> Optional[float]:
+        for name in names:
+            value = headers.get(name)
+            if value is not None:
+                try:
+                    return float(value)
+                except ValueError:
+                    return None
+        return None
+    
+    def update_from_headers(self, headers: Optional[Mapping[str, str]]) -> None:
+        """
+        Adapt the rate to the quota the server reports.
+        
+        With both the remaining quota and the reset time known, the rate becomes
+        ``remaining / seconds_until_reset`` and the bucket is clipped to ``remaining``.
+        A limiter created without ``rate`` or ``burst`` resizes its bucket to the new rate.
+        An exhausted quota pauses all callers until the reset.
+        """
+        if not self.adapt_to_headers or not headers:
+            return
+        remaining = self._header(headers, REMAINING_HEADERS)
+        reset = self._header(headers, RESET_HEADERS)
+        if remaining is None or reset is None:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            reset_in = reset - time.time() if reset > _EPOCH_THRESHOLD else reset
+            reset_in = max(0.0, reset_in)
+            self._refill(now)
+            if remaining <= 0:
+                self._blocked_until = max(self._blocked_until, now + reset_in)
+                self._tokens = min(self._tokens, 0.0)
+                return
+            if reset_in > 0:
+                self.rate = max(self.min_rate, remaining / reset_in)
+                if self._burst_from_headers:
+                    self._max_burst = max(1, int(self.rate))
+                self.burst = max(1, min(self._max_burst, int(remaining)))
+            self._tokens = min(self._tokens, remaining)
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of how much pacing has cost callers.
+        
+        Returns:
+            dict: ``acquired`` requests, how many ``waited``, ``total_wait`` and
+            ``max_wait`` in seconds, and the current ``rate``
+        """
+        with self._lock:
+            return {
+                'acquired': self._acquired,
+                'waited': self._waited,
+                'total_wait': self._total_wait,
+                'max_wait': self._max_wait,
+                'rate': self.rate
+            }
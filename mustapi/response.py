@@ -0,0 +1,22 @@
+from typing import Any, Mapping, Optional
+
+class APIResponse(dict):
+    """
+    Decoded JSON object returned by the clients, carrying the HTTP metadata of the
+    response it came from.
+    
+    It is a plain ``dict`` for every other purpose.
+    
+    Attributes:
+        status_code (Optional[int]): HTTP status, or None when served from a fresh cache entry
+        headers (Mapping[str, str]): Response headers (empty for fresh cache hits)
+        timing (Optional[RequestTiming]): Phase timing of the request, when the client
+            was created with ``trace_timing=True``
+    """
+    __slots__ = ('status_code', 'headers', 'timing')
+    
+    def __init__(self, body: Mapping[str, Any], status_code: Optional[int] = None, headers: Optional[Mapping[str, str]] = None):
+        super().__init__(body)
+        self.status_code = status_code
+        self.headers = headers if headers is not None else {}
+        self.timing = None
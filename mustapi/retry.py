@@ -0,0 +1,201 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Collection, List, Optional
+
+from .exceptions import MustAPIError, CircuitOpenError
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+@dataclass
+class RetryAttempt:
+    """
+    Timing and outcome of a single attempt made by :class:`RetryPolicy`.
+    
+    Attributes:
+        attempt (int): 1-based attempt number
+        elapsed (float): Seconds spent on the attempt
+        status_code (Optional[int]): HTTP status of a failed attempt, if any
+        error (Optional[MustAPIError]): Error raised by the attempt, if any
+        delay (float): Seconds slept before the next attempt (0 if none followed)
+    """
+    attempt: int
+    elapsed: float
+    status_code: Optional[int] = None
+    error: Optional[MustAPIError] = None
+    delay: float = 0.0
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for transient API failures.
+    
+    Args:
+        max_attempts (int, optional): Total attempts including the first. Defaults to 3
+        backoff_base (float, optional): Backoff ceiling for the first retry, in seconds;
+            doubled on each further retry. Defaults to 0.5
+        backoff_max (float, optional): Upper bound for the backoff ceiling. Defaults to 30
+        retry_statuses (Collection[int], optional): Status codes worth retrying.
+            Defaults to 429, 502, 503 and 504
+        retry_methods (Collection[str], optional): Methods that are safe to retry.
+            Defaults to the idempotent methods
+        retry_non_idempotent (bool, optional): Also retry POST and other non-idempotent
+            methods. Defaults to False
+        respect_retry_after (bool, optional): Wait for the server's ``Retry-After`` when
+            given instead of the jittered backoff. Defaults to True
+        max_retry_after (float, optional): Give up instead of waiting when ``Retry-After``
+            asks for longer than this many seconds. Defaults to 60
+        on_attempt (callable, optional): Called with a :class:`RetryAttempt` after every
+            attempt, successful or not
+    
+    Failed attempts are attached to the final exception as ``error.attempts``.
+    """
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_statuses: Collection[int] = RETRYABLE_STATUS_CODES,
+        retry_methods: Collection[str] = IDEMPOTENT_METHODS,
+        retry_non_idempotent: bool = False,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+        on_attempt: Optional[Callable[[RetryAttempt], None]] = None
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.retry_non_idempotent = retry_non_idempotent
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.on_attempt = on_attempt
+    
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Parse a ``Retry-After`` header given either as delta-seconds or an HTTP date.
+        
+        Returns:
+            Optional[float]: Seconds to wait, or None when the header is absent or invalid
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    
+    def should_retry(self, method: str, attempt: int, error: MustAPIError) -> bool:
+        """
+        Decide whether a failed attempt is worth repeating.
+        
+        Transport failures (no status code) and the configured statuses are retried,
+        but only for retryable methods and while attempts remain. An open circuit
+        breaker is never retried.
+        """
+        if attempt >= self.max_attempts or isinstance(error, CircuitOpenError):
+            return False
+        if not self.retry_non_idempotent and method.upper() not in self.retry_methods:
+            return False
+        if error.status_code is not None and error.status_code not in self.retry_statuses:
+            return False
+        retry_after = getattr(error, 'retry_after', None)
+        if self.respect_retry_after and retry_after is not None:
+            return retry_after <= self.max_retry_after
+        return True
+    
+    def compute_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Seconds to wait after failed attempt number ``attempt``.
+        
+        Uses the server's ``Retry-After`` when honoured, otherwise full jitter:
+        a uniform draw between 0 and ``min(backoff_max, backoff_base * 2 ** (attempt - 1))``.
+        """
+        if self.respect_retry_after and retry_after is not None:
+            return retry_after
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+    
+    def _record(self, attempts: List[RetryAttempt], record: RetryAttempt) -> None:
+        attempts.append(record)
+        if self.on_attempt is not None:
+            self.on_attempt(record)
+    
+    def _next_delay(
+        self,
+        method: str,
+        attempt: int,
+        started: float,
+        error: MustAPIError,
+        attempts: List[RetryAttempt]
+    ) -> Optional[float]:
+        """Record a failed attempt and return the delay before retrying, or None to give up."""
+        record = RetryAttempt(attempt, time.perf_counter() - started, error.status_code, error)
+        retry = self.should_retry(method, attempt, error)
+        if retry:
+            record.delay = self.compute_delay(attempt, getattr(error, 'retry_after', None))
+        self._record(attempts, record)
+        if not retry:
+            error.attempts = attempts
+            return None
+        return record.delay
+    
+    def call(self, method: str, send: Callable[[], Any]) -> Any:
+        """
+        Run ``send`` until it succeeds or the policy gives up.
+        
+        Args:
+            method (str): HTTP method of the request, used for idempotency checks
+            send (callable): Performs one attempt and raises MustAPIError on failure
+        
+        Returns:
+            The value returned by the successful attempt
+        """
+        attempts: List[RetryAttempt] = []
+        attempt = 1
+        while True:
+            started = time.perf_counter()
+            try:
+                result = send()
+            except MustAPIError as error:
+                delay = self._next_delay(method, attempt, started, error, attempts)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+            else:
+                self._record(attempts, RetryAttempt(attempt, time.perf_counter() - started))
+                return result
+    
+    async def call_async(self, method: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Coroutine counterpart of :meth:`call` that sleeps with ``asyncio.sleep``."""
+        attempts: List[RetryAttempt] = []
+        attempt = 1
+        while True:
+            started = time.perf_counter()
+            try:
+                result = await send()
+            except MustAPIError as error:
+                delay = self._next_delay(method, attempt, started, error, attempts)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+            else:
+                self._record(attempts, RetryAttempt(attempt, time.perf_counter() - started))
+                return result
@@ -0,0 +1,455 @@
+import asyncio
+from collections import deque
+from itertools import chain
+from typing import List, Dict, Any, AsyncIterator, Iterable, Mapping, Optional, Set, Tuple, Union
+from ..exceptions import MustAPIError
+from ..models.batch import EventBatch
+from ..models.event import Event
+from ..tracing import bind_async
+from .bulk import BulkItem, BulkResult, run_bounded_async
+from .loader import AsyncEventLoader
+from .events import BATCH_CREATE_ENDPOINT, ID_FILTER_PARAM, BaseEventService, unique_events
+
+class AsyncEventService(BaseEventService):
+    """
+    asyncio counterpart of :class:`EventService` for event-related API operations.
+    """
+    async def list_events(
+        self, 
+        limit: int = 100, 
+        offset: int = 0, 
+        filters: Optional[Dict[str, Any]] = None,
+        as_batch: bool = False
+    ) -> Union[List[Event], EventBatch]:
+        """
+        Retrieve a list of events.
+        
+        Args:
+            limit (int, optional): Maximum number of events to return. Defaults to 100.
+            offset (int, optional): Pagination offset. Defaults to 0.
+            filters (dict, optional): Additional filters for event retrieval.
+            as_batch (bool, optional): Return the page as a columnar EventBatch. Batches
+                are not added to the event cache. Defaults to False.
+        
+        Returns:
+            List[Event]: List of event objects, or an EventBatch
+        """
+        return (await self._fetch_page(limit, offset, filters, as_batch))[0]
+    
+    async def _fetch_page(
+        self,
+        limit: int,
+        offset: int,
+        filters: Optional[Dict[str, Any]],
+        as_batch: bool = False
+    ) -> Tuple[Union[List[Event], EventBatch], Optional[int]]:
+        """Fetch one page of events along with the total count, if the API reports it."""
+        response = await self._client.get('events', params=self._page_params(limit, offset, filters))
+        return self._decode_page(response, as_batch)
+    
+    async def iter_events(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+        prefetch: bool = True,
+        as_batch: bool = False
+    ) -> AsyncIterator[Union[Event, EventBatch]]:
+        """
+        Lazily iterate over every event matching ``filters``, page by page.
+        
+        While the caller works through one page the next one is fetched in a background
+        task, so at most two pages are held in memory. Iteration stops after the first
+        page shorter than ``page_size``.
+        
+        Args:
+            filters (dict, optional): Additional filters for event retrieval.
+            page_size (int, optional): Events requested per page. Defaults to 100.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to True.
+            as_batch (bool, optional): Yield one EventBatch per page instead of
+                individual events. Defaults to False.
+        
+        Yields:
+            Event: Event objects in server order, or EventBatch pages
+        """
+        async for page in self._iter_pages(filters, page_size, 0, prefetch, as_batch):
+            if as_batch:
+                yield page
+                continue
+            for event in page:
+                yield event
+    
+    async def _iter_pages(
+        self,
+        filters: Optional[Dict[str, Any]],
+        page_size: int,
+        offset: int,
+        prefetch: bool,
+        as_batch: bool = False
+    ) -> AsyncIterator[List[Event]]:
+        """Yield pages from ``offset`` onwards until a short page is returned."""
+        span = self._start_span('events.iter_pages', page_size)
+        fetch = bind_async(span, self.list_events)
+        pending = asyncio.ensure_future(fetch(page_size, offset, filters, as_batch))
+        try:
+            while pending is not None:
+                page = await pending
+                offset += page_size
+                pending = None
+                if len(page) >= page_size:
+                    next_page = fetch(page_size, offset, filters, as_batch)
+                    pending = asyncio.ensure_future(next_page) if prefetch else next_page
+                yield page
+        finally:
+            if isinstance(pending, asyncio.Future):
+                pending.cancel()
+            elif pending is not None:
+                pending.close()
+            if span is not None:
+                span.end()
+    
+    async def iter_events_parallel(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+        max_workers: int = 8,
+        ordered: bool = True
+    ) -> AsyncIterator[Event]:
+        """
+        Iterate over every event matching ``filters``, fetching pages concurrently.
+        
+        Async counterpart of :meth:`EventService.iter_events_parallel`: after the first
+        page reveals the total count, up to ``max_workers`` page requests run as
+        concurrent tasks (still bounded by the client's ``max_concurrency``).
+        
+        Args:
+            filters (dict, optional): Additional filters for event retrieval.
+            page_size (int, optional): Events requested per page. Defaults to 100.
+            max_workers (int, optional): Pages fetched concurrently. Defaults to 8.
+            ordered (bool, optional): Yield pages in offset order; when False pages are
+                yielded as soon as they arrive. Defaults to True.
+        
+        Yields:
+            Event: Event objects
+        """
+        span = self._start_span('events.iter_events_parallel', page_size)
+        try:
+            first_page, total = await bind_async(span, self._fetch_page)(page_size, 0, filters)
+            seen: Set[str] = set()
+            for event in unique_events([first_page], seen):
+                yield event
+            if len(first_page) < page_size:
+                return
+            if total is None:
+                async for page in self._iter_pages(filters, page_size, page_size, True):
+                    for event in unique_events([page], seen):
+                        yield event
+                return
+            async for event in self._iter_remaining(span, filters, page_size, total, max_workers, ordered, seen):
+                yield event
+        finally:
+            if span is not None:
+                span.end()
+    
+    async def _iter_remaining(
+        self,
+        span: Any,
+        filters: Optional[Dict[str, Any]],
+        page_size: int,
+        total: int,
+        max_workers: int,
+        ordered: bool,
+        seen: Set[str]
+    ) -> AsyncIterator[Event]:
+        """Fetch the pages after the first one as concurrent tasks."""
+        fetch = bind_async(span, self.list_events)
+        offsets = self._remaining_offsets(page_size, total)
+        
+        def schedule(offset: int) -> asyncio.Future:
+            return asyncio.ensure_future(fetch(page_size, offset, filters))
+        
+        pending = deque(schedule(offset) for _, offset in zip(range(2 * max_workers), offsets))
+        try:
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    completed, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    done = [task for task in pending if task in completed]
+                    pending = deque(task for task in pending if task not in completed)
+                for task in done:
+                    offset = next(offsets, None)
+                    if offset is not None:
+                        pending.append(schedule(offset))
+                    for event in unique_events([await task], seen):
+                        yield event
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    def enable_batching(self, window: Optional[float] = None, max_batch_size: int = 100) -> AsyncEventLoader:
+        """
+        Route ``get_event`` calls through a :class:`AsyncEventLoader`, so that lookups made
+        independently (e.g. by many resolvers) within ``window`` are fetched together.
+        
+        Args:
+            window (float, optional): Seconds to collect calls for; None batches
+                everything requested within one event loop iteration. Defaults to None
+            max_batch_size (int, optional): Largest batch to fetch at once. Defaults to 100
+        
+        Returns:
+            AsyncEventLoader: The loader, whose ``stats`` report batch sizes
+        """
+        self.loader = AsyncEventLoader(self, window=window, max_batch_size=max_batch_size)
+        return self.loader
+    
+    async def get_event(self, event_id: str, bypass_cache: bool = False) -> Event:
+        """
+        Retrieve a specific event by its ID.
+        
+        Args:
+            event_id (str): Unique identifier for the event
+            bypass_cache (bool, optional): Skip the event cache and fetch a fresh copy,
+                which then replaces the cached one. Defaults to False.
+        
+        Returns:
+            Event: Event object
+        """
+        event = self._cached_event(event_id, bypass_cache)
+        if event is not None:
+            return event
+        if self.loader is not None and not bypass_cache:
+            return await self.loader.load(event_id)
+        
+        return self._decode_event(await self._client.get(f'events/{event_id}'))
+    
+    async def get_events(
+        self,
+        event_ids: Iterable[str],
+        max_workers: int = 8,
+        chunk_size: int = 100,
+        use_id_filter: Optional[bool] = None,
+        bypass_cache: bool = False
+    ) -> Dict[str, Union[Event, Exception]]:
+        """
+        Retrieve many events by id.
+        
+        Async counterpart of :meth:`EventService.get_events`, running up to
+        ``max_workers`` requests as concurrent tasks.
+        
+        Args:
+            event_ids (iterable): Event ids to fetch; duplicates are fetched once
+            max_workers (int, optional): Concurrent requests. Defaults to 8.
+            chunk_size (int, optional): Ids per ``id__in`` request. Defaults to 100.
+            use_id_filter (bool, optional): Force the ``id__in`` filter on or off. By
+                default it is probed and the answer remembered.
+            bypass_cache (bool, optional): Skip the event cache. Defaults to False.
+        
+        Returns:
+            dict: Event id mapped to its Event, or to the exception raised for it
+            (e.g. ResourceNotFoundError), in first-seen order
+        """
+        results, chunks, use_id_filter, forced = self._plan_get_events(
+            event_ids, chunk_size, use_id_filter, bypass_cache
+        )
+        if use_id_filter is not False:
+            singles: List[str] = []
+            async for chunk, outcomes, error in run_bounded_async(
+                lambda chunk: self._get_chunk(chunk, forced), chunks, max_workers
+            ):
+                self._merge_chunk(results, singles, chunk, outcomes)
+            chunks = [singles]
+        
+        async for event_id, event, error in run_bounded_async(
+            lambda event_id: self.get_event(event_id, bypass_cache=True),
+            chain.from_iterable(chunks),
+            max_workers
+        ):
+            results[event_id] = event if error is None else error
+        return results
+    
+    async def _get_chunk(
+        self,
+        chunk: List[str],
+        forced: bool = False
+    ) -> Optional[Dict[str, Union[Event, Exception]]]:
+        """
+        Fetch a chunk of ids with the ``id__in`` filter, or return None if it is ignored.
+        Ids the listing left out are absent from the result; a failed request maps every
+        id of the chunk to its error.
+        """
+        if self._id_filter is False and not forced:
+            return None
+        try:
+            events = await self.list_events(
+                limit=len(chunk), offset=0, filters={ID_FILTER_PARAM: ','.join(chunk)}
+            )
+        except MustAPIError as error:
+            return dict.fromkeys(chunk, error)
+        return self._match_id_filter(chunk, events)
+    
+    async def create_event(self, event_data: Dict[str, Any]) -> Event:
+        """
+        Create a new event.
+        
+        Args:
+            event_data (dict): Event details for creation
+        
+        Returns:
+            Event: Created event object
+        """
+        return self._decode_event(await self._client.post('events', data=event_data))
+    
+    async def create_events(
+        self,
+        events: Iterable[Dict[str, Any]],
+        chunk_size: int = 100,
+        max_workers: int = 8,
+        use_batch: Optional[bool] = None
+    ) -> BulkResult:
+        """
+        Create many events, streaming the input in chunks.
+        
+        Async counterpart of :meth:`EventService.create_events`, running up to
+        ``max_workers`` requests as concurrent tasks.
+        
+        Args:
+            events (iterable): Event details for creation
+            chunk_size (int, optional): Events per batch request. Defaults to 100.
+            max_workers (int, optional): Concurrent requests. Defaults to 8.
+            use_batch (bool, optional): Force the batch endpoint on or off. By default
+                it is probed with the first chunk and the answer remembered.
+        
+        Returns:
+            BulkResult: Outcome per input, keyed by the input's position
+        """
+        result = BulkResult()
+        chunks, use_batch = self._plan_create(events, chunk_size, use_batch)
+        if use_batch is None:
+            first = next(chunks, None)
+            if first is None:
+                return result
+            use_batch = await self._probe_batch_create(first, result)
+            if not use_batch:
+                chunks = chain([first], chunks)
+        
+        if use_batch:
+            async for chunk, outcomes, error in run_bounded_async(self._create_chunk, chunks, max_workers):
+                self._add_chunk(result, chunk, outcomes, error)
+        else:
+            async for (index, event_data), event, error in run_bounded_async(
+                lambda item: self.create_event(item[1]), chain.from_iterable(chunks), max_workers
+            ):
+                result.add(BulkItem(index, event_data, event, error))
+        return result.sorted()
+    
+    async def _create_chunk(
+        self,
+        chunk: List[Tuple[int, Dict[str, Any]]]
+    ) -> List[Tuple[Optional[Event], Optional[Exception]]]:
+        """Post one chunk to the batch endpoint."""
+        return self._chunk_outcomes(
+            chunk, await self._client.post(BATCH_CREATE_ENDPOINT, data=self._batch_payload(chunk))
+        )
+    
+    async def _probe_batch_create(self, chunk: List[Tuple[int, Dict[str, Any]]], result: BulkResult) -> bool:
+        """Try the batch endpoint with the first chunk and remember whether it exists."""
+        try:
+            outcomes = await self._create_chunk(chunk)
+        except MustAPIError as error:
+            return self._probe_result(chunk, result, None, error)
+        return self._probe_result(chunk, result, outcomes)
+    
+    async def update_event(self, event_id: str, event_data: Dict[str, Any]) -> Event:
+        """
+        Update an existing event.
+        
+        Args:
+            event_id (str): Unique identifier for the event
+            event_data (dict): Updated event details
+        
+        Returns:
+            Event: Updated event object
+        """
+        return self._decode_event(await self._client.put(f'events/{event_id}', data=event_data), replace=True)
+    
+    async def update_events(
+        self,
+        updates: Mapping[str, Dict[str, Any]],
+        max_workers: int = 8
+    ) -> BulkResult:
+        """
+        Update many events concurrently.
+        
+        Async counterpart of :meth:`EventService.update_events`.
+        
+        Args:
+            updates (dict): Event id mapped to its updated details
+            max_workers (int, optional): Concurrent requests. Defaults to 8.
+        
+        Returns:
+            BulkResult: Updated Event or exception per event id
+        """
+        result = BulkResult()
+        async for (event_id, event_data), event, error in run_bounded_async(
+            lambda item: self.update_event(*item), updates.items(), max_workers
+        ):
+            result.add(BulkItem(event_id, event_data, event, error))
+        return result
+    
+    async def delete_events(
+        self,
+        event_ids: Optional[Iterable[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        max_workers: int = 8,
+        page_size: int = 100
+    ) -> BulkResult:
+        """
+        Delete many events concurrently, either by id or by listing filters.
+        
+        Async counterpart of :meth:`EventService.delete_events`.
+        
+        Args:
+            event_ids (iterable, optional): Ids of the events to delete
+            filters (dict, optional): Delete every event matching these listing filters
+            max_workers (int, optional): Concurrent requests. Defaults to 8.
+            page_size (int, optional): Events listed per page with ``filters``. Defaults to 100.
+        
+        Returns:
+            BulkResult: Deletion response or exception per event id
+        
+        Raises:
+            ValueError: Unless exactly one of ``event_ids`` and ``filters`` is given
+        """
+        event_ids = self._delete_ids(event_ids, filters)
+        result = BulkResult()
+        if event_ids is not None:
+            await self._delete_batch(event_ids, max_workers, result)
+            return result
+        
+        offset = 0
+        while True:
+            page = await self.list_events(limit=page_size, offset=offset, filters=filters)
+            new_ids = self._unhandled_ids(page, result)
+            await self._delete_batch(new_ids, max_workers, result)
+            offset = self._next_delete_offset(offset, page, new_ids, result)
+            if len(page) < page_size:
+                return result
+    
+    async def _delete_batch(self, event_ids: Iterable[str], max_workers: int, result: BulkResult) -> None:
+        async for event_id, response, error in run_bounded_async(self.delete_event, event_ids, max_workers):
+            result.add(BulkItem(event_id, event_id, response, error))
+    
+    async def delete_event(self, event_id: str) -> Dict[str, Any]:
+        """
+        Delete an event.
+        
+        Args:
+            event_id (str): Unique identifier for the event
+        
+        Returns:
+            dict: Deletion confirmation response
+        """
+        response = await self._client.delete(f'events/{event_id}')
+        if self.cache is not None:
+            self.cache.invalidate(event_id)
+        return response
@@ -1,3 +1,4 @@
+import asyncio
 import secrets
 import hashlib
 from datetime import datetime, timedelta
@@ -7,13 +8,19 @@ import requests
 
 class APIKeyManager:
    @staticmethod
-   def validate_api_key(api_key_prefix: str, base_url: str) -> Dict[str, Any]:
+   def validate_api_key(
+        api_key_prefix: str,
+        base_url: str,
+        session: Optional[requests.Session] = None
+   ) -> Dict[str, Any]:
         """
         Validate an API key by sending a request to an external API endpoint.
 
         Args:
             api_key_prefix (str): Prefix of the API key.
             base_url (str): Base URL of the external application (e.g., http://127.0.0.1:8000).
+            session (requests.Session, optional): Session to send the request through,
+                so the validation call reuses the caller's connection pool.
 
         Returns:
             dict: Validation result with key details or failure reason.
@@ -23,30 +30,71 @@ class APIKeyManager:
         
         try:
             # Make a GET request to the external API
-            response = requests.get(url, timeout=5)
-            
-            # Check for HTTP errors
-            if response.status_code == 404:
-                return {'valid': False, 'reason': 'API key not found'}
-            elif response.status_code != 200:
-                return {'valid': False, 'reason': f'Error from external service: {response.status_code}'}
-            
-            # Parse the response JSON
-            data = response.json()
-            
-            # Validate the key details
-            if not data.get('is_active', False):
-                return {'valid': False, 'reason': 'API key is inactive'}
-            
-            if 'expires_at' in data and data['expires_at'] < datetime.utcnow().isoformat():
-                return {'valid': False, 'reason': 'API key has expired'}
-            
-            # Return valid key details
-            return {
-                'valid': True,
-                'details': data
-            }
+            response = (session or requests).get(url, timeout=5)
+            if response.status_code != 200:
+                return APIKeyManager.check_validation_response(response.status_code, None)
+            return APIKeyManager.check_validation_response(200, response.json())
         
         except requests.exceptions.RequestException as e:
             return {'valid': False, 'reason': f'Failed to connect to external service: {str(e)}'}
 
+   @staticmethod
+   async def validate_api_key_async(
+        api_key_prefix: str,
+        base_url: str,
+        session: Any
+   ) -> Dict[str, Any]:
+        """
+        Coroutine counterpart of :meth:`validate_api_key`, sent through an
+        ``aiohttp.ClientSession`` so the event loop is not blocked.
+
+        Args:
+            api_key_prefix (str): Prefix of the API key.
+            base_url (str): Base URL of the external application.
+            session (aiohttp.ClientSession): Session to send the request through.
+
+        Returns:
+            dict: Validation result with key details or failure reason.
+        """
+        import aiohttp
+
+        url = f"{base_url}/devs/{api_key_prefix}/"
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                if response.status != 200:
+                    return APIKeyManager.check_validation_response(response.status, None)
+                data = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return {'valid': False, 'reason': f'Failed to connect to external service: {str(e) or type(e).__name__}'}
+        return APIKeyManager.check_validation_response(200, data)
+
+   @staticmethod
+   def check_validation_response(status_code: int, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Turn the validation endpoint's answer into a validation result.
+
+        Args:
+            status_code (int): HTTP status of the response.
+            data (dict, optional): Decoded body of a 200 response.
+
+        Returns:
+            dict: Validation result with key details or failure reason.
+        """
+        # Check for HTTP errors
+        if status_code == 404:
+            return {'valid': False, 'reason': 'API key not found'}
+        elif status_code != 200:
+            return {'valid': False, 'reason': f'Error from external service: {status_code}'}
+        
+        # Validate the key details
+        if not data.get('is_active', False):
+            return {'valid': False, 'reason': 'API key is inactive'}
+        
+        if 'expires_at' in data and data['expires_at'] < datetime.utcnow().isoformat():
+            return {'valid': False, 'reason': 'API key has expired'}
+        
+        # Return valid key details
+        return {
+            'valid': True,
+            'details': data
+        }
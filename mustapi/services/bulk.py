@@ -0,0 +1,148 @@
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+)
+
+T = TypeVar('T')
+
+@dataclass
+class BulkItem:
+    """
+    Outcome of one item in a bulk operation.
+    
+    Attributes:
+        key (Any): Input position for creates, event id for fetches, updates and deletes
+        input (Any): The payload or id that was submitted
+        result (Any): Created/fetched/updated Event, or the delete response, on success
+        error (Optional[Exception]): The exception raised for this item, on failure
+    """
+    key: Any
+    input: Any
+    result: Any = None
+    error: Optional[Exception] = None
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkResult:
+    """
+    Per-item outcomes of a bulk operation, keyed by :attr:`BulkItem.key`.
+    
+    Iterating yields :class:`BulkItem` objects in key order for creates and in
+    completion order otherwise.
+    """
+    def __init__(self):
+        self._items: Dict[Any, BulkItem] = {}
+    
+    def add(self, item: BulkItem) -> None:
+        self._items[item.key] = item
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def __iter__(self) -> Iterator[BulkItem]:
+        return iter(self._items.values())
+    
+    def __getitem__(self, key: Any) -> BulkItem:
+        return self._items[key]
+    
+    def __contains__(self, key: Any) -> bool:
+        return key in self._items
+    
+    @property
+    def ok(self) -> bool:
+        """True when every item succeeded."""
+        return all(item.ok for item in self._items.values())
+    
+    @property
+    def succeeded(self) -> List[BulkItem]:
+        return [item for item in self._items.values() if item.ok]
+    
+    @property
+    def failed(self) -> List[BulkItem]:
+        return [item for item in self._items.values() if not item.ok]
+    
+    @property
+    def results(self) -> Dict[Any, Any]:
+        """Successful results keyed by item key."""
+        return {key: item.result for key, item in self._items.items() if item.ok}
+    
+    @property
+    def errors(self) -> Dict[Any, Exception]:
+        """Exceptions keyed by item key."""
+        return {key: item.error for key, item in self._items.items() if not item.ok}
+    
+    def sorted(self) -> 'BulkResult':
+        """Return a copy with items ordered by key."""
+        ordered = BulkResult()
+        for key in sorted(self._items):
+            ordered.add(self._items[key])
+        return ordered
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split an iterable into lists of up to ``size`` items without materializing it."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_bounded(
+    fn: Callable[[T], Any],
+    items: Iterable[T],
+    max_workers: int
+) -> Iterator[Tuple[T, Any, Optional[Exception]]]:
+    """
+    Apply ``fn`` to ``items`` on a thread pool, yielding ``(item, result, error)`` as each
+    call completes.
+    
+    ``items`` is consumed lazily: at most ``2 * max_workers`` calls are queued or running
+    at once, so inputs and outcomes stream rather than accumulate. Exceptions raised by
+    ``fn`` are captured per item.
+    """
+    iterator = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='mustapi-bulk')
+    pending = {executor.submit(fn, item): item for item in islice(iterator, 2 * max_workers)}
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                for next_item in islice(iterator, 1):
+                    pending[executor.submit(fn, next_item)] = next_item
+                error = future.exception()
+                yield item, (None if error is not None else future.result()), error
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def run_bounded_async(
+    fn: Callable[[T], Awaitable[Any]],
+    items: Iterable[T],
+    max_workers: int
+) -> AsyncIterator[Tuple[T, Any, Optional[Exception]]]:
+    """Coroutine counterpart of :func:`run_bounded` using asyncio tasks."""
+    iterator = iter(items)
+    pending = {asyncio.ensure_future(fn(item)): item for item in islice(iterator, max_workers)}
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = pending.pop(task)
+                for next_item in islice(iterator, 1):
+                    pending[asyncio.ensure_future(fn(next_item))] = next_item
+                error = task.exception()
+                yield item, (None if error is not None else task.result()), error
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from ..models.event import Event
+
+class EventCache:
+    """
+    Thread-safe TTL + LRU cache of decoded :class:`Event` objects keyed by id.
+    
+    Args:
+        max_size (int, optional): Maximum number of events kept. Defaults to 1024
+        ttl (float, optional): Seconds an event stays valid after being stored.
+            Defaults to 60
+        populate_on_list (bool, optional): Store events returned by ``list_events``.
+            Defaults to True
+    
+    Cached events are shared between callers and should not be mutated.
+    """
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0, populate_on_list: bool = True):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.populate_on_list = populate_on_list
+        self._entries: 'OrderedDict[str, Tuple[float, Event]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, event_id: str) -> bool:
+        return self.peek(event_id) is not None
+    
+    def peek(self, event_id: str) -> Optional[Event]:
+        """Return a live cached event without touching LRU order or counters."""
+        entry = self._entries.get(str(event_id))
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+    
+    def get(self, event_id: str) -> Optional[Event]:
+        """Return the cached event, or None if it is missing or expired."""
+        key = str(event_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters['misses'] += 1
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                self._counters['expirations'] += 1
+                self._counters['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters['hits'] += 1
+            return entry[1]
+    
+    def set(self, event: Event) -> None:
+        """Store ``event`` under its id, evicting the least recently used beyond ``max_size``."""
+        if not event.id:
+            return
+        key = str(event.id)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, event)
+            self._entries.move_to_end(key)
+            self._counters['stores'] += 1
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._counters['evictions'] += 1
+    
+    def invalidate(self, event_id: str) -> None:
+        """Drop the cached event for ``event_id``, if any."""
+        with self._lock:
+            if self._entries.pop(str(event_id), None) is not None:
+                self._counters['invalidations'] += 1
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache counters.
+        
+        Returns:
+            dict: ``hits``, ``misses``, ``stores``, LRU ``evictions``, TTL
+            ``expirations``, ``invalidations`` and the current ``size``
+        """
+        with self._lock:
+            return dict(self._counters, size=len(self._entries))
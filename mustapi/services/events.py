@@ -1,25 +1,328 @@
-from typing import List, Dict, Any, Optional
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import chain, islice
+from typing import List, Dict, Any, Iterable, Iterator, Mapping, Optional, Set, Tuple, Union
+from ..exceptions import MustAPIError, ValidationError
+from ..models.batch import EventBatch
 from ..models.event import Event
+from ..timing import build_timed
+from ..tracing import bind
+from .bulk import BulkItem, BulkResult, chunked, run_bounded
+from .event_cache import EventCache
+from .loader import AsyncEventLoader, EventLoader
 
-class EventService:
+# Response fields and header that may carry the total size of a listing
+TOTAL_COUNT_FIELDS = ('count', 'total', 'total_count')
+TOTAL_COUNT_HEADER = 'X-Total-Count'
+
+# Server-side bulk creation endpoint, used when the API provides it
+BATCH_CREATE_ENDPOINT = 'events/batch'
+# Statuses meaning the batch endpoint does not exist on this server
+BATCH_UNSUPPORTED_STATUSES = (404, 405, 501)
+# Listing filter selecting events by a comma-separated list of ids
+ID_FILTER_PARAM = 'id__in'
+
+def total_count(response: Dict[str, Any]) -> Optional[int]:
     """
-    Service for handling event-related API operations.
+    Extract the total number of matching events from a listing response, if reported.
+    
+    Looks at the ``count``/``total``/``total_count`` fields first, then the
+    ``X-Total-Count`` header.
+    """
+    for field in TOTAL_COUNT_FIELDS:
+        value = response.get(field)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    header = getattr(response, 'headers', {}).get(TOTAL_COUNT_HEADER)
+    try:
+        return int(header) if header is not None else None
+    except ValueError:
+        return None
+
+def batch_outcomes(
+    chunk: List[Tuple[int, Dict[str, Any]]],
+    response: Dict[str, Any],
+    cache: Optional[EventCache] = None,
+    lazy: bool = False
+) -> List[Tuple[Optional[Event], Optional[Exception]]]:
+    """
+    Pair each input of a batch create with its created event or error.
+    
+    The batch endpoint returns ``{'events': [...]}`` in input order; an entry with an
+    ``error`` key marks an input the server rejected.
+    """
+    created = response.get('events', [])
+    outcomes: List[Tuple[Optional[Event], Optional[Exception]]] = []
+    for position in range(len(chunk)):
+        entry = created[position] if position < len(created) else None
+        if entry is None:
+            outcomes.append((None, MustAPIError("Batch response did not include this event")))
+        elif entry.get('error'):
+            outcomes.append((None, ValidationError(str(entry['error']))))
+        else:
+            event = Event.from_dict(entry, lazy=lazy)
+            if cache is not None:
+                cache.set(event)
+            outcomes.append((event, None))
+    return outcomes
+
+def id_filter_outcomes(
+    chunk: List[str],
+    events: List[Event]
+) -> Optional[Dict[str, Event]]:
+    """
+    Match an ``id__in`` listing against the requested ids.
+    
+    Returns None when the listing contains ids that were not asked for, which means the
+    server ignored the filter; otherwise the requested ids that came back. A requested id
+    missing from the listing is not proof that it does not exist (the listing may be
+    paginated, capped or filtered by visibility), so callers fetch those individually.
+    """
+    requested = set(chunk)
+    found = {event.id: event for event in events}
+    if not set(found) <= requested:
+        return None
+    return found
+
+def unique_events(pages: Iterable[List[Event]], seen: Set[str]) -> Iterator[Event]:
+    """Flatten pages, skipping events whose id was already yielded."""
+    for page in pages:
+        for event in page:
+            if event.id:
+                if event.id in seen:
+                    continue
+                seen.add(event.id)
+            yield event
+
+class BaseEventService:
+    """
+    State and request-independent logic shared by :class:`EventService` and
+    :class:`~mustapi.services.async_events.AsyncEventService`.
+    
+    Page planning, response decoding, ``id__in`` and batch outcome mapping and the
+    bookkeeping of bulk operations live here; subclasses only send the requests.
     """
-    def __init__(self, client):
+    def __init__(self, client, cache: Optional[EventCache] = None):
         """
-        Initialize the EventService with the main API client.
+        Initialize the service with the main API client.
         
         Args:
-            client: Main MustAPIClient instance
+            client: Main API client instance
+            cache (EventCache, optional): Cache of decoded events keyed by id
         """
         self._client = client
+        self.cache = cache
+        # Whether the server has BATCH_CREATE_ENDPOINT / honours ID_FILTER_PARAM;
+        # None until first probed
+        self._batch_create: Optional[bool] = None
+        self._id_filter: Optional[bool] = None
+        # Set by enable_batching; routes get_event through a batching loader
+        self.loader: Optional[Union[EventLoader, AsyncEventLoader]] = None
+        # Passed to Event.from_dict: keep timestamps as strings until first read
+        self.lazy_timestamps = False
+    
+    def disable_batching(self) -> None:
+        """Fetch each ``get_event`` call individually again."""
+        self.loader = None
+    
+    def _start_span(self, name: str, page_size: int) -> Any:
+        """Span grouping the page requests of one iteration, when the client traces."""
+        tracer = getattr(self._client, 'tracer', None)
+        if tracer is None:
+            return None
+        return tracer.start_span(name, {'mustapi.page_size': page_size})
+    
+    @staticmethod
+    def _page_params(limit: int, offset: int, filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            'limit': limit,
+            'offset': offset,
+            **(filters or {})
+        }
+    
+    def _decode_page(
+        self,
+        response: Dict[str, Any],
+        as_batch: bool
+    ) -> Tuple[Union[List[Event], EventBatch], Optional[int]]:
+        """Decode a listing response into its events and the total count, if reported."""
+        events = build_timed(
+            response,
+            lambda: Event.from_dicts(
+                response.get('events', []), lazy=self.lazy_timestamps, as_batch=as_batch
+            )
+        )
+        if as_batch:
+            return events, total_count(response)
+        if self.cache is not None and self.cache.populate_on_list:
+            for event in events:
+                self.cache.set(event)
+        return events, total_count(response)
+    
+    def _decode_event(self, response: Dict[str, Any], replace: bool = False) -> Event:
+        """Decode a single event response and cache it, replacing any cached copy."""
+        event = build_timed(response, lambda: Event.from_dict(response, lazy=self.lazy_timestamps))
+        if self.cache is not None:
+            if replace:
+                self.cache.invalidate(event.id)
+            self.cache.set(event)
+        return event
+    
+    def _cached_event(self, event_id: str, bypass_cache: bool) -> Optional[Event]:
+        if self.cache is None or bypass_cache:
+            return None
+        return self.cache.get(event_id)
+    
+    def _plan_get_events(
+        self,
+        event_ids: Iterable[str],
+        chunk_size: int,
+        use_id_filter: Optional[bool],
+        bypass_cache: bool
+    ) -> Tuple[Dict[str, Union[Event, Exception, None]], Iterator[List[str]], Optional[bool], bool]:
+        """
+        Deduplicate ``event_ids``, take what the event cache holds and split the rest
+        into chunks.
+        
+        Returns:
+            tuple: Results in first-seen order (None where still to fetch), the chunks to
+            fetch, whether to use the ``id__in`` filter and whether the caller forced it
+        """
+        results: Dict[str, Union[Event, Exception, None]] = dict.fromkeys(str(event_id) for event_id in event_ids)
+        missing = list(results)
+        if self.cache is not None and not bypass_cache:
+            for event_id in missing:
+                results[event_id] = self.cache.get(event_id)
+            missing = [event_id for event_id in missing if results[event_id] is None]
+        
+        forced = use_id_filter is True
+        if use_id_filter is None:
+            use_id_filter = self._id_filter
+        return results, chunked(missing, chunk_size), use_id_filter, forced
+    
+    @staticmethod
+    def _merge_chunk(
+        results: Dict[str, Union[Event, Exception, None]],
+        singles: List[str],
+        chunk: List[str],
+        outcomes: Optional[Dict[str, Union[Event, Exception]]]
+    ) -> None:
+        """Record an ``id__in`` chunk's outcomes, queueing ids it did not settle for single GETs."""
+        if outcomes is None:
+            singles.extend(chunk)
+            return
+        results.update(outcomes)
+        # Confirm ids the listing left out with a single GET, which reports a 404
+        singles.extend(event_id for event_id in chunk if event_id not in outcomes)
+    
+    def _match_id_filter(self, chunk: List[str], events: List[Event]) -> Optional[Dict[str, Event]]:
+        """Match an ``id__in`` listing against its chunk, remembering whether the filter works."""
+        outcomes = id_filter_outcomes(chunk, events)
+        if outcomes is None:
+            self._id_filter = False
+        elif events:
+            # Only requested ids came back. An empty listing proves nothing either way
+            self._id_filter = True
+        return outcomes
+    
+    def _plan_create(
+        self,
+        events: Iterable[Dict[str, Any]],
+        chunk_size: int,
+        use_batch: Optional[bool]
+    ) -> Tuple[Iterator[List[Tuple[int, Dict[str, Any]]]], Optional[bool]]:
+        """Chunk the numbered inputs; ``use_batch`` stays None when the endpoint is yet to be probed."""
+        if use_batch is None:
+            use_batch = self._batch_create
+        return chunked(enumerate(events), chunk_size), use_batch
+    
+    @staticmethod
+    def _batch_payload(chunk: List[Tuple[int, Dict[str, Any]]]) -> Dict[str, Any]:
+        return {'events': [event_data for _, event_data in chunk]}
+    
+    def _chunk_outcomes(
+        self,
+        chunk: List[Tuple[int, Dict[str, Any]]],
+        response: Dict[str, Any]
+    ) -> List[Tuple[Optional[Event], Optional[Exception]]]:
+        return batch_outcomes(chunk, response, self.cache, self.lazy_timestamps)
+    
+    @staticmethod
+    def _add_chunk(
+        result: BulkResult,
+        chunk: List[Tuple[int, Dict[str, Any]]],
+        outcomes: Optional[List[Tuple[Optional[Event], Optional[Exception]]]],
+        error: Optional[Exception] = None
+    ) -> None:
+        """Record a batch create's outcome per input, or ``error`` for all of them."""
+        for position, (index, event_data) in enumerate(chunk):
+            event, item_error = outcomes[position] if error is None else (None, error)
+            result.add(BulkItem(index, event_data, event, item_error))
+    
+    def _probe_result(
+        self,
+        chunk: List[Tuple[int, Dict[str, Any]]],
+        result: BulkResult,
+        outcomes: Optional[List[Tuple[Optional[Event], Optional[Exception]]]],
+        error: Optional[MustAPIError] = None
+    ) -> bool:
+        """
+        Remember whether the batch endpoint exists from the first chunk's outcome.
+        
+        Returns:
+            bool: True when the chunk was handled by the batch endpoint and recorded
+        """
+        if error is not None and error.status_code in BATCH_UNSUPPORTED_STATUSES:
+            self._batch_create = False
+            return False
+        if error is None:
+            self._batch_create = True
+        self._add_chunk(result, chunk, outcomes, error)
+        return True
+    
+    @staticmethod
+    def _remaining_offsets(page_size: int, total: int) -> Iterator[int]:
+        """Offsets of the pages after the first one of a listing with ``total`` events."""
+        return iter(range(page_size, total, page_size))
+    
+    @staticmethod
+    def _delete_ids(
+        event_ids: Optional[Iterable[str]],
+        filters: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, None]]:
+        """
+        Deduplicated ids to delete, or None when deleting by ``filters``.
+        
+        Raises:
+            ValueError: Unless exactly one of ``event_ids`` and ``filters`` is given
+        """
+        if (event_ids is None) == (filters is None):
+            raise ValueError("Pass either event_ids or filters")
+        if event_ids is None:
+            return None
+        return dict.fromkeys(str(event_id) for event_id in event_ids)
+    
+    @staticmethod
+    def _unhandled_ids(page: List[Event], result: BulkResult) -> List[str]:
+        return [event.id for event in page if event.id and event.id not in result]
     
+    @staticmethod
+    def _next_delete_offset(offset: int, page: List[Event], new_ids: List[str], result: BulkResult) -> int:
+        """Offset of the next page, skipping only the events that are still listed."""
+        # Events still listed: failed deletions plus ids already handled earlier
+        return offset + len(page) - sum(1 for event_id in new_ids if result[event_id].ok)
+
+class EventService(BaseEventService):
+    """
+    Service for handling event-related API operations.
+    """
     def list_events(
         self, 
         limit: int = 100, 
         offset: int = 0, 
-        filters: Optional[Dict[str, Any]] = None
-    ) -> List[Event]:
+        filters: Optional[Dict[str, Any]] = None,
+        as_batch: bool = False
+    ) -> Union[List[Event], EventBatch]:
         """
         Retrieve a list of events.
         
@@ -27,31 +330,274 @@ class EventService:
             limit (int, optional): Maximum number of events to return. Defaults to 100.
             offset (int, optional): Pagination offset. Defaults to 0.
             filters (dict, optional): Additional filters for event retrieval.
+            as_batch (bool, optional): Return the page as a columnar EventBatch. Batches
+                are not added to the event cache. Defaults to False.
         
         Returns:
-            List[Event]: List of event objects
+            List[Event]: List of event objects, or an EventBatch
         """
-        params = {
-            'limit': limit,
-            'offset': offset,
-            **(filters or {})
-        }
+        return self._fetch_page(limit, offset, filters, as_batch)[0]
+    
+    def _fetch_page(
+        self,
+        limit: int,
+        offset: int,
+        filters: Optional[Dict[str, Any]],
+        as_batch: bool = False
+    ) -> Tuple[Union[List[Event], EventBatch], Optional[int]]:
+        """Fetch one page of events along with the total count, if the API reports it."""
+        response = self._client.get('events', params=self._page_params(limit, offset, filters))
+        return self._decode_page(response, as_batch)
+    
+    def iter_events(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+        prefetch: bool = True,
+        as_batch: bool = False
+    ) -> Iterator[Union[Event, EventBatch]]:
+        """
+        Lazily iterate over every event matching ``filters``, page by page.
+        
+        While the caller works through one page the next one is fetched on a background
+        thread, so at most two pages are held in memory. Iteration stops after the first
+        page shorter than ``page_size``.
         
-        response = self._client.get('events', params=params)
-        return [Event.from_dict(event_data) for event_data in response.get('events', [])]
+        Args:
+            filters (dict, optional): Additional filters for event retrieval.
+            page_size (int, optional): Events requested per page. Defaults to 100.
+            prefetch (bool, optional): Fetch the next page in the background. Defaults to True.
+            as_batch (bool, optional): Yield one EventBatch per page instead of
+                individual events. Defaults to False.
+        
+        Yields:
+            Event: Event objects in server order, or EventBatch pages
+        """
+        for page in self._iter_pages(filters, page_size, 0, prefetch, as_batch):
+            if as_batch:
+                yield page
+            else:
+                yield from page
+    
+    def _iter_pages(
+        self,
+        filters: Optional[Dict[str, Any]],
+        page_size: int,
+        offset: int,
+        prefetch: bool,
+        as_batch: bool = False
+    ) -> Iterator[List[Event]]:
+        """Yield pages from ``offset`` onwards until a short page is returned."""
+        span = self._start_span('events.iter_pages', page_size)
+        fetch = bind(span, self.list_events)
+        if not prefetch:
+            try:
+                while True:
+                    page = fetch(page_size, offset, filters, as_batch)
+                    yield page
+                    if len(page) < page_size:
+                        return
+                    offset += page_size
+            finally:
+                if span is not None:
+                    span.end()
+        
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='mustapi-prefetch')
+        pending = executor.submit(fetch, page_size, offset, filters, as_batch)
+        try:
+            while pending is not None:
+                page = pending.result()
+                offset += page_size
+                pending = (
+                    executor.submit(fetch, page_size, offset, filters, as_batch)
+                    if len(page) >= page_size else None
+                )
+                yield page
+        finally:
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
+            if span is not None:
+                span.end()
+    
+    def iter_events_parallel(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+        max_workers: int = 8,
+        ordered: bool = True
+    ) -> Iterator[Event]:
+        """
+        Iterate over every event matching ``filters``, fetching pages concurrently.
+        
+        The first page reveals the total count (``count``/``total``/``total_count`` in the
+        body, or the ``X-Total-Count`` header); the remaining offsets are then fetched on
+        a pool of ``max_workers`` threads with at most ``2 * max_workers`` pages buffered.
+        Events that shift between pages while the listing changes are yielded once. If
+        the API does not report a total, this falls back to :meth:`iter_events`.
+        
+        Args:
+            filters (dict, optional): Additional filters for event retrieval.
+            page_size (int, optional): Events requested per page. Defaults to 100.
+            max_workers (int, optional): Pages fetched concurrently. Defaults to 8.
+            ordered (bool, optional): Yield pages in offset order; when False pages are
+                yielded as soon as they arrive. Defaults to True.
+        
+        Yields:
+            Event: Event objects
+        """
+        span = self._start_span('events.iter_events_parallel', page_size)
+        try:
+            first_page, total = bind(span, self._fetch_page)(page_size, 0, filters)
+            seen: Set[str] = set()
+            yield from unique_events([first_page], seen)
+            if len(first_page) < page_size:
+                return
+            if total is None:
+                yield from unique_events(self._iter_pages(filters, page_size, page_size, True), seen)
+                return
+            yield from self._iter_remaining(span, filters, page_size, total, max_workers, ordered, seen)
+        finally:
+            if span is not None:
+                span.end()
+    
+    def _iter_remaining(
+        self,
+        span: Any,
+        filters: Optional[Dict[str, Any]],
+        page_size: int,
+        total: int,
+        max_workers: int,
+        ordered: bool,
+        seen: Set[str]
+    ) -> Iterator[Event]:
+        """Fetch the pages after the first one on a thread pool."""
+        fetch = bind(span, self.list_events)
+        offsets = self._remaining_offsets(page_size, total)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='mustapi-pages')
+        pending = deque(
+            executor.submit(fetch, page_size, offset, filters)
+            for offset in islice(offsets, 2 * max_workers)
+        )
+        try:
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    done = [future for future in pending if future in completed]
+                    pending = deque(future for future in pending if future not in completed)
+                for future in done:
+                    offset = next(offsets, None)
+                    if offset is not None:
+                        pending.append(executor.submit(fetch, page_size, offset, filters))
+                    yield from unique_events([future.result()], seen)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    def enable_batching(self, window: float = 0.002, max_batch_size: int = 100) -> EventLoader:
+        """
+        Route ``get_event`` calls through a :class:`EventLoader`, so that lookups made
+        independently (e.g. by many resolvers) within ``window`` are fetched together.
+        
+        Args:
+            window (float, optional): Seconds to collect calls for. Defaults to 0.002
+            max_batch_size (int, optional): Largest batch to fetch at once. Defaults to 100
+        
+        Returns:
+            EventLoader: The loader, whose ``stats`` report batch sizes
+        """
+        self.loader = EventLoader(self, window=window, max_batch_size=max_batch_size)
+        return self.loader
     
-    def get_event(self, event_id: str) -> Event:
+    def get_event(self, event_id: str, bypass_cache: bool = False) -> Event:
         """
         Retrieve a specific event by its ID.
         
         Args:
             event_id (str): Unique identifier for the event
+            bypass_cache (bool, optional): Skip the event cache and fetch a fresh copy,
+                which then replaces the cached one. Defaults to False.
         
         Returns:
             Event: Event object
         """
-        response = self._client.get(f'events/{event_id}')
-        return Event.from_dict(response)
+        event = self._cached_event(event_id, bypass_cache)
+        if event is not None:
+            return event
+        if self.loader is not None and not bypass_cache:
+            return self.loader.load(event_id)
+        
+        return self._decode_event(self._client.get(f'events/{event_id}'))
+    
+    def get_events(
+        self,
+        event_ids: Iterable[str],
+        max_workers: int = 8,
+        chunk_size: int = 100,
+        use_id_filter: Optional[bool] = None,
+        bypass_cache: bool = False
+    ) -> Dict[str, Union[Event, Exception]]:
+        """
+        Retrieve many events by id.
+        
+        Ids are deduplicated and served from the event cache where possible. The rest
+        are fetched through the listing endpoint's ``id__in`` filter, ``chunk_size`` ids
+        per request, when the server honours it; otherwise with concurrent single GETs.
+        Either way up to ``max_workers`` requests run at once.
+        
+        Args:
+            event_ids (iterable): Event ids to fetch; duplicates are fetched once
+            max_workers (int, optional): Concurrent requests. Defaults to 8.
+            chunk_size (int, optional): Ids per ``id__in`` request. Defaults to 100.
+            use_id_filter (bool, optional): Force the ``id__in`` filter on or off. By
+                default it is probed with the first chunk and the answer remembered.
+            bypass_cache (bool, optional): Skip the event cache. Defaults to False.
+        
+        Returns:
+            dict: Event id mapped to its Event, or to the exception raised for it
+            (e.g. ResourceNotFoundError), in first-seen order
+        """
+        results, chunks, use_id_filter, forced = self._plan_get_events(
+            event_ids, chunk_size, use_id_filter, bypass_cache
+        )
+        if use_id_filter is not False:
+            singles: List[str] = []
+            for chunk, outcomes, error in run_bounded(
+                lambda chunk: self._get_chunk(chunk, forced), chunks, max_workers
+            ):
+                self._merge_chunk(results, singles, chunk, outcomes)
+            chunks = [singles]
+        
+        for event_id, event, error in run_bounded(
+            lambda event_id: self.get_event(event_id, bypass_cache=True),
+            chain.from_iterable(chunks),
+            max_workers
+        ):
+            results[event_id] = event if error is None else error
+        return results
+    
+    def _get_chunk(
+        self,
+        chunk: List[str],
+        forced: bool = False
+    ) -> Optional[Dict[str, Union[Event, Exception]]]:
+        """
+        Fetch a chunk of ids with the ``id__in`` filter, or return None if it is ignored.
+        Ids the listing left out are absent from the result; a failed request maps every
+        id of the chunk to its error.
+        """
+        if self._id_filter is False and not forced:
+            return None
+        try:
+            events = self.list_events(
+                limit=len(chunk), offset=0, filters={ID_FILTER_PARAM: ','.join(chunk)}
+            )
+        except MustAPIError as error:
+            return dict.fromkeys(chunk, error)
+        return self._match_id_filter(chunk, events)
     
     def create_event(self, event_data: Dict[str, Any]) -> Event:
         """
@@ -63,8 +609,69 @@ class EventService:
         Returns:
             Event: Created event object
         """
-        response = self._client.post('events', data=event_data)
-        return Event.from_dict(response)
+        return self._decode_event(self._client.post('events', data=event_data))
+    
+    def create_events(
+        self,
+        events: Iterable[Dict[str, Any]],
+        chunk_size: int = 100,
+        max_workers: int = 8,
+        use_batch: Optional[bool] = None
+    ) -> BulkResult:
+        """
+        Create many events, streaming the input in chunks.
+        
+        Chunks are posted to the server's batch endpoint when it exists; otherwise each
+        event is posted individually. Either way up to ``max_workers`` requests run
+        concurrently and the input iterable is consumed lazily. Failures are captured
+        per event instead of aborting the whole import.
+        
+        Args:
+            events (iterable): Event details for creation
+            chunk_size (int, optional): Events per batch request. Defaults to 100.
+            max_workers (int, optional): Concurrent requests. Defaults to 8.
+            use_batch (bool, optional): Force the batch endpoint on or off. By default
+                it is probed with the first chunk and the answer remembered.
+        
+        Returns:
+            BulkResult: Outcome per input, keyed by the input's position
+        """
+        result = BulkResult()
+        chunks, use_batch = self._plan_create(events, chunk_size, use_batch)
+        if use_batch is None:
+            first = next(chunks, None)
+            if first is None:
+                return result
+            use_batch = self._probe_batch_create(first, result)
+            if not use_batch:
+                chunks = chain([first], chunks)
+        
+        if use_batch:
+            for chunk, outcomes, error in run_bounded(self._create_chunk, chunks, max_workers):
+                self._add_chunk(result, chunk, outcomes, error)
+        else:
+            for (index, event_data), event, error in run_bounded(
+                lambda item: self.create_event(item[1]), chain.from_iterable(chunks), max_workers
+            ):
+                result.add(BulkItem(index, event_data, event, error))
+        return result.sorted()
+    
+    def _create_chunk(
+        self,
+        chunk: List[Tuple[int, Dict[str, Any]]]
+    ) -> List[Tuple[Optional[Event], Optional[Exception]]]:
+        """Post one chunk to the batch endpoint."""
+        return self._chunk_outcomes(
+            chunk, self._client.post(BATCH_CREATE_ENDPOINT, data=self._batch_payload(chunk))
+        )
+    
+    def _probe_batch_create(self, chunk: List[Tuple[int, Dict[str, Any]]], result: BulkResult) -> bool:
+        """Try the batch endpoint with the first chunk and remember whether it exists."""
+        try:
+            outcomes = self._create_chunk(chunk)
+        except MustAPIError as error:
+            return self._probe_result(chunk, result, None, error)
+        return self._probe_result(chunk, result, outcomes)
     
     def update_event(self, event_id: str, event_data: Dict[str, Any]) -> Event:
         """
@@ -77,8 +684,78 @@ class EventService:
         Returns:
             Event: Updated event object
         """
-        response = self._client.put(f'events/{event_id}', data=event_data)
-        return Event.from_dict(response)
+        return self._decode_event(self._client.put(f'events/{event_id}', data=event_data), replace=True)
+    
+    def update_events(
+        self,
+        updates: Mapping[str, Dict[str, Any]],
+        max_workers: int = 8
+    ) -> BulkResult:
+        """
+        Update many events concurrently.
+        
+        Each update goes through the client like :meth:`update_event`, so retry, rate
+        limit and circuit breaker settings apply per request.
+        
+        Args:
+            updates (dict): Event id mapped to its updated details
+            max_workers (int, optional): Concurrent requests. Defaults to 8.
+        
+        Returns:
+            BulkResult: Updated Event or exception per event id
+        """
+        result = BulkResult()
+        for (event_id, event_data), event, error in run_bounded(
+            lambda item: self.update_event(*item), updates.items(), max_workers
+        ):
+            result.add(BulkItem(event_id, event_data, event, error))
+        return result
+    
+    def delete_events(
+        self,
+        event_ids: Optional[Iterable[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        max_workers: int = 8,
+        page_size: int = 100
+    ) -> BulkResult:
+        """
+        Delete many events concurrently, either by id or by listing filters.
+        
+        With ``filters``, matching ids are streamed from the listing endpoint a page at a
+        time and deleted as they arrive. Because deleted events drop out of the listing,
+        each page is requested at an offset that only skips events which could not be
+        deleted.
+        
+        Args:
+            event_ids (iterable, optional): Ids of the events to delete
+            filters (dict, optional): Delete every event matching these listing filters
+            max_workers (int, optional): Concurrent requests. Defaults to 8.
+            page_size (int, optional): Events listed per page with ``filters``. Defaults to 100.
+        
+        Returns:
+            BulkResult: Deletion response or exception per event id
+        
+        Raises:
+            ValueError: Unless exactly one of ``event_ids`` and ``filters`` is given
+        """
+        event_ids = self._delete_ids(event_ids, filters)
+        result = BulkResult()
+        if event_ids is not None:
+            self._delete_batch(event_ids, max_workers, result)
+            return result
+        
+        offset = 0
+        while True:
+            page = self.list_events(limit=page_size, offset=offset, filters=filters)
+            new_ids = self._unhandled_ids(page, result)
+            self._delete_batch(new_ids, max_workers, result)
+            offset = self._next_delete_offset(offset, page, new_ids, result)
+            if len(page) < page_size:
+                return result
+    
+    def _delete_batch(self, event_ids: Iterable[str], max_workers: int, result: BulkResult) -> None:
+        for event_id, response, error in run_bounded(self.delete_event, event_ids, max_workers):
+            result.add(BulkItem(event_id, event_id, response, error))
     
     def delete_event(self, event_id: str) -> Dict[str, Any]:
         """
@@ -90,4 +767,7 @@ class EventService:
         Returns:
             dict: Deletion confirmation response
         """
-        return self._client.delete(f'events/{event_id}')
\ No newline at end of file
+        response = self._client.delete(f'events/{event_id}')
+        if self.cache is not None:
+            self.cache.invalidate(event_id)
+        return response
\ No newline at end of file
@@ -0,0 +1,223 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Set
+
+from ..models.event import Event
+
+def _bucket(size: int) -> int:
+    """Smallest power of two holding ``size``, used as a histogram bucket."""
+    bucket = 1
+    while bucket < size:
+        bucket *= 2
+    return bucket
+
+
+class _LoaderStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.batches = 0
+        self.histogram: Dict[int, int] = {}
+    
+    def record_load(self) -> None:
+        with self._lock:
+            self.loads += 1
+    
+    def record_batch(self, size: int) -> None:
+        with self._lock:
+            self.batches += 1
+            bucket = _bucket(size)
+            self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'loads': self.loads,
+                'batches': self.batches,
+                'batch_size_histogram': dict(sorted(self.histogram.items()))
+            }
+
+
+class _Batch:
+    __slots__ = ('futures', 'ready')
+    
+    def __init__(self):
+        self.futures: Dict[str, Future] = {}
+        self.ready = threading.Event()
+
+
+class EventLoader:
+    """
+    Collects ``get_event`` calls made from many threads within a short window and
+    resolves them with one :meth:`EventService.get_events` call.
+    
+    The first caller in a window waits up to ``window`` seconds (or until the batch
+    reaches ``max_batch_size``) and then dispatches the batch; every caller receives
+    its own event or exception. Duplicate ids in a batch are fetched once.
+    
+    Args:
+        events (EventService): Service used to fetch batches
+        window (float, optional): Seconds to collect calls for. Defaults to 0.002
+        max_batch_size (int, optional): Dispatch as soon as this many ids are queued.
+            Defaults to 100
+    """
+    def __init__(self, events, window: float = 0.002, max_batch_size: int = 100):
+        self._events = events
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._batch: Optional[_Batch] = None
+        self._stats = _LoaderStats()
+    
+    def load(self, event_id: str) -> Event:
+        """
+        Return the event with ``event_id``, fetched as part of a batch.
+        
+        Raises:
+            ResourceNotFoundError: When the event does not exist
+            MustAPIError: When fetching it failed
+        """
+        event_id = str(event_id)
+        self._stats.record_load()
+        with self._lock:
+            batch = self._batch
+            leader = batch is None
+            if leader:
+                batch = self._batch = _Batch()
+            future = batch.futures.get(event_id)
+            if future is None:
+                future = batch.futures[event_id] = Future()
+            full = len(batch.futures) >= self.max_batch_size
+            if full:
+                self._batch = None
+        
+        if full:
+            batch.ready.set()
+        if leader:
+            batch.ready.wait(self.window)
+            with self._lock:
+                if self._batch is batch:
+                    self._batch = None
+            self._dispatch(batch)
+        return future.result()
+    
+    def _dispatch(self, batch: _Batch) -> None:
+        self._stats.record_batch(len(batch.futures))
+        try:
+            results = self._events.get_events(list(batch.futures))
+        except Exception as error:
+            for future in batch.futures.values():
+                future.set_exception(error)
+            return
+        for event_id, future in batch.futures.items():
+            value = results.get(event_id)
+            if isinstance(value, Exception):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Batching counters.
+        
+        Returns:
+            dict: Total ``loads``, dispatched ``batches`` and a ``batch_size_histogram``
+            mapping power-of-two size buckets to batch counts
+        """
+        return self._stats.snapshot()
+
+
+class AsyncEventLoader:
+    """
+    asyncio counterpart of :class:`EventLoader`.
+    
+    With ``window=None`` (the default) a batch is dispatched as soon as the event loop
+    gets to run callbacks again, collecting every ``load`` made by tasks that were ready
+    in the same loop iteration, e.g. all resolvers started by one ``gather``.
+    
+    Args:
+        events (AsyncEventService): Service used to fetch batches
+        window (float, optional): Seconds to collect calls for instead of one loop
+            iteration. Defaults to None
+        max_batch_size (int, optional): Dispatch as soon as this many ids are queued.
+            Defaults to 100
+    """
+    def __init__(self, events, window: Optional[float] = None, max_batch_size: int = 100):
+        self._events = events
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._batch: Optional[Dict[str, asyncio.Future]] = None
+        self._timer: Optional[asyncio.Handle] = None
+        # Dispatches in flight; the event loop only keeps weak references to tasks
+        self._tasks: Set[asyncio.Future] = set()
+        self._stats = _LoaderStats()
+    
+    async def load(self, event_id: str) -> Event:
+        """
+        Return the event with ``event_id``, fetched as part of a batch.
+        
+        Raises:
+            ResourceNotFoundError: When the event does not exist
+            MustAPIError: When fetching it failed
+        """
+        event_id = str(event_id)
+        self._stats.record_load()
+        loop = asyncio.get_running_loop()
+        if self._batch is None:
+            self._batch = {}
+            if self.window is None:
+                self._timer = loop.call_soon(self._flush)
+            else:
+                self._timer = loop.call_later(self.window, self._flush)
+        batch = self._batch
+        future = batch.get(event_id)
+        if future is None:
+            future = batch[event_id] = loop.create_future()
+        if len(batch) >= self.max_batch_size:
+            self._timer.cancel()
+            self._flush()
+        return await asyncio.shield(future)
+    
+    def _flush(self) -> None:
+        batch, self._batch, self._timer = self._batch, None, None
+        if batch:
+            task = asyncio.ensure_future(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _dispatch(self, batch: Dict[str, asyncio.Future]) -> None:
+        self._stats.record_batch(len(batch))
+        try:
+            results = await self._events.get_events(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as error:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for event_id, future in batch.items():
+            if future.done():
+                continue
+            value = results.get(event_id)
+            if isinstance(value, Exception):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+    
+    async def close(self) -> None:
+        """Dispatch the batch still being collected and wait for every batch in flight."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Batching counters, as for :attr:`EventLoader.stats`."""
+        return self._stats.snapshot()
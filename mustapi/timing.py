@@ -0,0 +1,235 @@
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+T = TypeVar('T')
+
+# Phases of one HTTP attempt, in the order they happen
+PHASES = ('encode', 'acquire', 'dns', 'connect', 'tls', 'ttfb', 'download', 'decode', 'model')
+# Phases complete once the body has been read; the rest are reported as they finish
+NETWORK_PHASES = PHASES[1:7]
+
+
+class RequestTiming:
+    """
+    Where the time of one HTTP attempt went, in seconds. Phases that did not happen
+    (e.g. ``dns`` on a reused connection) or could not be observed are None.
+
+    Attributes:
+        encode (Optional[float]): Serializing the request body
+        acquire (Optional[float]): Waiting for a connection from the pool
+        dns (Optional[float]): Resolving the host name, for new connections
+        connect (Optional[float]): Opening the TCP connection
+        tls (Optional[float]): TLS handshake (part of ``connect`` on the async client)
+        ttfb (Optional[float]): From sending the request to receiving response headers
+        download (Optional[float]): Reading the response body
+        decode (Optional[float]): Parsing the JSON body
+        model (Optional[float]): Building model objects (e.g. ``Event``) from it
+        connection_reused (Optional[bool]): Whether a pooled keep-alive connection was used
+        total (Optional[float]): Network time, from sending to the body being read
+    """
+    __slots__ = PHASES + ('connection_reused', 'total', '_sink')
+
+    def __init__(self, sink: Optional[Callable[[str, float], None]] = None):
+        for phase in PHASES:
+            setattr(self, phase, None)
+        self.connection_reused: Optional[bool] = None
+        self.total: Optional[float] = None
+        # Receives the phases measured outside the network part (encode, decode, model)
+        self._sink = sink
+
+    def _add(self, phase: str, seconds: float) -> None:
+        current = getattr(self, phase)
+        setattr(self, phase, seconds if current is None else current + seconds)
+
+    def _setup(self) -> float:
+        """Time spent getting a usable connection."""
+        return sum(getattr(self, phase) or 0.0 for phase in ('acquire', 'dns', 'connect', 'tls'))
+
+    def record_phase(self, phase: str, seconds: float) -> None:
+        """Add time to a phase measured outside the network (e.g. ``decode``) and report it."""
+        self._add(phase, seconds)
+        if self._sink is not None:
+            self._sink(phase, seconds)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Phases plus ``connection_reused`` and ``total``, as a plain dict."""
+        timings: Dict[str, Any] = {phase: getattr(self, phase) for phase in PHASES}
+        timings['connection_reused'] = self.connection_reused
+        timings['total'] = self.total
+        return timings
+
+    def __repr__(self) -> str:
+        phases = ', '.join(
+            f'{phase}={value * 1000:.2f}ms'
+            for phase, value in self.as_dict().items()
+            if isinstance(value, float)
+        )
+        return f'<RequestTiming reused={self.connection_reused} {phases}>'
+
+
+def build_timed(response: Any, build: Callable[[], T]) -> T:
+    """
+    Run ``build`` (e.g. ``Event.from_dict``) and, when ``response`` carries a
+    :class:`RequestTiming`, charge its duration to the ``model`` phase.
+    """
+    timing = getattr(response, 'timing', None)
+    if timing is None:
+        return build()
+    started = time.perf_counter()
+    result = build()
+    timing.record_phase('model', time.perf_counter() - started)
+    return result
+
+
+# Timing of the attempt the current thread is sending, read by the connection classes
+_active = threading.local()
+
+
+def _active_timing() -> Optional[RequestTiming]:
+    return getattr(_active, 'timing', None)
+
+
+def activate(timing: Optional[RequestTiming]) -> None:
+    """Make ``timing`` collect connection phases for the calling thread (None to stop)."""
+    _active.timing = timing
+
+
+class _TimedConnectionMixin:
+    def _new_conn(self):
+        timing = _active_timing()
+        if timing is None:
+            return super()._new_conn()
+        host = self._dns_host
+        started = time.perf_counter()
+        try:
+            address = socket.getaddrinfo(host, self.port, 0, socket.SOCK_STREAM)[0][4][0]
+        except OSError:
+            # Let urllib3 resolve again and raise its own error
+            return super()._new_conn()
+        resolved = time.perf_counter()
+        timing._add('dns', resolved - started)
+        # Connect to the address just resolved so DNS is not timed as connect
+        self._dns_host = address
+        try:
+            return super()._new_conn()
+        finally:
+            self._dns_host = host
+            timing._add('connect', time.perf_counter() - resolved)
+
+    def connect(self):
+        timing = _active_timing()
+        if timing is None:
+            return super().connect()
+        timing.connection_reused = False
+        before = (timing.dns or 0.0) + (timing.connect or 0.0)
+        started = time.perf_counter()
+        super().connect()
+        if isinstance(self, HTTPSConnection):
+            setup = (timing.dns or 0.0) + (timing.connect or 0.0) - before
+            timing._add('tls', max(time.perf_counter() - started - setup, 0.0))
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    """HTTP connection reporting DNS and connect time to the active :class:`RequestTiming`."""
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    """HTTPS connection also reporting the TLS handshake time."""
+
+
+class _TimedPoolMixin:
+    def _get_conn(self, timeout=None):
+        timing = _active_timing()
+        if timing is None:
+            return super()._get_conn(timeout)
+        started = time.perf_counter()
+        try:
+            return super()._get_conn(timeout)
+        finally:
+            timing._add('acquire', time.perf_counter() - started)
+
+
+class _TimedHTTPConnectionPool(_TimedPoolMixin, HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(_TimedPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimingHTTPAdapter(HTTPAdapter):
+    """
+    :class:`HTTPAdapter` whose connections report pool wait, DNS, connect and TLS
+    time to the :class:`RequestTiming` activated for the sending thread. Without an
+    active timing it behaves exactly like ``HTTPAdapter``.
+    """
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool
+        }
+
+    def send(self, request, *args, **kwargs):
+        timing = _active_timing()
+        if timing is not None and timing.connection_reused is None:
+            # Flipped to False by connect() if a new connection has to be opened
+            timing.connection_reused = True
+        return super().send(request, *args, **kwargs)
+
+
+def trace_config() -> Any:
+    """
+    ``aiohttp.TraceConfig`` filling the :class:`RequestTiming` passed as a request's
+    ``trace_request_ctx``. aiohttp reports TCP and TLS setup together, so ``tls`` is
+    included in ``connect``.
+    """
+    import aiohttp
+
+    def timed(start_attribute: str, phase: str):
+        async def on_start(session, context, params):
+            setattr(context, start_attribute, time.perf_counter())
+
+        async def on_end(session, context, params):
+            timing = context.trace_request_ctx
+            started = getattr(context, start_attribute, None)
+            if isinstance(timing, RequestTiming) and started is not None:
+                timing._add(phase, time.perf_counter() - started)
+        return on_start, on_end
+
+    async def on_reuse(session, context, params):
+        if isinstance(context.trace_request_ctx, RequestTiming):
+            context.trace_request_ctx.connection_reused = True
+
+    async def on_create_start(session, context, params):
+        timing = context.trace_request_ctx
+        if isinstance(timing, RequestTiming):
+            timing.connection_reused = False
+            context.connect_started = time.perf_counter()
+            context.dns_before = timing.dns or 0.0
+
+    async def on_create_end(session, context, params):
+        timing = context.trace_request_ctx
+        started = getattr(context, 'connect_started', None)
+        if isinstance(timing, RequestTiming) and started is not None:
+            # DNS resolution happens inside connection creation; keep it out of connect
+            dns = (timing.dns or 0.0) - context.dns_before
+            timing._add('connect', max(time.perf_counter() - started - dns, 0.0))
+
+    config = aiohttp.TraceConfig()
+    queued_start, queued_end = timed('queued_started', 'acquire')
+    config.on_connection_queued_start.append(queued_start)
+    config.on_connection_queued_end.append(queued_end)
+    dns_start, dns_end = timed('dns_started', 'dns')
+    config.on_dns_resolvehost_start.append(dns_start)
+    config.on_dns_resolvehost_end.append(dns_end)
+    config.on_connection_create_start.append(on_create_start)
+    config.on_connection_create_end.append(on_create_end)
+    config.on_connection_reuseconn.append(on_reuse)
+    return config
@@ -0,0 +1,282 @@
+import contextvars
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, List, Mapping, Optional, TypeVar
+
+T = TypeVar('T')
+
+# Span the current thread / task is working in; NON_RECORDING inside unsampled traces
+_current: contextvars.ContextVar = contextvars.ContextVar('mustapi_span', default=None)
+
+
+class Span:
+    """
+    One timed operation in a trace, with the method names of an OpenTelemetry span
+    (``set_attribute``, ``add_event``, ``record_exception``, ``set_status``, ``end``).
+
+    Attributes:
+        name (str): Operation name, e.g. ``GET events/{id}`` or ``http.attempt``
+        attributes (dict): Key/value attributes
+        events (list): ``(name, timestamp, attributes)`` tuples
+        children (list): Child spans, in start order
+        parent (Optional[Span]): Enclosing span, None for the root of a trace
+        status (str): ``UNSET``, ``OK`` or ``ERROR``
+        start_time (float): ``time.time()`` when the span started
+        end_time (Optional[float]): ``time.time()`` when it ended
+    """
+    __slots__ = (
+        'name', 'attributes', 'events', 'children', 'parent', 'status', 'status_description',
+        'start_time', 'end_time', '_started', '_duration', '_tracer', '_otel'
+    )
+
+    def __init__(
+        self,
+        name: str,
+        tracer: 'Tracer',
+        parent: Optional['Span'] = None,
+        attributes: Optional[Mapping[str, Any]] = None
+    ):
+        self.name = name
+        self.attributes: Dict[str, Any] = dict(attributes) if attributes else {}
+        self.events: List[tuple] = []
+        self.children: List['Span'] = []
+        self.parent = parent
+        self.status = 'UNSET'
+        self.status_description: Optional[str] = None
+        self.start_time = time.time()
+        self.end_time: Optional[float] = None
+        self._started = time.perf_counter()
+        self._duration: Optional[float] = None
+        self._tracer = tracer
+        self._otel = tracer._start_otel(self)
+        if parent is not None:
+            parent.children.append(self)
+
+    def is_recording(self) -> bool:
+        return self.end_time is None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+        if self._otel is not None and value is not None:
+            self._otel.set_attribute(key, value)
+
+    def set_attributes(self, attributes: Mapping[str, Any]) -> None:
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def add_event(self, name: str, attributes: Optional[Mapping[str, Any]] = None) -> None:
+        self.events.append((name, time.time(), dict(attributes or {})))
+        if self._otel is not None:
+            self._otel.add_event(name, dict(attributes or {}))
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.add_event('exception', {
+            'exception.type': type(exception).__name__,
+            'exception.message': str(exception)
+        })
+
+    def set_status(self, status: str, description: Optional[str] = None) -> None:
+        """Set the status to ``OK`` or ``ERROR``."""
+        self.status = status
+        self.status_description = description
+        if self._otel is not None:
+            self._tracer._set_otel_status(self._otel, status, description)
+
+    def end(self) -> None:
+        """Finish the span; ending the root of a trace hands the trace to the tracer."""
+        if self.end_time is not None:
+            return
+        self._duration = time.perf_counter() - self._started
+        self.end_time = time.time()
+        if self._otel is not None:
+            self._otel.end()
+        if self.parent is None:
+            self._tracer._finish(self)
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds between start and end, None while the span is open."""
+        return self._duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The span and its children as nested plain dicts."""
+        return {
+            'name': self.name,
+            'start_time': self.start_time,
+            'duration': self._duration,
+            'status': self.status,
+            'attributes': dict(self.attributes),
+            'events': [
+                {'name': name, 'timestamp': timestamp, 'attributes': attributes}
+                for name, timestamp, attributes in self.events
+            ],
+            'children': [child.to_dict() for child in self.children]
+        }
+
+    def __repr__(self) -> str:
+        return f'<Span {self.name} children={len(self.children)}>'
+
+
+class _NonRecordingSpan:
+    """Stand-in for every span of an unsampled trace; all operations do nothing."""
+    __slots__ = ()
+
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Mapping[str, Any]) -> None:
+        pass
+
+    def add_event(self, name: str, attributes: Optional[Mapping[str, Any]] = None) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+    def set_status(self, status: str, description: Optional[str] = None) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+NON_RECORDING = _NonRecordingSpan()
+
+
+@contextmanager
+def use_span(span: Any) -> Iterator[Any]:
+    """Make ``span`` the parent of spans started in this block (without ending it)."""
+    if span is None:
+        yield span
+        return
+    token = _current.set(span)
+    try:
+        yield span
+    finally:
+        _current.reset(token)
+
+
+def bind(span: Any, function: Callable[..., T]) -> Callable[..., T]:
+    """
+    Wrap ``function`` so it runs with ``span`` as the current span, e.g. when it is
+    submitted to a thread pool, which does not inherit the caller's context.
+    """
+    if span is None or span is NON_RECORDING:
+        return function
+
+    def bound(*args, **kwargs):
+        with use_span(span):
+            return function(*args, **kwargs)
+    return bound
+
+
+def bind_async(span: Any, function: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Coroutine counterpart of :func:`bind`."""
+    if span is None or span is NON_RECORDING:
+        return function
+
+    async def bound(*args, **kwargs):
+        with use_span(span):
+            return await function(*args, **kwargs)
+    return bound
+
+
+class Tracer:
+    """
+    Builds span trees for sampled requests.
+
+    Sampling is decided once per trace, when its root span starts: one trace in
+    ``sample_every`` records spans for the request, its cache lookup and each retry
+    attempt, or for an iteration and every page it fetches. In the remaining traces
+    every span is a shared non-recording stub.
+
+    Finished traces are kept in :attr:`traces` and passed to ``on_trace``. Pass an
+    OpenTelemetry tracer as ``otel_tracer`` to mirror sampled spans into it; the
+    ``opentelemetry-api`` package is only needed in that case.
+
+    Args:
+        sample_every (int, optional): Record one trace in this many. Defaults to 1 (all)
+        on_trace (Callable[[Span], None], optional): Called with each finished root span
+        otel_tracer (opentelemetry.trace.Tracer, optional): Receives a copy of every
+            recorded span
+        max_traces (int, optional): Finished traces kept in :attr:`traces`. Defaults to 100
+    """
+    def __init__(
+        self,
+        sample_every: int = 1,
+        on_trace: Optional[Callable[[Span], None]] = None,
+        otel_tracer: Any = None,
+        max_traces: int = 100
+    ):
+        if sample_every < 1:
+            raise ValueError('sample_every must be at least 1')
+        self.sample_every = sample_every
+        self.on_trace = on_trace
+        self.otel_tracer = otel_tracer
+        self._otel_api = None
+        if otel_tracer is not None:
+            from opentelemetry import trace as otel_trace
+            self._otel_api = otel_trace
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self.traces: Deque[Span] = deque(maxlen=max_traces)
+
+    def start_span(self, name: str, attributes: Optional[Mapping[str, Any]] = None) -> Any:
+        """
+        Start a span under the current one, or a new (possibly unsampled) trace when
+        there is none. The caller must call ``end()`` on it.
+        """
+        parent = _current.get()
+        if parent is None:
+            if next(self._counter) % self.sample_every:
+                return NON_RECORDING
+            return Span(name, self, None, attributes)
+        if parent is NON_RECORDING:
+            return NON_RECORDING
+        return Span(name, self, parent, attributes)
+
+    @contextmanager
+    def span(self, name: str, attributes: Optional[Mapping[str, Any]] = None) -> Iterator[Any]:
+        """Start a span, make it current for the block and end it afterwards."""
+        span = self.start_span(name, attributes)
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.record_exception(error)
+            span.set_status('ERROR', str(error))
+            raise
+        finally:
+            _current.reset(token)
+            span.end()
+
+    def child(self, name: str, attributes: Optional[Mapping[str, Any]] = None) -> Optional[Span]:
+        """Start a leaf span under the current span if it is recording, else return None."""
+        parent = _current.get()
+        if parent is None or parent is NON_RECORDING:
+            return None
+        return Span(name, self, parent, attributes)
+
+    def _finish(self, root: Span) -> None:
+        with self._lock:
+            self.traces.append(root)
+        if self.on_trace is not None:
+            self.on_trace(root)
+
+    def _start_otel(self, span: Span) -> Any:
+        if self.otel_tracer is None:
+            return None
+        context = None
+        if span.parent is not None and span.parent._otel is not None:
+            context = self._otel_api.set_span_in_context(span.parent._otel)
+        return self.otel_tracer.start_span(span.name, context=context, attributes=span.attributes)
+
+    def _set_otel_status(self, otel_span: Any, status: str, description: Optional[str]) -> None:
+        code = self._otel_api.StatusCode.ERROR if status == 'ERROR' else self._otel_api.StatusCode.OK
+        otel_span.set_status(self._otel_api.Status(code, description if status == 'ERROR' else None))
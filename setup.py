@@ -23,6 +23,12 @@ setup(
     ],
     python_requires='>=3.8',
     extras_require={
+        'async': [
+            'aiohttp>=3.8.0'
+        ],
+        'json': [
+            'orjson>=3.6.0'
+        ],
         'dev': [
             'pytest>=6.0.0',
             'pytest-cov',
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from benchmarks.stub_server import API_KEY, StubServer
+from mustapi.async_client import AsyncMustAPIClient
+from mustapi.exceptions import AuthenticationError, ResourceNotFoundError
+from mustapi.services.authentication_services import APIKeyManager
+
+
+@pytest.fixture(scope='module')
+def server():
+    with StubServer(total_events=20) as server:
+        yield server
+
+
+def test_constructor_does_not_validate(server, monkeypatch):
+    def blocking(*args, **kwargs):
+        raise AssertionError('blocking validation')
+
+    monkeypatch.setattr(APIKeyManager, 'validate_api_key', staticmethod(blocking))
+    client = AsyncMustAPIClient(API_KEY, base_url=server.url)
+    assert client.developer_id is None
+    assert 'X-Developer-ID' not in client._headers
+
+
+def test_async_with_validates_the_key(server):
+    async def main():
+        async with AsyncMustAPIClient(API_KEY, base_url=server.url) as client:
+            assert client.developer_id == 'bench-dev'
+            assert client._headers['X-Application-Name'] == 'bench-app'
+
+    asyncio.run(main())
+
+
+def test_first_request_validates_once(server, monkeypatch):
+    calls = []
+    validate = APIKeyManager.validate_api_key_async
+
+    async def counting(*args, **kwargs):
+        calls.append(1)
+        return await validate(*args, **kwargs)
+
+    monkeypatch.setattr(APIKeyManager, 'validate_api_key_async', staticmethod(counting))
+
+    async def main():
+        client = AsyncMustAPIClient(API_KEY, base_url=server.url)
+        try:
+            events = await asyncio.gather(*(client.events.get_event(str(i)) for i in range(5)))
+        finally:
+            await client.close()
+        assert [event.id for event in events] == ['0', '1', '2', '3', '4']
+        assert client.developer_id == 'bench-dev'
+
+    asyncio.run(main())
+    assert calls == [1]
+
+
+def test_invalid_key_raises_authentication_error(server):
+    async def main():
+        # The stub only answers key validation at its root
+        client = AsyncMustAPIClient(API_KEY, base_url=f'{server.url}/elsewhere')
+        with pytest.raises(AuthenticationError, match='API key not found'):
+            async with client:
+                pass
+        assert client._session is None
+
+    asyncio.run(main())
+
+
+def test_list_and_errors(server):
+    async def main():
+        async with AsyncMustAPIClient(API_KEY, base_url=server.url) as client:
+            events = await client.events.list_events(limit=5)
+            assert len(events) == 5
+            with pytest.raises(ResourceNotFoundError):
+                await client.events.get_event('missing-1')
+
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+import json
+import sys
+
+import pytest
+
+from benchmarks import suite
+
+
+def results(**metrics):
+    return {'results': {'get_event': metrics}}
+
+
+def test_percentile_is_nearest_rank():
+    samples = [float(value) for value in range(1, 101)]
+    assert suite._percentile(samples, 50) == 50.0
+    assert suite._percentile(samples, 99) == 99.0
+    assert suite._percentile([], 99) == 0.0
+
+
+def test_compare_flags_slowdowns_in_either_direction():
+    baseline = results(ops_per_sec=1000.0, p99_ms=10.0, max_ms=20.0, errors=0)
+    assert suite.compare(results(ops_per_sec=900.0, p99_ms=12.0, max_ms=90.0, errors=5), baseline, 0.25) == []
+    regressions = suite.compare(results(ops_per_sec=700.0, p99_ms=14.0), baseline, 0.25)
+    assert [line.split(':')[0] for line in regressions] == ['get_event.ops_per_sec', 'get_event.p99_ms']
+
+
+def test_compare_ignores_metrics_missing_from_the_baseline():
+    assert suite.compare(results(ops_per_sec=1.0), {'results': {}}, 0.25) == []
+
+
+def run_main(monkeypatch, *args):
+    monkeypatch.setattr(sys, 'argv', [
+        'suite', '--requests', '20', '--threads', '2', '--total-events', '50',
+        '--page-size', '10', '--construct', '2', '--decode-rows', '50', *args
+    ])
+    suite.main()
+
+
+def test_main_saves_and_compares_a_baseline(tmp_path, monkeypatch, capsys):
+    baseline = tmp_path / 'baseline.json'
+    output = tmp_path / 'results.json'
+    run_main(monkeypatch, '--baseline', str(baseline), '--save-baseline', '--output', str(output))
+    saved = json.loads(baseline.read_text())
+    assert set(saved['results']) == {'client_construction', 'get_event', 'list_events', 'create_event', 'from_dict'}
+    assert saved['results']['get_event']['errors'] == 0
+
+    # A baseline ten times faster than anything achievable must flag regressions
+    for metrics in saved['results'].values():
+        for metric in metrics:
+            if metric.endswith('_per_sec'):
+                metrics[metric] *= 10
+    baseline.write_text(json.dumps(saved))
+    with pytest.raises(SystemExit) as exited:
+        run_main(monkeypatch, '--baseline', str(baseline), '--output', str(output))
+    assert exited.value.code == 1
+    assert 'REGRESSION get_event.ops_per_sec' in capsys.readouterr().err
@@ -0,0 +1,138 @@
+import itertools
+
+import pytest
+
+from benchmarks.stub_server import API_KEY, StubServer
+from mustapi.client import MustAPIClient
+from mustapi.exceptions import MustAPIError, ValidationError
+from mustapi.services.bulk import chunked, run_bounded
+from mustapi.services.events import batch_outcomes
+
+
+def payloads(count):
+    return ({'id': str(i), 'title': f'Event {i}'} for i in range(count))
+
+
+def test_chunked_is_lazy():
+    source = itertools.count()
+    assert next(chunked(source, 3)) == [0, 1, 2]
+    assert next(source) == 3
+
+
+def test_run_bounded_captures_errors_and_bounds_queued_work():
+    consumed = []
+
+    def items():
+        for item in range(20):
+            consumed.append(item)
+            yield item
+
+    def work(item):
+        if item == 3:
+            raise ValueError('three')
+        return item * 2
+
+    outcomes = run_bounded(work, items(), max_workers=2)
+    first = next(outcomes)
+    # Two calls per worker are queued, plus the one submitted to replace the first
+    assert len(consumed) <= 5
+    outcomes = [first, *outcomes]
+    assert sorted(item for item, _, _ in outcomes) == list(range(20))
+    errors = {item: str(error) for item, _, error in outcomes if error is not None}
+    assert errors == {3: 'three'}
+    assert all(result == item * 2 for item, result, error in outcomes if error is None)
+
+
+def test_batch_outcomes_maps_rejected_and_missing_entries():
+    chunk = [(0, {'title': 'a'}), (1, {'title': ''}), (2, {'title': 'c'})]
+    response = {'events': [{'id': '1', 'title': 'a'}, {'error': 'title is required'}]}
+    outcomes = batch_outcomes(chunk, response)
+    assert outcomes[0][0].id == '1'
+    assert isinstance(outcomes[1][1], ValidationError)
+    assert isinstance(outcomes[2][1], MustAPIError)
+
+
+def test_create_events_uses_the_batch_endpoint():
+    with StubServer() as server:
+        client = MustAPIClient(API_KEY, base_url=server.url)
+        result = client.events.create_events(payloads(7), chunk_size=3)
+    assert result.ok
+    assert [item.key for item in result] == list(range(7))
+    assert [item.result.id for item in result] == [str(i) for i in range(7)]
+    assert client.events._batch_create is True
+
+
+def test_create_events_falls_back_to_single_posts():
+    with StubServer(batch_create=False) as server:
+        client = MustAPIClient(API_KEY, base_url=server.url)
+        result = client.events.create_events(payloads(5), chunk_size=2)
+        assert client.events._batch_create is False
+        # The answer is remembered: later calls skip the probe
+        assert client.events.create_events(payloads(1)).ok
+    assert [item.result.title for item in result] == [f'Event {i}' for i in range(5)]
+
+
+def test_create_events_reports_failures_per_item():
+    with StubServer(error_rate=1.0) as server:
+        client = MustAPIClient(API_KEY, base_url=server.url)
+        result = client.events.create_events(payloads(4), chunk_size=2, use_batch=True)
+    assert not result.ok
+    assert sorted(result.errors) == [0, 1, 2, 3]
+    assert all(error.status_code == 503 for error in result.errors.values())
+
+
+def test_create_events_with_no_input():
+    with StubServer() as server:
+        client = MustAPIClient(API_KEY, base_url=server.url)
+        assert len(client.events.create_events([])) == 0
+        assert client.events._batch_create is None
+
+
+def test_update_events_returns_each_updated_event():
+    with StubServer() as server:
+        client = MustAPIClient(API_KEY, base_url=server.url)
+        result = client.events.update_events({'1': {'title': 'One'}, '2': {'location': 'Online'}})
+    assert result.ok
+    assert result['1'].result.title == 'One'
+    assert result['2'].result.location == 'Online'
+
+
+def test_delete_events_by_id_deduplicates():
+    with StubServer() as server:
+        client = MustAPIClient(API_KEY, base_url=server.url)
+        result = client.events.delete_events(['1', '2', '1', 3])
+        assert server._server.deleted == {'1', '2', '3'}
+    assert sorted(result.results) == ['1', '2', '3']
+
+
+def test_delete_events_by_filters_pages_through_the_listing():
+    with StubServer(total_events=23) as server:
+        client = MustAPIClient(API_KEY, base_url=server.url)
+        result = client.events.delete_events(filters={'location': 'Nairobi'}, page_size=5)
+        assert client.events.list_events() == []
+    assert len(result) == 23 and result.ok
+
+
+def test_delete_events_by_filters_skips_failed_deletions(monkeypatch):
+    with StubServer(total_events=12) as server:
+        client = MustAPIClient(API_KEY, base_url=server.url)
+        delete = client.events.delete_event
+
+        def flaky(event_id):
+            if event_id in ('2', '7'):
+                raise MustAPIError('locked', 409)
+            return delete(event_id)
+
+        monkeypatch.setattr(client.events, 'delete_event', flaky)
+        result = client.events.delete_events(filters={'q': 'all'}, page_size=5)
+        remaining = [event.id for event in client.events.list_events()]
+    assert sorted(result.errors) == ['2', '7']
+    assert len(result.succeeded) == 10
+    assert remaining == ['2', '7']
+
+
+def test_delete_events_needs_ids_or_filters():
+    with StubServer() as server:
+        client = MustAPIClient(API_KEY, base_url=server.url)
+        with pytest.raises(ValueError):
+            client.events.delete_events()
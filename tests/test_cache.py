@@ -0,0 +1,78 @@
+import pytest
+
+from benchmarks.stub_server import API_KEY, StubServer
+from mustapi.cache import DiskCacheBackend, HTTPCache, MemoryCacheBackend
+from mustapi.client import MustAPIClient
+
+BASE = 'https://api.example.com/v1'
+
+
+@pytest.fixture(scope='module')
+def server():
+    with StubServer(total_events=20) as server:
+        yield server
+
+
+@pytest.fixture(params=['memory', 'disk'])
+def cache(request, tmp_path):
+    backend = MemoryCacheBackend() if request.param == 'memory' else DiskCacheBackend(str(tmp_path))
+    return HTTPCache(backend, default_ttl=60)
+
+
+def test_key_ignores_param_order_and_none():
+    assert HTTPCache.key(f'{BASE}/events', {'offset': 0, 'limit': 10, 'q': None}) == \
+        HTTPCache.key(f'{BASE}/events', {'limit': 10, 'offset': 0})
+
+
+def test_fresh_entry_is_served(cache):
+    key = cache.key(f'{BASE}/events/1')
+    cache.store(key, {'Cache-Control': 'max-age=60'}, b'{"id": "1"}')
+    entry, fresh = cache.lookup(key)
+    assert fresh and entry.body == b'{"id": "1"}'
+
+
+def test_no_store_and_unvalidatable_stale_responses_are_skipped():
+    cache = HTTPCache()
+    cache.store('a', {'Cache-Control': 'no-store'}, b'{}')
+    cache.store('b', {'Cache-Control': 'no-cache'}, b'{}')
+    assert cache.lookup('a') == (None, False)
+    assert cache.lookup('b') == (None, False)
+
+
+def test_stale_entry_revalidates_with_etag():
+    cache = HTTPCache()
+    cache.store('a', {'ETag': '"v1"', 'Cache-Control': 'max-age=0'}, b'{}')
+    entry, fresh = cache.lookup('a')
+    assert not fresh
+    assert HTTPCache.conditional_headers(entry) == {'If-None-Match': '"v1"'}
+    entry = cache.revalidated('a', entry, {'Cache-Control': 'max-age=60'})
+    assert cache.lookup('a') == (entry, True)
+
+
+def test_invalidate_drops_the_whole_collection(cache):
+    for key in (
+        f'{BASE}/events', cache.key(f'{BASE}/events', {'limit': 10}),
+        f'{BASE}/events/1', f'{BASE}/events_archive', f'{BASE}/devs/abc'
+    ):
+        cache.store(key, {}, b'{}')
+    cache.invalidate(f'{BASE}/events')
+    assert sorted(cache.backend.keys()) == [f'{BASE}/devs/abc', f'{BASE}/events_archive']
+
+
+def test_write_then_list_is_not_stale(server):
+    cache = HTTPCache(default_ttl=60)
+    client = MustAPIClient(API_KEY, base_url=server.url, http_cache=cache)
+    assert '3' in [event.id for event in client.events.list_events(limit=10)]
+    client.events.delete_event('3')
+    assert '3' not in [event.id for event in client.events.list_events(limit=10)]
+    assert cache.stats['invalidations'] == 1
+
+
+def test_batch_create_invalidates_listings(server):
+    cache = HTTPCache(default_ttl=60)
+    client = MustAPIClient(API_KEY, base_url=server.url, http_cache=cache)
+    client.events.list_events(limit=5)
+    client.events.get_event('1')
+    assert len(cache.backend.keys()) == 2
+    client.events.create_events([{'title': 'New'}])
+    assert cache.backend.keys() == []
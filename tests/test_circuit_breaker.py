@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from benchmarks.stub_server import API_KEY, StubServer
+from mustapi.async_client import AsyncMustAPIClient
+from mustapi.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerRegistry
+from mustapi.client import MustAPIClient
+from mustapi.concurrency import AdaptiveConcurrencyLimiter
+from mustapi.exceptions import CircuitOpenError
+
+
+class Interrupted(Exception):
+    pass
+
+
+class InterruptedLimiter(AdaptiveConcurrencyLimiter):
+    """Raises from acquire, as an interrupted wait for a slot would."""
+    def acquire(self) -> None:
+        raise Interrupted()
+
+
+def half_open(breaker: CircuitBreaker) -> CircuitBreaker:
+    """Trip ``breaker`` (created with minimum_calls=1, open_timeout=0) into half-open."""
+    breaker.before_call()
+    breaker.record(None)
+    assert breaker.state == OPEN
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    return breaker
+
+
+@pytest.fixture(scope='module')
+def server():
+    with StubServer() as server:
+        yield server
+
+
+def test_opens_on_failure_rate_and_closes_after_probe():
+    breaker = CircuitBreaker('events', minimum_calls=4, window_size=4, open_timeout=60)
+    for status in (200, 503, 200, 503):
+        breaker.before_call()
+        breaker.record(status)
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.open_timeout = 0
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    breaker.record(200)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_admits_one_probe():
+    breaker = half_open(CircuitBreaker('events', minimum_calls=1, open_timeout=0))
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record(500)
+    assert breaker.state == OPEN
+
+
+def test_release_frees_the_probe_slot():
+    breaker = half_open(CircuitBreaker('events', minimum_calls=1, open_timeout=0))
+    breaker.release()
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+
+
+def test_failed_acquisition_releases_probe(server):
+    breakers = CircuitBreakerRegistry(minimum_calls=1, open_timeout=0)
+    client = MustAPIClient(
+        API_KEY, base_url=server.url, circuit_breakers=breakers,
+        concurrency_limiter=InterruptedLimiter()
+    )
+    breaker = half_open(breakers.get('events/1'))
+    breaker.release()
+    with pytest.raises(Interrupted):
+        client.events.get_event('1')
+
+    client.concurrency_limiter = None
+    assert client.events.get_event('1').id == '1'
+    assert breaker.state == CLOSED
+
+
+def test_probe_cancelled_while_waiting_is_released(server):
+    async def main():
+        breakers = CircuitBreakerRegistry(minimum_calls=1, open_timeout=0)
+        async with AsyncMustAPIClient(
+            API_KEY, base_url=server.url, max_concurrency=1,
+            circuit_breakers=breakers, coalesce_gets=False
+        ) as client:
+            breaker = half_open(breakers.get('events/1'))
+            breaker.release()
+            # Hold the only connection slot so the probe waits on the semaphore
+            client._get_session()
+            await client._semaphore.acquire()
+            probe = asyncio.ensure_future(client.events.get_event('1'))
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert breaker._probes == 1
+            probe.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await probe
+            client._semaphore.release()
+
+            event = await client.events.get_event('1')
+            assert event.id == '1'
+            assert breaker.state == CLOSED
+
+    asyncio.run(main())
@@ -0,0 +1,45 @@
+import pytest
+import requests
+
+from benchmarks.stub_server import API_KEY, StubServer
+from mustapi.client import MustAPIClient
+
+
+@pytest.fixture(scope='module')
+def server():
+    with StubServer() as server:
+        yield server
+
+
+def connection_pool(client, url):
+    pools = client._session.get_adapter(url).poolmanager.pools
+    [key] = pools.keys()
+    return pools[key]
+
+
+def test_requests_reuse_one_keep_alive_connection(server):
+    with MustAPIClient(API_KEY, base_url=server.url) as client:
+        for event_id in range(10):
+            client.events.get_event(str(event_id))
+        pool = connection_pool(client, server.url)
+        # Key validation plus ten lookups over a single connection
+        assert pool.num_requests == 11
+        assert pool.num_connections == 1
+
+
+def test_pool_size_is_configurable(server):
+    with MustAPIClient(API_KEY, base_url=server.url, pool_maxsize=3, pool_block=True) as client:
+        client.events.get_event('1')
+        pool = connection_pool(client, server.url)
+        assert pool.pool.maxsize == 3
+        assert pool.block
+
+
+def test_given_session_is_used_and_left_open(server):
+    session = requests.Session()
+    client = MustAPIClient(API_KEY, base_url=server.url, session=session)
+    client.events.get_event('1')
+    client.close()
+    assert client._session is session
+    assert session.get(f'{server.url}/events/1').status_code == 200
+    session.close()
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+
+from mustapi.coalescing import SingleFlight, request_key
+
+
+def test_request_key_ignores_param_order_and_none():
+    assert request_key('/events/', {'limit': 10, 'offset': 0, 'q': None}) == \
+        request_key('events', {'offset': 0, 'limit': 10})
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return {'id': '1'}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do('events/1', fetch)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    while flight.stats['coalesced'] < 3:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert all(result is results[0] for result in results)
+    assert flight.stats == {'executed': 1, 'coalesced': 3, 'in_flight': 0}
+
+
+def test_cancelled_leader_does_not_cancel_followers():
+    async def main():
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'event'
+
+        leader = asyncio.ensure_future(flight.do_async('events/1', fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do_async('events/1', fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == 'event'
+        assert leader.cancelled()
+        assert calls == [1]
+        assert flight.stats['in_flight'] == 0
+
+    asyncio.run(main())
+
+
+def test_call_is_cancelled_when_every_caller_is():
+    async def main():
+        flight = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.ensure_future(flight.do_async('events/1', fetch))
+        await started.wait()
+        caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        await asyncio.sleep(0)
+        assert flight.stats['in_flight'] == 0
+
+    asyncio.run(main())
+
+
+def test_errors_reach_every_async_caller():
+    async def main():
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError('boom')
+
+        results = await asyncio.gather(
+            *(flight.do_async('events/1', fetch) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flight.stats['executed'] == 1
+
+    asyncio.run(main())
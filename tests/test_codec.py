@@ -0,0 +1,70 @@
+from datetime import date, datetime
+
+import pytest
+
+from benchmarks.stub_server import API_KEY, StubServer
+from mustapi import codec as codec_module
+from mustapi.client import MustAPIClient
+from mustapi.codec import CODECS, JSONCodec, get_codec
+
+
+@pytest.fixture(params=sorted(CODECS))
+def codec(request):
+    try:
+        return get_codec(request.param)
+    except ImportError:
+        pytest.skip(f'{request.param} is not installed')
+
+
+def test_round_trip(codec):
+    data = {'title': 'Café', 'count': 3, 'tags': ['a', None], 'ok': True}
+    body = codec.dumps(data)
+    assert isinstance(body, bytes)
+    assert codec.loads(body) == data
+    assert codec.loads(body.decode('utf-8')) == data
+
+
+def test_datetimes_are_encoded_as_iso_8601(codec):
+    body = codec.dumps({'start_time': datetime(2024, 1, 15, 10, 0), 'day': date(2024, 1, 15)})
+    assert codec.loads(body) == {'start_time': '2024-01-15T10:00:00', 'day': '2024-01-15'}
+
+
+def test_invalid_json_raises_value_error(codec):
+    with pytest.raises(ValueError):
+        codec.loads(b'{"title": ')
+
+
+def test_default_picks_the_fastest_installed(monkeypatch):
+    monkeypatch.setattr(codec_module, 'orjson', None)
+    monkeypatch.setattr(codec_module, 'ujson', None)
+    assert type(get_codec()) is JSONCodec
+    instance = JSONCodec()
+    assert get_codec(instance) is instance
+    with pytest.raises(ValueError):
+        get_codec('simplejson')
+    with pytest.raises(ImportError):
+        get_codec('orjson')
+
+
+def test_client_uses_the_configured_codec():
+    class Counting(JSONCodec):
+        name = 'counting'
+
+        def __init__(self):
+            self.calls = []
+
+        def dumps(self, data):
+            self.calls.append('dumps')
+            return super().dumps(data)
+
+        def loads(self, body):
+            self.calls.append('loads')
+            return super().loads(body)
+
+    codec = Counting()
+    with StubServer() as server:
+        client = MustAPIClient(API_KEY, base_url=server.url, json_codec=codec)
+        event = client.events.create_event({'title': 'New', 'start_time': datetime(2024, 3, 1, 9)})
+    assert client.codec is codec
+    assert codec.calls == ['dumps', 'loads']
+    assert event.start_time == datetime(2024, 3, 1, 9)
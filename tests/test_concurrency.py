@@ -0,0 +1,84 @@
+import asyncio
+import threading
+
+import pytest
+
+from mustapi.concurrency import AdaptiveConcurrencyLimiter
+
+
+def test_rejects_invalid_bounds():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=4)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(decrease_factor=1.5)
+
+
+def test_limit_grows_additively_on_healthy_responses():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+    # Each success adds 1 / limit, so about one round of ``limit`` successes per step
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(0.01, 200)
+    assert limiter.limit == 3
+    for _ in range(20):
+        limiter.acquire()
+        limiter.release(0.01, 200)
+    assert limiter.limit == 4
+
+
+def test_limit_halves_on_overload_once_per_cooldown():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16, cooldown=60)
+    for status in (503, 429):
+        limiter.acquire()
+        limiter.release(0.01, status)
+    assert limiter.limit == 8
+    assert limiter.stats['overloads'] == 2
+    assert [reason for _, _, reason in limiter.history] == ['initial', 'error']
+
+
+def test_decrease_stops_at_min_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, min_limit=3, cooldown=0)
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(0.01, None, failed=True)
+    assert limiter.limit == 3
+
+
+def test_latency_spike_counts_as_overload():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_tolerance=2.0)
+    limiter.acquire()
+    limiter.release(0.01, 200)
+    limiter.acquire()
+    limiter.release(0.5, 200)
+    assert limiter.limit == 4
+    assert limiter.history[-1][2] == 'latency'
+
+
+def test_waiter_gets_the_released_slot():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    limiter.acquire()
+    acquired = threading.Event()
+    thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    thread.start()
+    assert not acquired.wait(0.05)
+    limiter.release()
+    assert acquired.wait(1)
+    thread.join()
+    assert limiter.in_flight == 1
+
+
+def test_cancelled_async_waiter_does_not_leak_a_slot():
+    async def main():
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        await limiter.acquire_async()
+        waiter = asyncio.ensure_future(limiter.acquire_async())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+        assert limiter.in_flight == 0
+        await asyncio.wait_for(limiter.acquire_async(), 1)
+        assert limiter.in_flight == 1
+
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from mustapi.models import batch as batch_module
+from mustapi.models.batch import EventBatch
+from mustapi.models.event import Event
+
+ROWS = [
+    {'id': '1', 'title': 'Talk', 'location': 'Nairobi', 'start_time': '2024-01-15T10:00:00'},
+    {'id': '2', 'title': 'Workshop', 'location': None, 'start_time': '2024-01-15T10:00:00',
+     'created_at': '2024-01-01T09:00:00'},
+    {'id': '3', 'title': 'Talk', 'location': 'Nairobi', 'start_time': '2024-02-01T08:30:00'},
+]
+
+
+@pytest.fixture(params=['numpy', 'array'])
+def backend(request, monkeypatch):
+    if request.param == 'array':
+        monkeypatch.setattr(batch_module, 'numpy', None)
+    elif batch_module.numpy is None:
+        pytest.skip('numpy is not installed')
+    return request.param
+
+
+def test_rows_match_decoded_events(backend):
+    batch = EventBatch.from_dicts(ROWS)
+    assert len(batch) == 3
+    assert batch.to_events() == [Event.from_dict(row) for row in ROWS]
+    assert batch[1] == Event.from_dict(ROWS[1])
+    assert batch[-1].title == 'Talk'
+    assert f'backend={backend}' in repr(batch)
+
+
+def test_nulls_and_dictionary_encoding(backend):
+    batch = EventBatch.from_dicts(ROWS)
+    assert batch.column('location') == ['Nairobi', None, 'Nairobi']
+    assert batch.column('created_at') == [None, datetime(2024, 1, 1, 9, 0), None]
+    codes, dictionary = batch.codes('title')
+    assert list(codes) == [0, 1, 0]
+    assert dictionary == ['Talk', 'Workshop']
+    assert list(batch.valid('location')) == [True, False, True]
+
+
+def test_slices_share_buffers(backend):
+    batch = EventBatch.from_dicts(ROWS)
+    tail = batch[1:]
+    assert len(tail) == 2
+    assert [row.id for row in tail] == ['2', '3']
+    assert tail.column('location') == [None, 'Nairobi']
+    assert tail._times['start_time'] is batch._times['start_time']
+    with pytest.raises(IndexError):
+        tail[2]
+
+
+def test_aware_timestamps_decode_as_utc():
+    batch = EventBatch.from_dicts([
+        {'id': '1', 'start_time': '2024-01-15T10:00:00Z'},
+        {'id': '2', 'start_time': '2024-01-15T12:00:00'},
+    ])
+    assert batch.column('start_time') == [
+        datetime(2024, 1, 15, 10, tzinfo=timezone.utc),
+        datetime(2024, 1, 15, 12, tzinfo=timezone.utc)
+    ]
+
+
+def test_concat_and_from_events():
+    batch = EventBatch.concat([EventBatch.from_dicts(ROWS[:1]), EventBatch.from_dicts(ROWS[1:])])
+    assert batch.to_events() == EventBatch.from_events(Event.from_dict(row) for row in ROWS).to_events()
+
+
+def test_datetime64_view():
+    numpy = pytest.importorskip('numpy')
+    values = EventBatch.from_dicts(ROWS).datetime64('created_at')
+    assert numpy.isnat(values[0])
+    assert values[1] == numpy.datetime64('2024-01-01T09:00:00')
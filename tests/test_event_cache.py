@@ -0,0 +1,75 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from benchmarks.stub_server import API_KEY, StubServer
+from mustapi.client import MustAPIClient
+from mustapi.models.event import Event
+from mustapi.services import event_cache as event_cache_module
+from mustapi.services.event_cache import EventCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(event_cache_module, 'time', SimpleNamespace(monotonic=lambda: now.value))
+
+    def advance(seconds):
+        now.value += seconds
+
+    return advance
+
+
+@pytest.fixture(scope='module')
+def server():
+    with StubServer(total_events=20) as server:
+        yield server
+
+
+def event(event_id):
+    return Event.from_dict({'id': event_id, 'title': f'Event {event_id}'})
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = EventCache(ttl=10)
+    cache.set(event('1'))
+    clock(9)
+    assert cache.get('1').id == '1'
+    clock(1)
+    assert cache.get('1') is None
+    assert cache.stats['expirations'] == 1
+
+
+def test_least_recently_used_is_evicted(clock):
+    cache = EventCache(max_size=2)
+    cache.set(event('1'))
+    cache.set(event('2'))
+    cache.get('1')
+    cache.set(event('3'))
+    assert '2' not in cache
+    assert '1' in cache and '3' in cache
+    assert cache.stats['evictions'] == 1
+
+
+def test_get_event_is_served_from_the_cache(server):
+    cache = EventCache()
+    client = MustAPIClient(API_KEY, base_url=server.url, event_cache=cache)
+    first = client.events.get_event('1')
+    assert client.events.get_event('1') is first
+    assert client.events.get_event('1', bypass_cache=True) is not first
+    assert cache.stats['hits'] == 1
+
+
+def test_writes_go_through_the_cache(server):
+    cache = EventCache(populate_on_list=False)
+    client = MustAPIClient(API_KEY, base_url=server.url, event_cache=cache)
+    client.events.list_events(limit=5)
+    assert len(cache) == 0
+    created = client.events.create_event({'title': 'New'})
+    assert cache.peek(created.id) is created
+    client.events.get_event('2')
+    updated = client.events.update_event('2', {'title': 'Renamed'})
+    assert cache.peek('2') is updated
+    client.events.delete_event('2')
+    assert '2' not in cache
@@ -0,0 +1,45 @@
+from datetime import datetime
+
+import pytest
+
+from benchmarks.stub_server import EVENT
+from mustapi.models.event import Event
+
+
+def test_events_are_slotted():
+    event = Event.from_dict(EVENT)
+    assert not hasattr(event, '__dict__')
+    with pytest.raises(AttributeError):
+        event.organizer = 'someone'
+
+
+def test_eager_decoding_parses_timestamps():
+    event = Event.from_dict(EVENT)
+    assert event.start_time == datetime(2024, 1, 15, 10, 0)
+    assert event.end_time == datetime(2024, 1, 15, 12, 0)
+    assert Event.from_dict({'id': '1', 'title': 'x', 'end_time': ''}).end_time is None
+
+
+def test_lazy_decoding_parses_on_first_read():
+    event = Event.from_dict(EVENT, lazy=True)
+    assert event._start_time == EVENT['start_time']
+    assert event.start_time == datetime(2024, 1, 15, 10, 0)
+    # The parsed value replaces the raw string
+    assert event._start_time is event.start_time
+    assert event == Event.from_dict(EVENT)
+
+
+def test_lazy_decoding_defers_errors_to_access():
+    event = Event.from_dict(dict(EVENT, created_at='not a date'), lazy=True)
+    assert event.title == EVENT['title']
+    with pytest.raises(ValueError):
+        event.created_at
+
+
+def test_constructor_and_assignment_accept_datetimes():
+    start = datetime(2024, 5, 1, 9, 30)
+    event = Event(id='1', title='Talk', start_time=start)
+    assert event.start_time is start
+    event.end_time = '2024-05-01T10:30:00'
+    assert event.end_time == datetime(2024, 5, 1, 10, 30)
+    assert 'Talk' in repr(event)
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from benchmarks.stub_server import API_KEY, StubServer
+from mustapi.async_client import AsyncMustAPIClient
+from mustapi.client import MustAPIClient
+from mustapi.exceptions import MustAPIError
+from mustapi.models.event import Event
+from mustapi.services.bulk import BulkItem, BulkResult
+from mustapi.services.events import BaseEventService
+
+
+@pytest.fixture
+def service():
+    return BaseEventService(client=None)
+
+
+def test_merge_chunk_queues_ids_the_listing_left_out(service):
+    results, singles = dict.fromkeys(['1', '2', '3']), []
+    service._merge_chunk(results, singles, ['1', '2', '3'], {'2': Event.from_dict({'id': '2'})})
+    assert results['2'].id == '2'
+    assert singles == ['1', '3']
+    service._merge_chunk(results, singles, ['4'], None)
+    assert singles == ['1', '3', '4']
+
+
+def test_match_id_filter_remembers_whether_it_works(service):
+    assert service._match_id_filter(['1'], []) == {}
+    assert service._id_filter is None
+    assert service._match_id_filter(['1'], [Event.from_dict({'id': '9'})]) is None
+    assert service._id_filter is False
+
+
+def test_probe_result(service):
+    chunk = [(0, {'title': 'a'}), (1, {'title': 'b'})]
+    result = BulkResult()
+    assert not service._probe_result(chunk, result, None, MustAPIError('gone', 404))
+    assert service._batch_create is False and len(result) == 0
+    service._batch_create = None
+    assert service._probe_result(chunk, result, None, MustAPIError('busy', 503))
+    assert service._batch_create is None
+    assert [item.error.status_code for item in result] == [503, 503]
+
+
+def test_next_delete_offset_skips_only_events_still_listed(service):
+    page = [Event.from_dict({'id': str(i)}) for i in range(4)]
+    result = BulkResult()
+    result.add(BulkItem('0', '0', {}))
+    new_ids = service._unhandled_ids(page, result)
+    assert new_ids == ['1', '2', '3']
+    result.add(BulkItem('1', '1', {}))
+    result.add(BulkItem('2', '2', error=MustAPIError('boom', 500)))
+    result.add(BulkItem('3', '3', {}))
+    # '0' (handled on an earlier page) and '2' (failed) are still listed
+    assert service._next_delete_offset(10, page, new_ids, result) == 12
+
+
+def test_delete_ids_requires_exactly_one_selector(service):
+    with pytest.raises(ValueError):
+        service._delete_ids(None, None)
+    assert list(service._delete_ids(['1', 1, '2'], None)) == ['1', '2']
+
+
+@pytest.mark.parametrize('batch_create', [True, False])
+def test_sync_and_async_services_agree(batch_create):
+    payloads = [{'title': f'Event {i}'} for i in range(5)]
+
+    async def run_async(url):
+        async with AsyncMustAPIClient(API_KEY, base_url=url) as client:
+            created = await client.events.create_events(payloads, chunk_size=2)
+            deleted = await client.events.delete_events(filters={'q': 'all'}, page_size=3)
+            return created, deleted
+
+    outcomes = []
+    for run in ('sync', 'async'):
+        with StubServer(total_events=7, batch_create=batch_create) as server:
+            if run == 'sync':
+                client = MustAPIClient(API_KEY, base_url=server.url)
+                created = client.events.create_events(payloads, chunk_size=2)
+                deleted = client.events.delete_events(filters={'q': 'all'}, page_size=3)
+            else:
+                created, deleted = asyncio.run(run_async(server.url))
+        outcomes.append(([item.key for item in created if item.ok], sorted(deleted.results)))
+    assert outcomes[0] == outcomes[1]
+    assert outcomes[0] == ([0, 1, 2, 3, 4], [str(i) for i in range(7)])
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from benchmarks.stub_server import EVENT
+from mustapi.models.batch import EventBatch
+from mustapi.models.event import Event
+
+ROWS = [dict(EVENT, id=str(index), start_time=f'2024-01-{index % 28 + 1:02d}T10:00:00') for index in range(50)]
+
+
+@pytest.mark.parametrize('data', [
+    ROWS,
+    iter(ROWS),
+    {'events': ROWS, 'count': 50},
+    json.dumps({'events': ROWS}),
+    json.dumps(ROWS).encode('utf-8'),
+], ids=['list', 'iterator', 'response', 'str', 'bytes'])
+def test_matches_from_dict(data):
+    assert Event.from_dicts(data) == [Event.from_dict(row) for row in ROWS]
+
+
+def test_repeated_timestamps_share_one_datetime():
+    events = Event.from_dicts(ROWS)
+    # created_at repeats on every row, start_time does not
+    assert all(event.created_at is events[0].created_at for event in events)
+    assert events[0].start_time is not events[28].start_time
+    assert events[0].start_time == events[28].start_time
+
+
+def test_lazy_keeps_raw_strings():
+    events = Event.from_dicts(ROWS, lazy=True)
+    assert events[0]._created_at == EVENT['created_at']
+    assert events == [Event.from_dict(row) for row in ROWS]
+
+
+def test_missing_fields_default_like_from_dict():
+    rows = [{'id': '1'}, {'title': 'x', 'end_time': ''}]
+    assert Event.from_dicts(rows) == [Event.from_dict(row) for row in rows]
+
+
+def test_as_batch():
+    batch = Event.from_dicts({'events': ROWS}, as_batch=True)
+    assert isinstance(batch, EventBatch)
+    assert batch.to_events() == Event.from_dicts(ROWS)
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from benchmarks.stub_server import API_KEY, StubServer
+from mustapi.async_client import AsyncMustAPIClient
+from mustapi.client import MustAPIClient
+from mustapi.exceptions import ResourceNotFoundError
+from mustapi.services.event_cache import EventCache
+
+
+@pytest.fixture(scope='module')
+def server():
+    # The stub's id__in listing only returns numeric ids below total_events,
+    # while single GETs answer any id not starting with 'missing'
+    with StubServer(total_events=20) as server:
+        yield server
+
+
+def test_ids_left_out_of_the_listing_are_confirmed_individually(server):
+    client = MustAPIClient(API_KEY, base_url=server.url)
+    found = client.events.get_events(['1', 'abc', 'missing-1', '1'], use_id_filter=True)
+    assert list(found) == ['1', 'abc', 'missing-1']
+    assert found['1'].id == '1'
+    assert found['abc'].id == 'abc'
+    assert isinstance(found['missing-1'], ResourceNotFoundError)
+
+
+def test_id_filter_is_probed_and_remembered(server):
+    client = MustAPIClient(API_KEY, base_url=server.url)
+    found = client.events.get_events([str(i) for i in range(15)], chunk_size=5)
+    assert [event.id for event in found.values()] == [str(i) for i in range(15)]
+    assert client.events._id_filter is True
+
+
+def test_filter_ignored_falls_back_to_single_gets():
+    with StubServer(total_events=20, id_filter=False) as server:
+        client = MustAPIClient(API_KEY, base_url=server.url)
+        found = client.events.get_events(['3', '4', 'missing-2'])
+    assert found['3'].id == '3' and found['4'].id == '4'
+    assert isinstance(found['missing-2'], ResourceNotFoundError)
+    assert client.events._id_filter is False
+
+
+def test_cached_events_are_not_fetched(server):
+    cache = EventCache()
+    client = MustAPIClient(API_KEY, base_url=server.url, event_cache=cache)
+    first = client.events.get_event('5')
+    assert client.events.get_events(['5'])['5'] is first
+
+
+def test_async_ids_left_out_of_the_listing_are_confirmed_individually(server):
+    async def main():
+        async with AsyncMustAPIClient(API_KEY, base_url=server.url) as client:
+            return await client.events.get_events(['2', 'xyz', 'missing-3'], use_id_filter=True)
+
+    found = asyncio.run(main())
+    assert found['2'].id == '2' and found['xyz'].id == 'xyz'
+    assert isinstance(found['missing-3'], ResourceNotFoundError)
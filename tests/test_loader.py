@@ -0,0 +1,103 @@
+import asyncio
+import threading
+
+import pytest
+
+from benchmarks.stub_server import API_KEY, StubServer
+from mustapi.async_client import AsyncMustAPIClient
+from mustapi.exceptions import ResourceNotFoundError
+from mustapi.models.event import Event
+from mustapi.services.loader import AsyncEventLoader, EventLoader
+
+
+class FakeEvents:
+    """Stands in for an event service, recording each get_events batch."""
+    def __init__(self):
+        self.batches = []
+
+    def results(self, event_ids):
+        self.batches.append(list(event_ids))
+        return {
+            event_id: ResourceNotFoundError(f'Event {event_id} not found', 404)
+            if event_id.startswith('missing') else Event.from_dict({'id': event_id})
+            for event_id in event_ids
+        }
+
+    def get_events(self, event_ids):
+        return self.results(event_ids)
+
+
+class AsyncFakeEvents(FakeEvents):
+    async def get_events(self, event_ids):
+        return self.results(event_ids)
+
+
+def test_concurrent_loads_share_a_batch():
+    events = FakeEvents()
+    loader = EventLoader(events, window=0.2)
+    results = {}
+    barrier = threading.Barrier(5)
+
+    def load(event_id):
+        barrier.wait()
+        try:
+            results[event_id] = loader.load(event_id).id
+        except ResourceNotFoundError as error:
+            results[event_id] = error.status_code
+
+    threads = [threading.Thread(target=load, args=(event_id,)) for event_id in ['1', '2', '3', '2', 'missing']]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {'1': '1', '2': '2', '3': '3', 'missing': 404}
+    assert len(events.batches) == 1
+    assert sorted(events.batches[0]) == ['1', '2', '3', 'missing']
+    assert loader.stats == {'loads': 5, 'batches': 1, 'batch_size_histogram': {4: 1}}
+
+
+def test_full_batch_is_dispatched_without_waiting():
+    events = FakeEvents()
+    loader = EventLoader(events, window=10, max_batch_size=1)
+    assert loader.load('1').id == '1'
+    assert events.batches == [['1']]
+
+
+def test_async_loads_in_one_loop_iteration_share_a_batch():
+    events = AsyncFakeEvents()
+
+    async def main():
+        loader = AsyncEventLoader(events)
+        found = await asyncio.gather(*(loader.load(event_id) for event_id in ['1', '2', '1']))
+        with pytest.raises(ResourceNotFoundError):
+            await loader.load('missing')
+        return [event.id for event in found]
+
+    assert asyncio.run(main()) == ['1', '2', '1']
+    assert events.batches == [['1', '2'], ['missing']]
+
+
+def test_async_max_batch_size_splits_batches():
+    events = AsyncFakeEvents()
+
+    async def main():
+        loader = AsyncEventLoader(events, max_batch_size=2)
+        await asyncio.gather(*(loader.load(str(i)) for i in range(5)))
+
+    asyncio.run(main())
+    assert [len(batch) for batch in events.batches] == [2, 2, 1]
+
+
+def test_enable_batching_routes_get_event_through_the_loader():
+    async def main():
+        with StubServer(total_events=10) as server:
+            async with AsyncMustAPIClient(API_KEY, base_url=server.url) as client:
+                loader = client.events.enable_batching()
+                found = await asyncio.gather(*(client.events.get_event(str(i)) for i in range(6)))
+                client.events.disable_batching()
+                await client.events.get_event('7')
+        return [event.id for event in found], loader.stats
+
+    ids, stats = asyncio.run(main())
+    assert ids == [str(i) for i in range(6)]
+    assert stats['loads'] == 6 and stats['batches'] == 1
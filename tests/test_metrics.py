@@ -0,0 +1,81 @@
+import threading
+
+import pytest
+
+from benchmarks.stub_server import API_KEY, StubServer
+from mustapi.client import MustAPIClient
+from mustapi.metrics import ClientMetrics, _bucket_index, _bucket_upper
+
+
+@pytest.mark.parametrize('seconds', [0.000003, 0.0005, 0.0123, 0.25, 1.7, 42.0])
+def test_buckets_bound_values_within_an_eighth(seconds):
+    upper = _bucket_upper(_bucket_index(seconds))
+    assert seconds < upper <= seconds * 1.125 + 1e-6
+
+
+def test_series_are_keyed_by_endpoint_template():
+    metrics = ClientMetrics()
+    metrics.record('GET', 'events/1', 200, 0.010, bytes_in=100)
+    metrics.record('GET', 'events/2', 404, 0.020, bytes_in=20)
+    metrics.record('GET', 'events/2', None, 0.5, retry=True)
+    [(key, entry)] = metrics.snapshot().items()
+    assert key == 'GET events/{id}'
+    assert entry['requests'] == {'2xx': 1, '4xx': 1, 'error': 1}
+    assert entry['bytes_in'] == 120
+    assert entry['retries'] == 1
+    assert entry['latency']['count'] == 3
+    assert entry['latency']['max'] == 0.5
+    assert 0.02 <= entry['latency']['p50'] <= 0.0225
+
+
+def test_shards_of_many_threads_are_merged():
+    metrics = ClientMetrics()
+
+    def work():
+        for _ in range(100):
+            metrics.record('GET', 'events', 200, 0.001)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert metrics.snapshot()['GET events']['requests'] == {'2xx': 800}
+    # Exited threads are folded into one retired total
+    assert metrics._shards == []
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_prometheus_export():
+    metrics = ClientMetrics(namespace='app')
+    metrics.record('GET', 'events/1', 200, 0.003, bytes_in=10, bytes_out=0)
+    metrics.record('GET', 'events/1', 200, 2.0)
+    text = metrics.render_prometheus()
+    assert '# TYPE app_requests_total counter' in text
+    assert 'app_requests_total{method="GET",endpoint="events/{id}",status="2xx"} 2' in text
+    assert 'app_request_duration_seconds_bucket{method="GET",endpoint="events/{id}",le="0.0025"} 0' in text
+    assert 'app_request_duration_seconds_bucket{method="GET",endpoint="events/{id}",le="0.005"} 1' in text
+    assert 'app_request_duration_seconds_bucket{method="GET",endpoint="events/{id}",le="+Inf"} 2' in text
+    assert 'app_response_bytes_total{method="GET",endpoint="events/{id}"} 10' in text
+    assert text.endswith('\n')
+
+
+def test_client_records_every_attempt():
+    with StubServer() as server:
+        client = MustAPIClient(API_KEY, base_url=server.url)
+        client.events.list_events(limit=3)
+        client.events.get_event('1')
+        client.events.get_event('2')
+    snapshot = client.metrics.snapshot()
+    assert snapshot['GET events']['requests'] == {'2xx': 1}
+    assert snapshot['GET events/{id}']['requests'] == {'2xx': 2}
+    assert snapshot['GET events/{id}']['bytes_in'] > 0
+    assert set(snapshot['GET events/{id}']['phases']) >= {'decode'}
+
+
+def test_metrics_can_be_disabled():
+    with StubServer() as server:
+        client = MustAPIClient(API_KEY, base_url=server.url, collect_metrics=False)
+        client.events.get_event('1')
+    assert client.metrics is None
@@ -0,0 +1,116 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from mustapi import middleware as middleware_module
+from mustapi.middleware import CachingMiddleware, Middleware, MiddlewareChain, RequestContext
+
+
+class Recorder(Middleware):
+    def __init__(self, name, log, answer=None):
+        self.name = name
+        self.log = log
+        self.answer = answer
+
+    def before_send(self, request):
+        self.log.append(f'{self.name}.before')
+        return self.answer
+
+    def after_receive(self, request, response):
+        self.log.append(f'{self.name}.after')
+        return response
+
+
+class Server:
+    """Stands in for the client's send function, counting calls."""
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, request):
+        self.calls.append((request.method, request.endpoint, request.params))
+        return {'call': len(self.calls)}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(middleware_module, 'time', SimpleNamespace(
+        monotonic=lambda: now.value, perf_counter=time.perf_counter
+    ))
+
+    def advance(seconds):
+        now.value += seconds
+
+    return advance
+
+
+def test_hooks_run_in_registration_order():
+    log = []
+    chain = MiddlewareChain([Recorder('outer', log), Recorder('inner', log)])
+    chain.run(RequestContext('GET', 'events'), Server())
+    assert log == ['outer.before', 'inner.before', 'inner.after', 'outer.after']
+
+
+def test_short_circuit_skips_inner_middleware_and_own_after_receive():
+    log = []
+    server = Server()
+    chain = MiddlewareChain([Recorder('outer', log), Recorder('cache', log, answer='hit'), Recorder('inner', log)])
+    assert chain.run(RequestContext('GET', 'events'), server) == 'hit'
+    assert log == ['outer.before', 'cache.before', 'outer.after']
+    assert server.calls == []
+
+
+def test_on_error_can_recover():
+    class Fallback(Middleware):
+        def on_error(self, request, error):
+            return {'fallback': str(error)}
+
+    def fail(request):
+        raise RuntimeError('down')
+
+    chain = MiddlewareChain([Fallback()])
+    assert chain.run(RequestContext('GET', 'events'), fail) == {'fallback': 'down'}
+
+
+def test_async_chain_accepts_coroutine_hooks():
+    class AsyncHeader(Middleware):
+        async def before_send(self, request):
+            request.headers['X-Trace'] = 'abc'
+
+    async def send(request):
+        return dict(request.headers)
+
+    chain = MiddlewareChain([AsyncHeader()])
+    assert asyncio.run(chain.run_async(RequestContext('GET', 'events'), send)) == {'X-Trace': 'abc'}
+
+
+def test_cache_serves_gets_within_ttl(clock):
+    server = Server()
+    chain = MiddlewareChain([CachingMiddleware(ttl=1)])
+    first = chain.run(RequestContext('GET', 'events', {'limit': 10}), server)
+    clock(0.5)
+    assert chain.run(RequestContext('GET', 'events', {'limit': 10}), server) is first
+    assert len(server.calls) == 1
+
+
+def test_cache_entry_expires_under_repeated_reads(clock):
+    server = Server()
+    cache = CachingMiddleware(ttl=0.2)
+    chain = MiddlewareChain([cache])
+    for _ in range(6):
+        chain.run(RequestContext('GET', 'events/1'), server)
+        clock(0.1)
+    # Hits must not extend the entry's lifetime: a fresh request every 0.2s
+    assert len(server.calls) == 3
+    assert cache.stats['hits'] == 3
+
+
+def test_write_evicts_the_resource(clock):
+    server = Server()
+    chain = MiddlewareChain([CachingMiddleware(ttl=60)])
+    chain.run(RequestContext('GET', 'events', {'offset': 0}), server)
+    chain.run(RequestContext('PUT', 'events/1', data={'title': 'x'}), server)
+    chain.run(RequestContext('GET', 'events', {'offset': 0}), server)
+    assert [method for method, _, _ in server.calls] == ['GET', 'PUT', 'GET']
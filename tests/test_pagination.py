@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from benchmarks.stub_server import API_KEY, StubServer
+from mustapi.async_client import AsyncMustAPIClient
+from mustapi.client import MustAPIClient
+from mustapi.models.batch import EventBatch
+
+
+@pytest.fixture(scope='module')
+def server():
+    with StubServer(total_events=25) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with MustAPIClient(API_KEY, base_url=server.url) as client:
+        yield client
+
+
+@pytest.mark.parametrize('prefetch', [True, False])
+def test_iter_events_walks_every_page(client, prefetch):
+    events = list(client.events.iter_events(page_size=10, prefetch=prefetch))
+    assert [event.id for event in events] == [str(i) for i in range(25)]
+
+
+def test_iter_events_stops_after_a_short_page(client):
+    requests = []
+    fetch = client.events.list_events
+    client.events.list_events = lambda *args: requests.append(args[:2]) or fetch(*args)
+    assert len(list(client.events.iter_events(page_size=5, prefetch=False))) == 25
+    # The sixth, empty page is what reveals the end of an exact multiple
+    assert requests == [(5, offset) for offset in range(0, 30, 5)]
+
+
+def test_iter_events_can_be_abandoned(client):
+    iterator = client.events.iter_events(page_size=10)
+    assert next(iterator).id == '0'
+    iterator.close()
+
+
+def test_iter_events_as_batch_yields_pages(client):
+    pages = list(client.events.iter_events(page_size=10, as_batch=True))
+    assert all(isinstance(page, EventBatch) for page in pages)
+    assert [len(page) for page in pages] == [10, 10, 5]
+
+
+def test_async_iter_events(server):
+    async def main():
+        async with AsyncMustAPIClient(API_KEY, base_url=server.url) as client:
+            return [event.id async for event in client.events.iter_events(page_size=10)]
+
+    assert asyncio.run(main()) == [str(i) for i in range(25)]
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_iter_events_parallel_yields_every_event_once(client, ordered):
+    events = list(client.events.iter_events_parallel(page_size=4, max_workers=3, ordered=ordered))
+    ids = [event.id for event in events]
+    assert sorted(ids, key=int) == [str(i) for i in range(25)]
+    if ordered:
+        assert ids == [str(i) for i in range(25)]
+
+
+def test_iter_events_parallel_requests_only_known_offsets(client):
+    offsets = []
+    fetch = client.events.list_events
+    client.events.list_events = lambda *args: offsets.append(args[1]) or fetch(*args)
+    list(client.events.iter_events_parallel(page_size=10, max_workers=4))
+    # The first page (fetched separately) reports 25 events: no trailing empty page
+    assert sorted(offsets) == [10, 20]
+
+
+def test_iter_events_parallel_skips_duplicates_from_shifting_pages(client, monkeypatch):
+    fetch = client.events.list_events
+
+    def shifted(limit, offset, filters=None, *args):
+        # Simulate an insert at the front: every later page starts one event early
+        return fetch(limit, max(0, offset - 1), filters, *args)
+
+    monkeypatch.setattr(client.events, 'list_events', shifted)
+    ids = [event.id for event in client.events.iter_events_parallel(page_size=10)]
+    assert len(ids) == len(set(ids))
+
+
+def test_async_iter_events_parallel(server):
+    async def main():
+        async with AsyncMustAPIClient(API_KEY, base_url=server.url) as client:
+            return [event.id async for event in client.events.iter_events_parallel(page_size=4, max_workers=3)]
+
+    assert asyncio.run(main()) == [str(i) for i in range(25)]
@@ -0,0 +1,101 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from mustapi import rate_limit
+from mustapi.rate_limit import RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the limiter's monotonic clock with one advanced by hand."""
+    now = SimpleNamespace(value=1000.0)
+    fake_time = SimpleNamespace(
+        monotonic=lambda: now.value, time=time.time, sleep=time.sleep
+    )
+    monkeypatch.setattr(rate_limit, 'time', fake_time)
+
+    def advance(seconds: float) -> None:
+        now.value += seconds
+
+    return advance
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+
+def test_no_rate_never_waits(clock):
+    limiter = RateLimiter()
+    assert [limiter.reserve() for _ in range(100)] == [0.0] * 100
+
+
+def test_burst_then_paced(clock):
+    limiter = RateLimiter(rate=10, burst=2)
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(0.1)
+    assert limiter.reserve() == pytest.approx(0.2)
+
+
+def test_refill_over_time(clock):
+    limiter = RateLimiter(rate=10, burst=2)
+    limiter.reserve()
+    limiter.reserve()
+    clock(0.1)
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(0.1)
+
+
+def test_refill_is_capped_at_burst(clock):
+    limiter = RateLimiter(rate=10, burst=2)
+    clock(60)
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(0.1)
+
+
+def test_exhausted_quota_blocks_until_reset(clock):
+    limiter = RateLimiter(rate=10, burst=5)
+    limiter.update_from_headers({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '3'})
+    assert limiter.reserve() == pytest.approx(3.0)
+
+
+def test_headers_set_rate_and_clip_burst(clock):
+    limiter = RateLimiter(rate=100, burst=50)
+    limiter.update_from_headers({'RateLimit-Remaining': '4', 'RateLimit-Reset': '2'})
+    assert limiter.rate == pytest.approx(2.0)
+    assert limiter.burst == 4
+    assert [limiter.reserve() for _ in range(4)] == [0.0] * 4
+    assert limiter.reserve() == pytest.approx(0.5)
+
+
+def test_stats_count_waits(clock):
+    limiter = RateLimiter(rate=10, burst=1)
+    limiter.reserve()
+    limiter.reserve()
+    stats = limiter.stats
+    assert stats['acquired'] == 2
+    assert stats['waited'] == 1
+    assert stats['max_wait'] == pytest.approx(0.1)
+
+
+def test_default_limiter_bursts_at_the_advertised_rate(clock):
+    limiter = RateLimiter()
+    limiter.update_from_headers({'X-RateLimit-Remaining': '100', 'X-RateLimit-Reset': '10'})
+    assert limiter.rate == pytest.approx(10.0)
+    assert limiter.burst == 10
+    clock(1)
+    assert [limiter.reserve() for _ in range(10)] == [0.0] * 10
+    assert limiter.reserve() == pytest.approx(0.1)
+    # A tighter quota shrinks the bucket again
+    limiter.update_from_headers({'X-RateLimit-Remaining': '20', 'X-RateLimit-Reset': '10'})
+    assert limiter.burst == 2
+
+
+def test_explicit_burst_is_kept_as_the_cap(clock):
+    limiter = RateLimiter(burst=3)
+    limiter.update_from_headers({'X-RateLimit-Remaining': '100', 'X-RateLimit-Reset': '10'})
+    assert limiter.burst == 3
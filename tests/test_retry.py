@@ -0,0 +1,121 @@
+import asyncio
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from benchmarks.stub_server import API_KEY, StubServer
+from mustapi import retry as retry_module
+from mustapi.client import MustAPIClient
+from mustapi.exceptions import CircuitOpenError, MustAPIError, RateLimitError
+from mustapi.retry import RetryPolicy
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record sleeps instead of waiting."""
+    slept = []
+    monkeypatch.setattr(retry_module.time, 'sleep', slept.append)
+    return slept
+
+
+def failing(*errors):
+    """A send function raising ``errors`` in turn, then returning 'ok'."""
+    remaining = list(errors)
+    calls = []
+
+    def send():
+        calls.append(1)
+        if remaining:
+            raise remaining.pop(0)
+        return 'ok'
+
+    send.calls = calls
+    return send
+
+
+def test_parse_retry_after():
+    assert RetryPolicy.parse_retry_after('3') == 3.0
+    assert RetryPolicy.parse_retry_after(None) is None
+    assert RetryPolicy.parse_retry_after('soon') is None
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 < RetryPolicy.parse_retry_after(later) <= 30
+
+
+def test_retries_transient_statuses_then_succeeds(sleeps):
+    send = failing(MustAPIError('busy', 503), MustAPIError('bad gateway', 502))
+    assert RetryPolicy(backoff_base=0.5).call('GET', send) == 'ok'
+    assert len(send.calls) == 3
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1.0
+
+
+def test_gives_up_after_max_attempts_with_history(sleeps):
+    send = failing(*(MustAPIError('busy', 503) for _ in range(5)))
+    with pytest.raises(MustAPIError) as caught:
+        RetryPolicy(max_attempts=3).call('GET', send)
+    assert len(send.calls) == 3
+    assert [attempt.status_code for attempt in caught.value.attempts] == [503, 503, 503]
+
+
+@pytest.mark.parametrize('method, error', [
+    ('POST', MustAPIError('busy', 503)),
+    ('GET', MustAPIError('bad request', 400)),
+    ('GET', CircuitOpenError('open', 'events', 5)),
+])
+def test_does_not_retry(sleeps, method, error):
+    send = failing(error)
+    with pytest.raises(MustAPIError):
+        RetryPolicy().call(method, send)
+    assert len(send.calls) == 1
+    assert sleeps == []
+
+
+def test_retry_after_replaces_backoff(sleeps):
+    send = failing(RateLimitError('slow down', retry_after=2.0))
+    RetryPolicy().call('GET', send)
+    assert sleeps == [2.0]
+
+
+def test_retry_after_beyond_limit_raises_rate_limit_error(sleeps):
+    send = failing(RateLimitError('slow down', retry_after=600))
+    with pytest.raises(RateLimitError) as caught:
+        RetryPolicy(max_retry_after=60).call('GET', send)
+    assert caught.value.retry_after == 600
+    assert sleeps == []
+
+
+def test_async_call_retries(monkeypatch):
+    slept = []
+
+    async def sleep(delay):
+        slept.append(delay)
+
+    monkeypatch.setattr(retry_module.asyncio, 'sleep', sleep)
+
+    async def send():
+        if not slept:
+            raise MustAPIError('busy', 503)
+        return 'ok'
+
+    assert asyncio.run(RetryPolicy().call_async('GET', send)) == 'ok'
+    assert len(slept) == 1
+
+
+def test_429_raises_rate_limit_error_with_retry_after():
+    with StubServer() as server:
+        client = MustAPIClient(API_KEY, base_url=server.url)
+    with pytest.raises(RateLimitError) as caught:
+        client._raise_for_status(429, 'events', headers={'Retry-After': '7'})
+    assert caught.value.retry_after == 7.0
+
+
+def test_client_retries_503_responses():
+    attempts = []
+    policy = RetryPolicy(max_attempts=2, on_attempt=attempts.append)
+    with StubServer(error_rate=1.0) as server:
+        client = MustAPIClient(API_KEY, base_url=server.url, retry_policy=policy)
+        with pytest.raises(MustAPIError) as caught:
+            client.events.get_event('1')
+    assert caught.value.status_code == 503
+    assert [attempt.status_code for attempt in attempts] == [503, 503]
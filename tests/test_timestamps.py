@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from mustapi.models.timestamps import TimestampCache, _parse_slow, parse_timestamp
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2024-01-15T10:00:00', datetime(2024, 1, 15, 10)),
+    ('2024-01-15T10:00:00Z', datetime(2024, 1, 15, 10, tzinfo=timezone.utc)),
+    ('2024-01-15T10:00:00+03:00', datetime(2024, 1, 15, 10, tzinfo=timezone(timedelta(hours=3)))),
+    ('2024-01-15T10:00:00.5-01:30', datetime(2024, 1, 15, 10, 0, 0, 500000, timezone(-timedelta(hours=1, minutes=30)))),
+    ('2024-01-15', datetime(2024, 1, 15)),
+])
+def test_parse_timestamp(value, expected):
+    assert parse_timestamp(value) == expected
+    assert parse_timestamp(value).tzinfo == expected.tzinfo
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2024-01-15T10:00:00Z', datetime(2024, 1, 15, 10, tzinfo=timezone.utc)),
+    ('20240115T100000', datetime(2024, 1, 15, 10)),
+    ('2024-01-15T10:00:00.1234567+0000', datetime(2024, 1, 15, 10, 0, 0, 123456, timezone.utc)),
+    ('2024-01-15 10:00', datetime(2024, 1, 15, 10)),
+])
+def test_fallback_parser(value, expected):
+    # Used where fromisoformat rejects a form, e.g. 'Z' before Python 3.11
+    assert _parse_slow(value) == expected
+
+
+@pytest.mark.parametrize('value', ['', 'yesterday', '2024-13'])
+def test_invalid_timestamps_raise_value_error(value):
+    with pytest.raises(ValueError):
+        parse_timestamp(value)
+
+
+def test_cache_returns_the_same_datetime_for_repeats():
+    cache = TimestampCache(max_size=2)
+    first = cache.parse('2024-01-15T10:00:00Z')
+    assert cache('2024-01-15T10:00:00Z') is first
+    cache.parse('2024-01-16T10:00:00Z')
+    cache.parse('2024-01-17T10:00:00Z')
+    # Full: emptied before storing the new value
+    assert len(cache) == 1
+    assert cache.parse('2024-01-15T10:00:00Z') is not first
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from benchmarks.stub_server import API_KEY, StubServer
+from mustapi.async_client import AsyncMustAPIClient
+from mustapi.client import MustAPIClient
+from mustapi.timing import PHASES, RequestTiming, build_timed
+
+
+@pytest.fixture(scope='module')
+def server():
+    with StubServer() as server:
+        yield server
+
+
+def test_phases_of_a_new_then_reused_connection(server):
+    # A session of its own, so key validation does not warm the pool
+    with MustAPIClient(API_KEY, base_url=server.url, trace_timing=True, pool_maxsize=1) as client:
+        client._session.close()
+        first = client.get('events/1').timing
+        second = client.get('events/2').timing
+    assert first.connection_reused is False
+    assert first.connect is not None and first.dns is not None
+    assert second.connection_reused is True
+    assert second.connect is None and second.dns is None
+    for timing in (first, second):
+        assert timing.ttfb is not None and timing.download is not None and timing.decode is not None
+        assert timing.total >= timing.ttfb
+
+
+def test_phases_reach_the_metrics(server):
+    with MustAPIClient(API_KEY, base_url=server.url, trace_timing=True) as client:
+        client.events.get_event('1')
+        client.events.get_event('2')
+    entry = client.metrics.snapshot()['GET events/{id}']
+    assert {'ttfb', 'download', 'decode', 'model'} <= set(entry['phases'])
+    assert entry['phases']['model']['count'] == 2
+    assert sum(entry['connections'].values()) == 2
+
+
+def test_untraced_responses_carry_no_timing(server):
+    with MustAPIClient(API_KEY, base_url=server.url) as client:
+        assert getattr(client.get('events/1'), 'timing', None) is None
+
+
+def test_build_timed_charges_the_model_phase():
+    reported = []
+    timing = RequestTiming(sink=lambda phase, seconds: reported.append(phase))
+    response = type('Response', (dict,), {})()
+    response.timing = timing
+    assert build_timed(response, lambda: 'built') == 'built'
+    assert timing.model is not None
+    assert reported == ['model']
+    assert set(timing.as_dict()) == set(PHASES) | {'connection_reused', 'total'}
+
+
+def test_async_phases(server):
+    async def main():
+        async with AsyncMustAPIClient(API_KEY, base_url=server.url, trace_timing=True) as client:
+            return (await client.get('events/1')).timing
+
+    timing = asyncio.run(main())
+    assert timing.ttfb is not None and timing.decode is not None
+    assert timing.connection_reused is not None
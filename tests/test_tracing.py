@@ -0,0 +1,94 @@
+import asyncio
+import logging
+
+import pytest
+
+from benchmarks.stub_server import API_KEY, StubServer
+from mustapi.async_client import AsyncMustAPIClient
+from mustapi.client import MustAPIClient
+from mustapi.exceptions import ResourceNotFoundError
+from mustapi.tracing import NON_RECORDING, Tracer
+
+
+@pytest.fixture(scope='module')
+def server():
+    with StubServer() as server:
+        yield server
+
+
+def attempt(trace):
+    [span] = [child for child in trace.children if child.name == 'http.attempt']
+    return span
+
+
+def test_spans_of_a_successful_request(server):
+    tracer = Tracer()
+    client = MustAPIClient(API_KEY, base_url=server.url, tracer=tracer)
+    client.events.get_event('1')
+    [trace] = tracer.traces
+    assert trace.name == 'GET events/{id}'
+    assert trace.status == 'UNSET'
+    span = attempt(trace)
+    assert span.attributes['http.response.status_code'] == 200
+    assert span.events == []
+
+
+def test_error_response_marks_both_spans(server):
+    tracer = Tracer()
+    client = MustAPIClient(API_KEY, base_url=server.url, tracer=tracer)
+    with pytest.raises(ResourceNotFoundError):
+        client.events.get_event('missing-1')
+    [trace] = tracer.traces
+    assert trace.status == 'ERROR'
+    span = attempt(trace)
+    assert span.status == 'ERROR'
+    assert span.events[0][2]['exception.type'] == 'ResourceNotFoundError'
+
+
+def test_outer_exception_is_not_recorded_on_the_attempt(server):
+    tracer = Tracer()
+    client = MustAPIClient(API_KEY, base_url=server.url, tracer=tracer)
+    try:
+        raise ValueError('unrelated')
+    except ValueError:
+        client.events.get_event('1')
+    span = attempt(tracer.traces[0])
+    assert span.events == []
+    assert span.status == 'UNSET'
+
+
+def test_async_error_response_marks_the_attempt(server):
+    async def main():
+        tracer = Tracer()
+        async with AsyncMustAPIClient(API_KEY, base_url=server.url, tracer=tracer) as client:
+            with pytest.raises(ResourceNotFoundError):
+                await client.events.get_event('missing-1')
+            try:
+                raise ValueError('unrelated')
+            except ValueError:
+                await client.events.get_event('1')
+        failed, succeeded = tracer.traces
+        assert attempt(failed).status == 'ERROR'
+        assert attempt(failed).events[0][2]['exception.type'] == 'ResourceNotFoundError'
+        assert attempt(succeeded).events == []
+
+    asyncio.run(main())
+
+
+def test_sampling_records_every_nth_trace():
+    tracer = Tracer(sample_every=3)
+    spans = [tracer.start_span('op') for _ in range(6)]
+    for span in spans:
+        span.end()
+    assert [span is NON_RECORDING for span in spans] == [False, True, True, False, True, True]
+    assert len(tracer.traces) == 2
+
+
+def test_slow_requests_are_logged(server, caplog):
+    client = MustAPIClient(API_KEY, base_url=server.url, slow_request_threshold=0)
+    with caplog.at_level(logging.WARNING, logger='mustapi'):
+        client.events.list_events(limit=5, offset=0)
+    [record] = [record for record in caplog.records if record.message.startswith('Slow request')]
+    assert record.mustapi['endpoint'] == 'events'
+    assert record.mustapi['params'] == ['limit', 'offset']
+    assert record.mustapi['status_code'] == 200